@@ -0,0 +1,85 @@
+"""
+Compares the cost of building models whose timestamps are parsed with parse_datetime against dateutil's parser.
+
+    python -m benchmarks.bench_datetimes
+"""
+
+import timeit
+from contextlib import contextmanager
+
+from dateutil.parser import parse
+
+import roblox.bases.basegroup
+import roblox.wall
+from roblox import Client
+from roblox.bases.basegroup import JoinRequest
+from roblox.utilities.datetimes import parse_datetime
+from roblox.wall import WallPost
+
+_repeat = 20000
+
+_client = Client()
+_group = _client.get_base_group(1)
+
+_timestamps = [
+    "2021-08-12T17:39:43.1234567Z",
+    "2021-08-12T17:39:43.123Z",
+    "2021-08-12T17:39:43Z",
+    "2021-08-12T17:39:43.12-05:00"
+]
+
+_join_request_data = {
+    "requester": {"userId": 1, "username": "a", "displayName": "a", "hasVerifiedBadge": False},
+    "created": "2021-08-12T17:39:43.1234567Z"
+}
+
+_wall_post_data = {
+    "id": 1,
+    "poster": {
+        "user": {"userId": 1, "username": "a", "displayName": "a", "hasVerifiedBadge": False},
+        "role": {"id": 1, "name": "Member", "rank": 1}
+    },
+    "body": "Hello",
+    "created": "2021-08-12T17:39:43.1234567Z",
+    "updated": "2021-08-12T17:39:43.123Z"
+}
+
+
+@contextmanager
+def _use_parser(parser):
+    # models import parse_datetime into their own modules, so that's where it is swapped out
+    modules = (roblox.bases.basegroup, roblox.wall)
+    for module in modules:
+        module.parse_datetime = parser
+    try:
+        yield
+    finally:
+        for module in modules:
+            module.parse_datetime = parse_datetime
+
+
+def _time(function) -> float:
+    return timeit.timeit(function, number=_repeat) / _repeat * 1e6
+
+
+def main():
+    for timestamp in _timestamps:
+        assert parse_datetime(timestamp) == parse(timestamp)
+        print(
+            f"{timestamp:<30} dateutil {_time(lambda: parse(timestamp)):6.1f}us  "
+            f"parse_datetime {_time(lambda: parse_datetime(timestamp)):6.1f}us"
+        )
+
+    builds = {
+        "JoinRequest": lambda: JoinRequest(client=_client, data=_join_request_data, group=_group),
+        "WallPost": lambda: WallPost(client=_client, data=_wall_post_data, group=_group)
+    }
+    for name, build in builds.items():
+        with _use_parser(parse):
+            before = _time(build)
+        after = _time(build)
+        print(f"{name:<30} dateutil {before:6.1f}us  parse_datetime {after:6.1f}us  per object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measures how much of the cost of handling a page is spent decoding JSON, for each installed JSON codec.
+
+Each page has 100 items. Decoding turns the raw body into Python objects and building turns the page's items into
+models, which is what iterators do for every page.
+
+    python -m benchmarks.bench_json_codecs
+"""
+
+import json
+import timeit
+
+from roblox import Client
+from roblox.members import Member
+from roblox.utilities.jsoncodec import get_json_codec
+from roblox.wall import WallPost
+
+_page_size = 100
+_repeat = 200
+
+_client = Client()
+_group = _client.get_base_group(1)
+
+
+def _get_member_data(index: int) -> dict:
+    return {
+        "user": {
+            "buildersClubMembershipType": "None",
+            "hasVerifiedBadge": False,
+            "userId": 1000000 + index,
+            "username": f"user{index}",
+            "displayName": f"User {index}"
+        },
+        "role": {"id": 5000000 + index % 4, "name": "Member", "rank": 1, "memberCount": 1000}
+    }
+
+
+def _get_wall_post_data(index: int) -> dict:
+    return {
+        "id": 2000000 + index,
+        "poster": _get_member_data(index),
+        "body": "Hello, this is a wall post with some text in it. " * 2,
+        "created": "2021-08-12T17:39:43.1234567Z",
+        "updated": "2021-08-12T17:39:43.123Z"
+    }
+
+
+_pages = {
+    "members": (
+        json.dumps({"previousPageCursor": None, "nextPageCursor": "abc", "data": [
+            _get_member_data(index) for index in range(_page_size)
+        ]}).encode(),
+        lambda data: Member(client=_client, data=data, group=_group)
+    ),
+    "wall posts": (
+        json.dumps({"previousPageCursor": None, "nextPageCursor": "abc", "data": [
+            _get_wall_post_data(index) for index in range(_page_size)
+        ]}).encode(),
+        lambda data: WallPost(client=_client, data=data, group=_group)
+    )
+}
+
+
+def _get_codecs():
+    codecs = []
+    for name in ("json", "orjson", "ujson"):
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print(f"{name} isn't installed, skipping it")
+    return codecs
+
+
+def main():
+    codecs = _get_codecs()
+    for page_name, (body, build) in _pages.items():
+        for codec in codecs:
+            items = codec.loads(body)["data"]
+            decode = timeit.timeit(lambda: codec.loads(body), number=_repeat) / _repeat
+            construct = timeit.timeit(lambda: [build(item) for item in items], number=_repeat) / _repeat
+            print(
+                f"{page_name:<11} {codec.name:<7} decode {decode * 1e6:7.1f}us  build {construct * 1e6:7.1f}us  "
+                f"codec share {decode / (decode + construct):6.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
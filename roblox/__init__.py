@@ -18,6 +18,8 @@ import logging
 
 from .client import Client
 from .creatortype import CreatorType
+from .delivery import CDNStore
+from .pool import ClientPool, PoolSession, PoolStrategy
 from .thumbnails import ThumbnailState, ThumbnailFormat, ThumbnailReturnPolicy, AvatarThumbnailType
 from .universes import UniverseGenre, UniverseAvatarType
 from .utilities.exceptions import *
@@ -36,7 +36,7 @@ class AccountProvider:
         birthday_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("accountinformation", "v1/birthdate")
         )
-        birthday_data = birthday_response.json()
+        birthday_data = self._client.requests.read_json(birthday_response)
         return date(
             month=birthday_data["birthMonth"],
             day=birthday_data["birthDay"],
@@ -76,7 +76,7 @@ class AccountProvider:
         description_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("accountinformation", "v1/description")
         )
-        description_data = description_response.json()
+        description_data = self._client.requests.read_json(description_response)
         return description_data["description"]
     
     async def set_description(
@@ -8,12 +8,13 @@ from __future__ import annotations
 from typing import Union, Optional, TYPE_CHECKING
 
 from datetime import datetime
-from dateutil.parser import parse
 
 from .bases.baseasset import BaseAsset
 from .creatortype import CreatorType
 from .partials.partialgroup import AssetPartialGroup
 from .partials.partialuser import PartialUser
+from .utilities.datetimes import parse_datetime
+from .utilities.lazy import LazyAttribute, build_lazy_attributes
 
 if TYPE_CHECKING:
     from .client import Client
@@ -155,20 +156,6 @@ class EconomyAsset(BaseAsset):
         self.product_id: int = data["ProductId"]  # TODO: make this a BaseProduct
         self.name: str = data["Name"]
         self.description: str = data["Description"]
-        self.type: AssetType = AssetType(type_id=data["AssetTypeId"])
-
-        self.creator_type: CreatorType = CreatorType(data["Creator"]["CreatorType"])
-        self.creator: Union[PartialUser, AssetPartialGroup]
-
-        if self.creator_type == CreatorType.user:
-            self.creator: PartialUser = PartialUser(client=client, data=data["Creator"])
-        elif self.creator_type == CreatorType.group:
-            self.creator: AssetPartialGroup = AssetPartialGroup(client=client, data=data["Creator"])
-
-        self.icon_image: BaseAsset = BaseAsset(client=client, asset_id=data["IconImageAssetId"])
-
-        self.created: datetime = parse(data["Created"])
-        self.updated: datetime = parse(data["Updated"])
 
         self.price: Optional[int] = data["PriceInRobux"]
         self.sales: int = data["Sales"]
@@ -184,3 +171,33 @@ class EconomyAsset(BaseAsset):
         self.minimum_membership_level: int = data["MinimumMembershipLevel"]
         self.content_rating_type_id: int = data["ContentRatingTypeId"]
         self.sale_availability_locations = data["SaleAvailabilityLocations"]
+
+        build_lazy_attributes(self, data, lazy=client.lazy_models)
+
+    @LazyAttribute
+    def type(self, data: dict) -> AssetType:
+        return AssetType(type_id=data["AssetTypeId"])
+
+    @LazyAttribute
+    def creator_type(self, data: dict) -> CreatorType:
+        return CreatorType(data["Creator"]["CreatorType"])
+
+    @LazyAttribute
+    def creator(self, data: dict) -> Union[PartialUser, AssetPartialGroup]:
+        creator_type = CreatorType(data["Creator"]["CreatorType"])
+        if creator_type == CreatorType.user:
+            return PartialUser(client=self._client, data=data["Creator"])
+        elif creator_type == CreatorType.group:
+            return AssetPartialGroup(client=self._client, data=data["Creator"])
+
+    @LazyAttribute
+    def icon_image(self, data: dict) -> BaseAsset:
+        return self._client.get_base_asset(data["IconImageAssetId"])
+
+    @LazyAttribute
+    def created(self, data: dict) -> datetime:
+        return parse_datetime(data["Created"])
+
+    @LazyAttribute
+    def updated(self, data: dict) -> datetime:
+        return parse_datetime(data["Updated"])
@@ -7,11 +7,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from datetime import datetime
-from dateutil.parser import parse
 
 from .bases.baseasset import BaseAsset
 from .bases.basebadge import BaseBadge
 from .partials.partialuniverse import PartialUniverse
+from .utilities.datetimes import parse_datetime
+from .utilities.lazy import LazyAttribute, build_lazy_attributes
 
 
 if TYPE_CHECKING:
@@ -73,10 +74,29 @@ class Badge(BaseBadge):
         self.display_name: str = data["displayName"]
         self.display_description: str = data["displayDescription"]
         self.enabled: bool = data["enabled"]
-        self.icon: BaseAsset = BaseAsset(client=client, asset_id=data["iconImageId"])
-        self.display_icon: BaseAsset = BaseAsset(client=client, asset_id=data["displayIconImageId"])
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
 
-        self.statistics: BadgeStatistics = BadgeStatistics(data=data["statistics"])
-        self.awarding_universe: PartialUniverse = PartialUniverse(client=client, data=data["awardingUniverse"])
+        build_lazy_attributes(self, data, lazy=client.lazy_models)
+
+    @LazyAttribute
+    def icon(self, data: dict) -> BaseAsset:
+        return self._client.get_base_asset(data["iconImageId"])
+
+    @LazyAttribute
+    def display_icon(self, data: dict) -> BaseAsset:
+        return self._client.get_base_asset(data["displayIconImageId"])
+
+    @LazyAttribute
+    def created(self, data: dict) -> datetime:
+        return parse_datetime(data["created"])
+
+    @LazyAttribute
+    def updated(self, data: dict) -> datetime:
+        return parse_datetime(data["updated"])
+
+    @LazyAttribute
+    def statistics(self, data: dict) -> BadgeStatistics:
+        return BadgeStatistics(data=data["statistics"])
+
+    @LazyAttribute
+    def awarding_universe(self, data: dict) -> PartialUniverse:
+        return PartialUniverse(client=self._client, data=data["awardingUniverse"])
@@ -22,6 +22,8 @@ class BaseAsset(BaseItem):
         id: The asset ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, asset_id: int):
         """
         Arguments:
@@ -43,5 +45,5 @@ class BaseAsset(BaseItem):
         resale_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("economy", f"v1/assets/{self.id}/resale-data")
         )
-        resale_data = resale_response.json()
+        resale_data = self._client.requests.read_json(resale_response)
         return AssetResaleData(data=resale_data)
@@ -21,6 +21,8 @@ class BaseBadge(BaseItem):
         id: The badge ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, badge_id: int):
         """
         Arguments:
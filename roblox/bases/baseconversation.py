@@ -21,6 +21,8 @@ class BaseConversation(BaseItem):
         id: The conversation ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, conversation_id: int):
         """
         Arguments:
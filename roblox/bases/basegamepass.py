@@ -21,6 +21,8 @@ class BaseGamePass(BaseItem):
         id: The gamepass ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, gamepass_id: int):
         """
         Arguments:
@@ -6,10 +6,9 @@ It also contains the GroupSettings object, which represents a group's settings.
 """
 
 from __future__ import annotations
-from typing import Optional, List, Union, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Optional, List, Union, TYPE_CHECKING
 
 from datetime import datetime
-from dateutil.parser import parse
 
 from .baseitem import BaseItem
 from ..members import Member, MemberRelationship
@@ -17,8 +16,11 @@ from ..partials.partialuser import PartialUser, RequestedUsernamePartialUser
 from ..roles import Role
 from ..shout import Shout
 from ..sociallinks import SocialLink
-from ..utilities.exceptions import InvalidRole
+from ..utilities.bulk import BulkReport, BulkResult, run_bulk
+from ..utilities.datetimes import parse_datetime
+from ..utilities.exceptions import BadRequest, InvalidRole
 from ..utilities.iterators import PageIterator, SortOrder
+from ..utilities.roleindex import RoleIndex
 from ..wall import WallPost, WallPostRelationship
 
 if TYPE_CHECKING:
@@ -39,11 +41,11 @@ class JoinRequest:
 
     def __init__(self, client: Client, data: dict, group: Union[BaseGroup, int]):
         self._client: Client = client
-        self.created: datetime = parse(data["created"])
+        self.created: datetime = parse_datetime(data["created"])
         self.requester: PartialUser = PartialUser(client=self._client, data=data["requester"])
         self.group: BaseGroup
         if isinstance(group, int):
-            self.group = BaseGroup(client=self._client, group_id=group)
+            self.group = self._client.get_base_group(group)
         else:
             self.group = group
 
@@ -112,7 +114,7 @@ class GroupNameHistoryItem:
              
         self._client: Client = client
         self.name: str = data["name"]
-        self.created: datetime = parse(data["created"])
+        self.created: datetime = parse_datetime(data["created"])
 
     def __repr__(self):
         return f"<{self.__class__.__name__} name={self.name!r} created={self.created}>"
@@ -126,6 +128,8 @@ class BaseGroup(BaseItem):
         id: The group's ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, group_id: int):
         """
         Parameters:
@@ -145,7 +149,7 @@ class BaseGroup(BaseItem):
         settings_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("groups", f"v1/groups/{self.id}/settings"),
         )
-        settings_data = settings_response.json()
+        settings_data = self._client.requests.read_json(settings_response)
         return GroupSettings(
             client=self._client,
             data=settings_data
@@ -181,7 +185,7 @@ class BaseGroup(BaseItem):
         )
 
     def get_members(self, page_size: int = 10, sort_order: SortOrder = SortOrder.Ascending,
-                    max_items: int = None) -> PageIterator:
+                    max_items: int = None, prefetch: int = 0) -> PageIterator:
         """
         Gets all members of a group.
 
@@ -189,6 +193,7 @@ class BaseGroup(BaseItem):
             page_size: How many members should be returned for each page.
             sort_order: Order in which data should be grabbed.
             max_items: The maximum items to return when looping through this object.
+            prefetch: How many pages to fetch in the background while the current page is being consumed.
 
         Returns:
             A PageIterator containing the group's members.
@@ -199,7 +204,8 @@ class BaseGroup(BaseItem):
             page_size=page_size,
             sort_order=sort_order,
             max_items=max_items,
-            handler=lambda client, data: Member(client=client, data=data, group=self)
+            handler=lambda client, data: Member(client=client, data=data, group=self),
+            prefetch=prefetch
         )
 
     def get_member(self, user: Union[int, BaseUser]) -> MemberRelationship:
@@ -252,13 +258,33 @@ class BaseGroup(BaseItem):
         roles_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("groups", f"v1/groups/{self.id}/roles")
         )
-        roles_data = roles_response.json()
+        roles_data = self._client.requests.read_json(roles_response)
         return [Role(
             client=self._client,
             data=role_data,
             group=self
         ) for role_data in roles_data["roles"]]
 
+    def get_role_index(self) -> RoleIndex:
+        """
+        Gets the cached role table of the group, which is shared by every object representing this group.
+        It is fetched the first time it is used and again once it is older than the client's role_ttl.
+
+        ```python
+        role = await group.get_role_index().get_by_name("Moderator")
+        ```
+
+        Returns:
+            The group's role index.
+        """
+        return self._client._get_role_index(self.id)
+
+    async def _get_role_by_rank(self, rank: int) -> Role:
+        role = await self.get_role_index().get_by_rank(rank)
+        if not role:
+            raise InvalidRole(f"Role with rank number {rank} does not exist.")
+        return role
+
     async def set_role(self, user: UserOrUserId, role: RoleOrRoleId) -> None:
         """
         Sets a users role.
@@ -277,18 +303,25 @@ class BaseGroup(BaseItem):
     async def set_rank(self, user: UserOrUserId, rank: int) -> None:
         """
         Changes a member's role using a rank number.
+        The role is looked up in the group's cached role table, which is fetched again if Roblox rejects the role.
 
         Arguments:
             user: The user who's rank will be changed.
             rank: The rank number to change to. (1-255)
         """
-        roles = await self.get_roles()
+        role_index = self.get_role_index()
+        role = await self._get_role_by_rank(rank)
+        version = role_index.version
 
-        role = next((role for role in roles if role.rank == rank), None)
-        if not role:
-            raise InvalidRole(f"Role with rank number {rank} does not exist.")
-
-        await self.set_role(int(user), role)
+        try:
+            await self.set_role(int(user), role)
+        except BadRequest:
+            # the role may have been deleted or re-ranked since the role table was fetched
+            await role_index.refresh(version)
+            new_role = await self._get_role_by_rank(rank)
+            if new_role.id == role.id:
+                raise
+            await self.set_role(int(user), new_role)
 
     async def kick_user(self, user: UserOrUserId):
         """
@@ -381,7 +414,7 @@ class BaseGroup(BaseItem):
         join_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("groups", f"v1/groups/{self.id}/join-requests/users/{int(user)}")
         )
-        join_data = join_response.json()
+        join_data = self._client.requests.read_json(join_response)
         return join_data and JoinRequest(
 
             client=self._client,
@@ -411,6 +444,173 @@ class BaseGroup(BaseItem):
             url=self._client.url_generator.get_url("groups", f"v1/groups/{self.id}/join-requests/users/{int(user)}")
         )
 
+    async def bulk_set_role(
+            self,
+            users: Iterable[UserOrUserId],
+            role: RoleOrRoleId,
+            concurrency: int = 10,
+            retries: int = 3,
+            progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None
+    ) -> BulkReport:
+        """
+        Sets the role of many users at once.
+        Failures don't stop the operation - check the report to see which users failed and why.
+
+        Arguments:
+            users: The users who's role will be changed.
+            role: The new role.
+            concurrency: The maximum amount of requests running at the same time.
+            retries: How many times to retry a user after a rate limit, server or network error.
+            progress: A callable that is called with each user's result and the report as soon as the user is done.
+
+        Returns:
+            A report with one result per user.
+        """
+        role_id = int(role)
+        return await run_bulk(
+            items=users,
+            operation=lambda user: self.set_role(user, role_id),
+            concurrency=concurrency,
+            retries=retries,
+            progress=progress,
+            # setting a role is the same no matter how many times it's done
+            idempotent=True
+        )
+
+    async def bulk_set_rank(
+            self,
+            users: Iterable[UserOrUserId],
+            rank: int,
+            concurrency: int = 10,
+            retries: int = 3,
+            progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None
+    ) -> BulkReport:
+        """
+        Changes the role of many users at once using a rank number.
+        The role is looked up in the group's cached role table before any user is changed.
+
+        Arguments:
+            users: The users who's rank will be changed.
+            rank: The rank number to change to. (1-255)
+            concurrency: The maximum amount of requests running at the same time.
+            retries: How many times to retry a user after a rate limit, server or network error.
+            progress: A callable that is called with each user's result and the report as soon as the user is done.
+
+        Returns:
+            A report with one result per user.
+        """
+        role = await self._get_role_by_rank(rank)
+
+        return await self.bulk_set_role(
+            users=users,
+            role=role,
+            concurrency=concurrency,
+            retries=retries,
+            progress=progress
+        )
+
+    async def bulk_kick_users(
+            self,
+            users: Iterable[UserOrUserId],
+            concurrency: int = 10,
+            retries: int = 3,
+            progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None
+    ) -> BulkReport:
+        """
+        Kicks many users from the group at once.
+
+        Arguments:
+            users: The users who will be kicked from the group.
+            concurrency: The maximum amount of requests running at the same time.
+            retries: How many times to retry a user after a rate limit, or a network error raised before the request
+                     was sent. Server errors aren't retried, as the user may have been kicked already.
+            progress: A callable that is called with each user's result and the report as soon as the user is done.
+
+        Returns:
+            A report with one result per user.
+        """
+        return await run_bulk(
+            items=users,
+            operation=self.kick_user,
+            concurrency=concurrency,
+            retries=retries,
+            progress=progress
+        )
+
+    async def bulk_accept_users(
+            self,
+            users: Iterable[Union[int, BaseUser, JoinRequest]],
+            batch_size: int = 100,
+            concurrency: int = 5,
+            retries: int = 3,
+            progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None
+    ) -> BulkReport:
+        """
+        Accepts many users' requests to join this group at once.
+        Users are accepted batch_size at a time with a single request, so every user in a batch shares its result.
+
+        Arguments:
+            users: The users to accept into this group.
+            batch_size: How many users to accept with each request.
+            concurrency: The maximum amount of requests running at the same time.
+            retries: How many times to retry a batch after a rate limit, or a network error raised before the request
+                     was sent. Server errors aren't retried, as the batch may have gone through already.
+            progress: A callable that is called with each user's result and the report as soon as the user is done.
+
+        Returns:
+            A report with one result per user.
+        """
+        return await run_bulk(
+            items=users,
+            operation=lambda batch: self._client.requests.post(
+                url=self._client.url_generator.get_url("groups", f"v1/groups/{self.id}/join-requests"),
+                json={
+                    "UserIds": [int(user) for user in batch]
+                }
+            ),
+            concurrency=concurrency,
+            retries=retries,
+            batch_size=batch_size,
+            progress=progress
+        )
+
+    async def bulk_decline_users(
+            self,
+            users: Iterable[Union[int, BaseUser, JoinRequest]],
+            batch_size: int = 100,
+            concurrency: int = 5,
+            retries: int = 3,
+            progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None
+    ) -> BulkReport:
+        """
+        Declines many users' requests to join this group at once.
+        Users are declined batch_size at a time with a single request, so every user in a batch shares its result.
+
+        Arguments:
+            users: The users to decline from this group.
+            batch_size: How many users to decline with each request.
+            concurrency: The maximum amount of requests running at the same time.
+            retries: How many times to retry a batch after a rate limit, or a network error raised before the request
+                     was sent. Server errors aren't retried, as the batch may have gone through already.
+            progress: A callable that is called with each user's result and the report as soon as the user is done.
+
+        Returns:
+            A report with one result per user.
+        """
+        return await run_bulk(
+            items=users,
+            operation=lambda batch: self._client.requests.delete(
+                url=self._client.url_generator.get_url("groups", f"v1/groups/{self.id}/join-requests"),
+                json={
+                    "UserIds": [int(user) for user in batch]
+                }
+            ),
+            concurrency=concurrency,
+            retries=retries,
+            batch_size=batch_size,
+            progress=progress
+        )
+
     async def update_shout(self, message: str) -> Optional[Shout]:
         """
         Updates the shout.
@@ -424,7 +624,7 @@ class BaseGroup(BaseItem):
                 "message": message
             }
         )
-        shout_data = shout_response.json()
+        shout_data = self._client.requests.read_json(shout_response)
 
         new_shout: Optional[Shout] = shout_data and Shout(
             client=self._client,
@@ -444,7 +644,7 @@ class BaseGroup(BaseItem):
         links_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("groups", f"v1/groups/{self.id}/social-links")
         )
-        links_data = links_response.json()["data"]
+        links_data = self._client.requests.read_json(links_response)["data"]
         return [SocialLink(client=self._client, data=link_data) for link_data in links_data]
 
     def get_name_history(
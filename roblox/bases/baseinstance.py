@@ -22,6 +22,8 @@ class BaseInstance(BaseItem):
         id: The instance ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, instance_id: int):
         """
         Arguments:
@@ -9,11 +9,23 @@ class BaseItem:
     """
     This object represents a base Roblox item. All other bases inherit this object.
     This object overrides equals and not-equals methods ensuring that two bases with the same ID are always equal.
+    Bases hash by their ID, so they can be stored in sets and used as dictionary keys.
+
+    Bases and partials declare their attributes in __slots__, so they don't carry a per-instance __dict__.
+    Full models that don't declare __slots__ still get one as usual.
     """
-    id = None
+
+    __slots__ = ("_client", "id", "__weakref__")
+
+    def _get_attributes(self):
+        for cls in reversed(type(self).__mro__):
+            for key in cls.__dict__.get("__slots__", ()):
+                if not key.startswith("_") and hasattr(self, key):
+                    yield key, getattr(self, key)
+        yield from getattr(self, "__dict__", {}).items()
 
     def __repr__(self):
-        attributes_repr = "".join(f" {key}={value!r}" for key, value in self.__dict__.items() if not key.startswith("_"))
+        attributes_repr = "".join(f" {key}={value!r}" for key, value in self._get_attributes() if not key.startswith("_"))
         return f"<{self.__class__.__name__}{attributes_repr}>"
 
     def __int__(self):
@@ -22,6 +34,9 @@ class BaseItem:
     def __eq__(self, other):
         return isinstance(other, self.__class__) and other.id == self.id
 
+    def __hash__(self):
+        return hash(self.id)
+
     def __ne__(self, other):
         if isinstance(other, self.__class__):
             return other.id != self.id
@@ -24,6 +24,8 @@ class BaseJob(BaseItem):
         id: The job ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, job_id: str):
         """
         Arguments:
@@ -5,14 +5,15 @@ This file contains the BasePlace object, which represents a Roblox place ID.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Any, AsyncIterator, Callable, List, Optional, TYPE_CHECKING
 
 from ..bases.baseasset import BaseAsset
 from ..utilities.iterators import PageIterator, SortOrder
+from ..utilities.scan import TopK, scan_pages
 
 if TYPE_CHECKING:
     from ..client import Client
-    from ..jobs import ServerType
+    from ..jobs import Server, ServerType
 
 
 class BasePlace(BaseAsset):
@@ -24,6 +25,8 @@ class BasePlace(BaseAsset):
         id: The place ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, place_id: int):
         """
         Arguments:
@@ -57,7 +60,7 @@ class BasePlace(BaseAsset):
                 "startIndex": start_index
             }
         )
-        instances_data = instances_response.json()
+        instances_data = self._client.requests.read_json(instances_response)
         return GameInstances(
             client=self._client,
             data=instances_data
@@ -96,6 +99,148 @@ class BasePlace(BaseAsset):
             handler=lambda client, data: Server(client=client, data=data),
         )
     
+    async def scan_servers(
+            self,
+            server_type: ServerType,
+            predicate: Optional[Callable[[Server], bool]] = None,
+            min_free_slots: Optional[int] = None,
+            max_ping: Optional[int] = None,
+            min_fps: Optional[float] = None,
+            max_items: Optional[int] = None,
+            max_pages: Optional[int] = None,
+            sort_order: SortOrder = SortOrder.Descending,
+            page_size: int = 100,
+            prefetch: int = 1
+    ) -> AsyncIterator[Server]:
+        """
+        Walks through the place's servers and yields every server that matches the passed filters as soon as its
+        page arrives. The next page is fetched in the background while the current one is being filtered.
+
+        ```python
+        async for server in place.scan_servers(ServerType.public, min_free_slots=2, max_ping=100, max_items=5):
+            print(server.id)
+        ```
+
+        Arguments:
+            server_type: The type of servers to scan.
+            predicate: A callable that returns whether a server matches, checked after the other filters.
+            min_free_slots: The minimum amount of free player slots. Full servers are left out by Roblox if this is
+                            1 or more.
+            max_ping: The maximum ping. Servers that don't report their ping are left out.
+            min_fps: The minimum fps. Servers that don't report their fps are left out.
+            max_items: How many matching servers to yield before stopping.
+            max_pages: How many pages to read before stopping.
+            sort_order: The order Roblox returns servers in, by player count.
+            page_size: How many servers to fetch with each request. (10, 25, 50 or 100)
+            prefetch: How many pages to fetch in the background ahead of the page being filtered.
+
+        Returns:
+            An async iterator of matching servers.
+        """
+        from ..jobs import Server
+
+        def check(server_data: dict) -> bool:
+            # these are checked on the raw data, so servers that don't match are never turned into objects
+            if min_free_slots is not None and \
+                    server_data["maxPlayers"] - server_data.get("playing", 0) < min_free_slots:
+                return False
+            if max_ping is not None and (server_data.get("ping") is None or server_data["ping"] > max_ping):
+                return False
+            if min_fps is not None and (server_data.get("fps") is None or server_data["fps"] < min_fps):
+                return False
+            return True
+
+        iterator = PageIterator(
+            client=self._client,
+            url=self._client._url_generator.get_url("games", f"v1/games/{self.id}/servers/{server_type.value}"),
+            page_size=page_size,
+            sort_order=sort_order,
+            extra_parameters={"excludeFullGames": min_free_slots is not None and min_free_slots >= 1},
+            prefetch=prefetch
+        )
+
+        if max_items is not None and max_items <= 0:
+            return
+
+        matches = 0
+        servers_data = scan_pages(iterator=iterator, predicate=check, max_pages=max_pages)
+        try:
+            async for server_data in servers_data:
+                server = Server(client=self._client, data=server_data)
+                if predicate is not None and not predicate(server):
+                    continue
+                yield server
+                matches += 1
+                if max_items is not None and matches >= max_items:
+                    return
+        finally:
+            # stops the page walk, and the pages it is prefetching, as soon as we're done
+            await servers_data.aclose()
+
+    async def find_servers(
+            self,
+            server_type: ServerType,
+            limit: int = 10,
+            key: Optional[Callable[[Server], Any]] = None,
+            predicate: Optional[Callable[[Server], bool]] = None,
+            min_free_slots: Optional[int] = None,
+            max_ping: Optional[int] = None,
+            min_fps: Optional[float] = None,
+            max_pages: Optional[int] = None,
+            sort_order: SortOrder = SortOrder.Descending,
+            page_size: int = 100,
+            prefetch: int = 1
+    ) -> List[Server]:
+        """
+        Finds the servers with the smallest keys out of every server that matches the passed filters.
+        Without a key, the first limit matching servers are returned as soon as they are found, in the order Roblox
+        returns them, which is by player count. With a key, every page has to be read to be certain of the result,
+        so pass max_pages to bound how long this takes for places with many servers.
+
+        ```python
+        # the 10 non-full servers with the lowest ping
+        servers = await place.find_servers(ServerType.public, key=lambda server: server.ping, min_free_slots=1,
+                                           max_ping=1000)
+        ```
+
+        Arguments:
+            server_type: The type of servers to find.
+            limit: How many servers to return.
+            key: A callable that returns the value to compare servers by, smallest first.
+            predicate: A callable that returns whether a server matches, checked after the other filters.
+            min_free_slots: The minimum amount of free player slots.
+            max_ping: The maximum ping.
+            min_fps: The minimum fps.
+            max_pages: How many pages to read before stopping.
+            sort_order: The order Roblox returns servers in, by player count.
+            page_size: How many servers to fetch with each request. (10, 25, 50 or 100)
+            prefetch: How many pages to fetch in the background ahead of the page being filtered.
+
+        Returns:
+            A list of at most limit servers.
+        """
+        servers = self.scan_servers(
+            server_type=server_type,
+            predicate=predicate,
+            min_free_slots=min_free_slots,
+            max_ping=max_ping,
+            min_fps=min_fps,
+            # without a key, the first matches are already the result
+            max_items=limit if key is None else None,
+            max_pages=max_pages,
+            sort_order=sort_order,
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
+        if key is None:
+            return [server async for server in servers]
+
+        top_servers = TopK(limit=limit, key=key)
+        async for server in servers:
+            top_servers.add(server)
+        return top_servers.get_items()
+
     def get_private_servers(
             self,
             page_size: int = 10, 
@@ -22,6 +22,8 @@ class BasePlugin(BaseAsset):
         id: The plugin ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, plugin_id: int):
         """
         Arguments:
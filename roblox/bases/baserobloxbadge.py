@@ -23,6 +23,8 @@ class BaseRobloxBadge(BaseItem):
         id: The roblox badge ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, roblox_badge_id: int):
         """
         Arguments:
@@ -21,6 +21,8 @@ class BaseRole(BaseItem):
         id: The role ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, role_id: int):
         """
         Arguments:
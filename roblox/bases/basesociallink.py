@@ -21,6 +21,8 @@ class BaseUniverseSocialLink(BaseItem):
         id: The universe social link ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, social_link_id: int):
         """
         Arguments:
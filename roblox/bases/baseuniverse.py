@@ -49,6 +49,8 @@ class BaseUniverse(BaseItem):
         id: The universe ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, universe_id: int):
         """
         Arguments:
@@ -69,7 +71,7 @@ class BaseUniverse(BaseItem):
         favorite_count_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("games", f"v1/games/{self.id}/favorites/count")
         )
-        favorite_count_data = favorite_count_response.json()
+        favorite_count_data = self._client.requests.read_json(favorite_count_response)
         return favorite_count_data["favoritesCount"]
 
     async def is_favorited(self) -> bool:
@@ -82,7 +84,7 @@ class BaseUniverse(BaseItem):
         is_favorited_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("games", f"v1/games/{self.id}/favorites")
         )
-        is_favorited_data = is_favorited_response.json()
+        is_favorited_data = self._client.requests.read_json(is_favorited_response)
         return is_favorited_data["isFavorited"]
 
     def get_badges(self, page_size: int = 10, sort_order: SortOrder = SortOrder.Ascending,
@@ -119,7 +121,7 @@ class BaseUniverse(BaseItem):
         stats_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("develop", f"v1/universes/{self.id}/live-stats")
         )
-        stats_data = stats_response.json()
+        stats_data = self._client.requests.read_json(stats_response)
         return UniverseLiveStats(data=stats_data)
 
     def get_gamepasses(self, page_size: int = 10, sort_order: SortOrder = SortOrder.Ascending,
@@ -156,5 +158,5 @@ class BaseUniverse(BaseItem):
         links_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("games", f"v1/games/{self.id}/social-links/list")
         )
-        links_data = links_response.json()["data"]
+        links_data = self._client.requests.read_json(links_response)["data"]
         return [SocialLink(client=self._client, data=link_data) for link_data in links_data]
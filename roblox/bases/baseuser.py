@@ -42,6 +42,8 @@ class BaseUser(BaseItem):
         id: The user ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, client: Client, user_id: int):
         """
         Arguments:
@@ -111,7 +113,7 @@ class BaseUser(BaseItem):
                 "userSort": sort_order.value,
                 "findFriendsType": friend_type.value
             },
-            handler=lambda client, data: BaseUser(client, data["id"])
+            handler=lambda client, data: client.get_base_user(data["id"])
         )
 
     async def get_currency(self) -> int:
@@ -124,7 +126,7 @@ class BaseUser(BaseItem):
         currency_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("economy", f"v1/users/{self.id}/currency")
         )
-        currency_data = currency_response.json()
+        currency_data = self._client.requests.read_json(currency_response)
         return currency_data["robux"]
 
     async def has_premium(self) -> bool:
@@ -159,7 +161,7 @@ class BaseUser(BaseItem):
         instance_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("inventory", f"v1/users/{self.id}/items/{item_type}/{item_id}")
         )
-        instance_data = instance_response.json()["data"]
+        instance_data = self._client.requests.read_json(instance_response)["data"]
         if len(instance_data) > 0:
             return item_class(
                 client=self._client,
@@ -205,7 +207,7 @@ class BaseUser(BaseItem):
                 "badgeIds": [badge.id for badge in badges]
             }
         )
-        awarded_data: list = awarded_response.json()["data"]
+        awarded_data: list = self._client.requests.read_json(awarded_response)["data"]
         return [
             PartialBadge(
                 client=self._client,
@@ -225,7 +227,7 @@ class BaseUser(BaseItem):
         roles_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("groups", f"v1/users/{self.id}/groups/roles")
         )
-        roles_data = roles_response.json()["data"]
+        roles_data = self._client.requests.read_json(roles_response)["data"]
         return [
             Role(
                 client=self._client,
@@ -248,7 +250,7 @@ class BaseUser(BaseItem):
         badges_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("accountinformation", f"v1/users/{self.id}/roblox-badges")
         )
-        badges_data = badges_response.json()
+        badges_data = self._client.requests.read_json(badges_response)
         return [RobloxBadge(client=self._client, data=badge_data) for badge_data in badges_data]
 
     async def get_promotion_channels(self) -> UserPromotionChannels:
@@ -261,7 +263,7 @@ class BaseUser(BaseItem):
         channels_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("accountinformation", f"v1/users/{self.id}/promotion-channels")
         )
-        channels_data = channels_response.json()
+        channels_data = self._client.requests.read_json(channels_response)
         return UserPromotionChannels(
             data=channels_data
         )
@@ -270,7 +272,7 @@ class BaseUser(BaseItem):
         count_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("friends", f"v1/users/{self.id}/{channel}/count")
         )
-        return count_response.json()["count"]
+        return self._client.requests.read_json(count_response)["count"]
 
     def _get_friend_channel_iterator(
             self,
@@ -285,7 +287,7 @@ class BaseUser(BaseItem):
             page_size=page_size,
             sort_order=sort_order,
             max_items=max_items,
-            handler=lambda client, data: BaseUser(client=client, user_id=data["id"])
+            handler=lambda client, data: client.get_base_user(data["id"])
         )
 
     async def get_friend_count(self) -> int:
@@ -62,7 +62,7 @@ class ChatProvider:
         unread_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("chat", "v2/get-unread-conversation-count")
         )
-        unread_data = unread_response.json()
+        unread_data = self._client.requests.read_json(unread_response)
         return unread_data["count"]
 
     async def get_settings(self) -> ChatSettings:
@@ -75,18 +75,22 @@ class ChatProvider:
         settings_response = await self._client.requests.get(
             url=self._client.url_generator.get_url("chat", "v2/chat-settings")
         )
-        settings_data = settings_response.json()
+        settings_data = self._client.requests.read_json(settings_response)
         return ChatSettings(data=settings_data)
 
-    def get_user_conversations(self) -> PageNumberIterator:
+    def get_user_conversations(self, page_window: int = 1) -> PageNumberIterator:
         """
         Gets the user's conversations.
 
+        Arguments:
+            page_window: How many pages to fetch in parallel.
+
         Returns: 
             The user's conversations as a PageNumberIterator.
         """
         return PageNumberIterator(
             client=self._client,
             url=self._client.url_generator.get_url("chat", "v2/get-user-conversations"),
-            handler=lambda client, data: Conversation(client=client, data=data)
+            handler=lambda client, data: Conversation(client=client, data=data),
+            page_window=page_window
         )
@@ -4,7 +4,10 @@ Contains the Client, which is the core object at the center of all ro.py applica
 
 """
 
-from typing import Union, List, Optional
+from collections import OrderedDict
+from typing import Union, List, Optional, Type, TypeVar
+
+from httpx import AsyncClient
 
 from .account import AccountProvider
 from .assets import EconomyAsset
@@ -13,6 +16,8 @@ from .bases.baseasset import BaseAsset
 from .bases.basebadge import BaseBadge
 from .bases.basegamepass import BaseGamePass
 from .bases.basegroup import BaseGroup
+from .bases.baseitem import BaseItem
+from .bases.basejob import BaseJob
 from .bases.baseplace import BasePlace
 from .bases.baseplugin import BasePlugin
 from .bases.baseuniverse import BaseUniverse
@@ -27,12 +32,28 @@ from .presence import PresenceProvider
 from .thumbnails import ThumbnailProvider
 from .universes import Universe
 from .users import User
+from .utilities.batching import RequestBatcher, gather_bounded, gather_chunks
+from .utilities.cache import ResponseCache
 from .utilities.exceptions import BadRequest, NotFound, AssetNotFound, BadgeNotFound, GroupNotFound, PlaceNotFound, \
     PluginNotFound, UniverseNotFound, UserNotFound
+from .utilities.identity import IdentityMap
 from .utilities.iterators import PageIterator
-from .utilities.requests import Requests
+from .utilities.instrumentation import Instrumentation
+from .utilities.jsoncodec import JSONCodec, get_json_codec
+from .utilities.ratelimit import RateLimiter
+from .utilities.requests import CleanAsyncClient, Requests
+from .utilities.roleindex import RoleIndex
+from .utilities.transport import TransportSettings
 from .utilities.url import URLGenerator
 
+# The maximum amount of IDs each multiget endpoint accepts in a single request.
+_users_batch_size = 100
+_universes_batch_size = 50
+_places_batch_size = 50
+_plugins_batch_size = 50
+
+BaseItemType = TypeVar("BaseItemType", bound=BaseItem)
+
 
 class Client:
     """
@@ -46,20 +67,106 @@ class Client:
         delivery: The delivery provider object.
         chat: The chat provider object.
         account: The account provider object.
+        lazy_models: Whether heavy models build their nested objects the first time they're read.
+        identity_map: The map used to reuse base objects for repeated IDs, or None if bases aren't reused.
+        stream_responses: Whether iterators and multiget methods decode responses item by item while they're
+                          downloaded.
+        role_ttl: How long, in seconds, a group's role table is used for by set_rank before it is fetched again.
     """
 
-    def __init__(self, token: str = None, base_url: str = "roblox.com"):
+    def __init__(
+            self,
+            token: str = None,
+            base_url: str = "roblox.com",
+            batch_delay: float = 0.01,
+            cache: Optional[ResponseCache] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            lazy_models: bool = False,
+            identity_map: bool = False,
+            stream_responses: bool = False,
+            json_codec: Union[str, JSONCodec] = "json",
+            transport: Optional[TransportSettings] = None,
+            session: Optional[AsyncClient] = None,
+            role_ttl: float = 300,
+            instrumentation: Optional[Instrumentation] = None,
+            max_role_indexes: int = 256
+    ):
         """
         Arguments:
             token: A .ROBLOSECURITY token to authenticate the client with.
             base_url: The base URL to use when sending requests.
+            batch_delay: How long, in seconds, single-item lookups like get_universe wait for concurrent lookups to
+                         batch with before sending a request.
+            cache: A response cache to use for GET requests. Responses aren't cached if this is None.
+            rate_limiter: A rate limiter to schedule requests with and retry 429 and 5xx responses. Requests aren't
+                          scheduled or retried if this is None.
+            lazy_models: Whether heavy models (Universe, EconomyAsset, Badge and Presence) should keep their raw data
+                         and only build nested objects and datetimes the first time they're read.
+            identity_map: Whether bases should be reused for repeated IDs, so that, for example, every get_base_user
+                          call and every page mentioning the same user returns the same BaseUser while it is alive.
+            stream_responses: Whether iterators and multiget methods should decode responses item by item while
+                              they're downloaded instead of decoding the whole body at once. Streamed responses
+                              aren't cached.
+            json_codec: The JSON codec used to decode responses and encode request bodies, either a JSONCodec or one
+                        of "json", "orjson", "ujson" and "auto". "auto" uses orjson or ujson if either is installed and
+                        the standard library otherwise. The faster libraries don't behave exactly like the standard
+                        library - orjson, for example, encodes NaN as null and rejects dicts with non-string keys -
+                        so they are only used when asked for.
+            transport: Connection pool, keep-alive, HTTP/2 and timeout settings for the client's session.
+                       TransportSettings.high_throughput() is tuned for running hundreds of requests at once.
+            session: An httpx.AsyncClient to send requests with instead of creating one. If this is passed, transport
+                     is ignored.
+            role_ttl: How long, in seconds, a group's role table is used for by set_rank before it is fetched again.
+            instrumentation: An Instrumentation to time requests per endpoint and count retries, cache hits and X-CSRF
+                             token refreshes with. Requests aren't instrumented if this is None.
+            max_role_indexes: How many groups' role tables are kept for set_rank at once. The least recently used
+                              group's table is dropped first.
         """
         self._url_generator: URLGenerator = URLGenerator(base_url=base_url)
-        self._requests: Requests = Requests()
+        self._requests: Requests = self._create_requests(
+            session=session,
+            transport=transport,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            json_codec=get_json_codec(json_codec) if isinstance(json_codec, str) else json_codec,
+            instrumentation=instrumentation
+        )
+
+        self._user_batcher: RequestBatcher = RequestBatcher(
+            fetcher=self._get_user_data,
+            key=lambda data: data["id"],
+            batch_size=1,
+            delay=0
+        )
+        self._universe_batcher: RequestBatcher = RequestBatcher(
+            fetcher=self._get_universes_data,
+            key=lambda data: data["id"],
+            batch_size=_universes_batch_size,
+            delay=batch_delay
+        )
+        self._place_batcher: RequestBatcher = RequestBatcher(
+            fetcher=self._get_places_data,
+            key=lambda data: data["placeId"],
+            batch_size=_places_batch_size,
+            delay=batch_delay
+        )
+        self._plugin_batcher: RequestBatcher = RequestBatcher(
+            fetcher=self._get_plugins_data,
+            key=lambda data: data["id"],
+            batch_size=_plugins_batch_size,
+            delay=batch_delay
+        )
 
         self.url_generator: URLGenerator = self._url_generator
         self.requests: Requests = self._requests
 
+        self.lazy_models: bool = lazy_models
+        self.identity_map: Optional[IdentityMap] = IdentityMap() if identity_map else None
+        self.stream_responses: bool = stream_responses
+        self.role_ttl: float = role_ttl
+        self.max_role_indexes: int = max_role_indexes
+        self._role_indexes: OrderedDict[int, RoleIndex] = OrderedDict()
+
         self.presence: PresenceProvider = PresenceProvider(client=self)
         self.thumbnails: ThumbnailProvider = ThumbnailProvider(client=self)
         self.delivery: DeliveryProvider = DeliveryProvider(client=self)
@@ -83,11 +190,57 @@ class Client:
 
         """
         self._requests.session.cookies[".ROBLOSECURITY"] = token
+        # X-CSRF tokens belong to the account they were handed out to
+        self._requests.xcsrf_tokens.invalidate()
+
+    async def _get_items(self, method: str, url: str, array_key: Optional[str] = "data", **kwargs) -> list:
+        if self.stream_responses:
+            items = []
+            await self._requests.stream(method, url, item_handler=items.append, array_key=array_key, **kwargs)
+            return items
+
+        response = await self._requests.request(method, url=url, **kwargs)
+        data = self._requests.read_json(response)
+        return data if array_key is None else data[array_key]
+
+    def _create_requests(
+            self,
+            session: Optional[AsyncClient],
+            transport: Optional[TransportSettings],
+            cache: Optional[ResponseCache],
+            rate_limiter: Optional[RateLimiter],
+            json_codec: JSONCodec,
+            instrumentation: Optional[Instrumentation]
+    ) -> Requests:
+        if session is None:
+            session = CleanAsyncClient(**(transport.get_session_options() if transport else {}))
+
+        return Requests(
+            session=session,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            xcsrf_token_url=self._url_generator.get_url("auth", "v2/logout"),
+            instrumentation=instrumentation
+        )
+
+    # Bases
+    def _get_base_item(self, base_type: Type[BaseItemType], item_id: int) -> BaseItemType:
+        if self.identity_map is None:
+            return base_type(self, item_id)
+        return self.identity_map.get(base_type, item_id, lambda: base_type(self, item_id))
 
     # Users
+    async def _get_user_data(self, user_ids: List[int]) -> List[dict]:
+        user_response = await self._requests.get(
+            url=self.url_generator.get_url("users", f"v1/users/{user_ids[0]}")
+        )
+        return [self._requests.read_json(user_response)]
+
     async def get_user(self, user_id: int) -> User:
         """
         Gets a user with the specified user ID.
+        Concurrent calls for the same user share a single request.
 
         Arguments:
             user_id: A Roblox user ID.
@@ -96,15 +249,12 @@ class Client:
             A user object.
         """
         try:
-            user_response = await self._requests.get(
-                url=self.url_generator.get_url("users", f"v1/users/{user_id}")
-            )
+            user_data = await self._user_batcher.get(int(user_id))
         except NotFound as exception:
             raise UserNotFound(
                 message="Invalid user.",
                 response=exception.response
             ) from None
-        user_data = user_response.json()
         return User(client=self, data=user_data)
 
     async def get_authenticated_user(
@@ -122,7 +272,7 @@ class Client:
         authenticated_user_response = await self._requests.get(
             url=self._url_generator.get_url("users", f"v1/users/authenticated")
         )
-        authenticated_user_data = authenticated_user_response.json()
+        authenticated_user_data = self._requests.read_json(authenticated_user_response)
 
         if expand:
             return await self.get_user(authenticated_user_data["id"])
@@ -134,26 +284,39 @@ class Client:
             user_ids: List[int],
             exclude_banned_users: bool = False,
             expand: bool = False,
-    ) -> Union[List[PartialUser], List[User]]:
+            max_concurrency: int = 10,
+            return_exceptions: bool = False,
+    ) -> Union[List[PartialUser], List[User], List[Union[User, Exception]]]:
         """
         Grabs a list of users corresponding to each user ID in the list.
+        Lists larger than the endpoint limit are split into chunks which are sent in parallel.
 
         Arguments:
             user_ids: A list of Roblox user IDs.
             exclude_banned_users: Whether to exclude banned users from the data.
             expand: Whether to return a list of Users (2 requests) rather than PartialUsers (1 request)
+            max_concurrency: When expanding, the maximum amount of users fetched at the same time.
+            return_exceptions: When expanding, whether to put the exception raised for a user in its place in the
+                               list instead of raising it.
 
         Returns:
             A List of Users or partial users.
         """
-        users_response = await self._requests.post(
-            url=self._url_generator.get_url("users", f"v1/users"),
-            json={"userIds": user_ids, "excludeBannedUsers": exclude_banned_users},
-        )
-        users_data = users_response.json()["data"]
+        async def get_users_chunk(user_ids_chunk: List[int]) -> List[dict]:
+            return await self._get_items(
+                "POST",
+                url=self._url_generator.get_url("users", f"v1/users"),
+                json={"userIds": user_ids_chunk, "excludeBannedUsers": exclude_banned_users},
+            )
+
+        users_data = await gather_chunks(user_ids, _users_batch_size, get_users_chunk)
 
         if expand:
-            return [await self.get_user(user_data["id"]) for user_data in users_data]
+            return await gather_bounded(
+                (self.get_user(user_data["id"]) for user_data in users_data),
+                limit=max_concurrency,
+                return_exceptions=return_exceptions
+            )
         else:
             return [
                 PartialUser(client=self, data=user_data)
@@ -165,26 +328,39 @@ class Client:
             usernames: List[str],
             exclude_banned_users: bool = False,
             expand: bool = False,
-    ) -> Union[List[RequestedUsernamePartialUser], List[User]]:
+            max_concurrency: int = 10,
+            return_exceptions: bool = False,
+    ) -> Union[List[RequestedUsernamePartialUser], List[User], List[Union[User, Exception]]]:
         """
         Grabs a list of users corresponding to each username in the list.
+        Lists larger than the endpoint limit are split into chunks which are sent in parallel.
 
         Arguments:
             usernames: A list of Roblox usernames.
             exclude_banned_users: Whether to exclude banned users from the data.
             expand: Whether to return a list of Users (2 requests) rather than RequestedUsernamePartialUsers (1 request)
+            max_concurrency: When expanding, the maximum amount of users fetched at the same time.
+            return_exceptions: When expanding, whether to put the exception raised for a user in its place in the
+                               list instead of raising it.
 
         Returns:
             A list of User or RequestedUsernamePartialUser, depending on the expand argument.
         """
-        users_response = await self._requests.post(
-            url=self._url_generator.get_url("users", f"v1/usernames/users"),
-            json={"usernames": usernames, "excludeBannedUsers": exclude_banned_users},
-        )
-        users_data = users_response.json()["data"]
+        async def get_usernames_chunk(usernames_chunk: List[str]) -> List[dict]:
+            return await self._get_items(
+                "POST",
+                url=self._url_generator.get_url("users", f"v1/usernames/users"),
+                json={"usernames": usernames_chunk, "excludeBannedUsers": exclude_banned_users},
+            )
+
+        users_data = await gather_chunks(usernames, _users_batch_size, get_usernames_chunk)
 
         if expand:
-            return [await self.get_user(user_data["id"]) for user_data in users_data]
+            return await gather_bounded(
+                (self.get_user(user_data["id"]) for user_data in users_data),
+                limit=max_concurrency,
+                return_exceptions=return_exceptions
+            )
         else:
             return [
                 RequestedUsernamePartialUser(client=self, data=user_data)
@@ -229,7 +405,7 @@ class Client:
         Returns:
             A BaseUser.
         """
-        return BaseUser(client=self, user_id=user_id)
+        return self._get_base_item(BaseUser, user_id)
 
     def user_search(self, keyword: str, page_size: int = 10,
                     max_items: int = None) -> PageIterator:
@@ -273,7 +449,7 @@ class Client:
                 message="Invalid group.",
                 response=exception.response
             ) from None
-        group_data = group_response.json()
+        group_data = self._requests.read_json(group_response)
         return Group(client=self, data=group_data)
 
     def get_base_group(self, group_id: int) -> BaseGroup:
@@ -290,12 +466,32 @@ class Client:
         Returns:
             A BaseGroup.
         """
-        return BaseGroup(client=self, group_id=group_id)
+        return self._get_base_item(BaseGroup, group_id)
+
+    def _get_role_index(self, group_id: int) -> RoleIndex:
+        role_index = self._role_indexes.get(group_id)
+        if role_index is None:
+            role_index = RoleIndex(fetcher=self.get_base_group(group_id).get_roles, ttl=self.role_ttl)
+            self._role_indexes[group_id] = role_index
+            # a long-running client may rank users in any number of groups, so only the recent ones are kept
+            while len(self._role_indexes) > self.max_role_indexes:
+                self._role_indexes.popitem(last=False)
+        else:
+            self._role_indexes.move_to_end(group_id)
+        return role_index
 
     # Universes
+    async def _get_universes_data(self, universe_ids: List[int]) -> List[dict]:
+        return await self._get_items(
+            "GET",
+            url=self._url_generator.get_url("games", "v1/games"),
+            params={"universeIds": universe_ids},
+        )
+
     async def get_universes(self, universe_ids: List[int]) -> List[Universe]:
         """
         Grabs a list of universes corresponding to each ID in the list.
+        Lists larger than the endpoint limit are split into chunks which are sent in parallel.
 
         Arguments:
             universe_ids: A list of Roblox universe IDs.
@@ -303,11 +499,7 @@ class Client:
         Returns:
             A list of Universes.
         """
-        universes_response = await self._requests.get(
-            url=self._url_generator.get_url("games", "v1/games"),
-            params={"universeIds": universe_ids},
-        )
-        universes_data = universes_response.json()["data"]
+        universes_data = await gather_chunks(universe_ids, _universes_batch_size, self._get_universes_data)
         return [
             Universe(client=self, data=universe_data)
             for universe_data in universes_data
@@ -316,6 +508,7 @@ class Client:
     async def get_universe(self, universe_id: int) -> Universe:
         """
         Gets a universe with the passed ID.
+        Concurrent calls are batched together into a single request.
 
         Arguments:
             universe_id: A Roblox universe ID.
@@ -323,11 +516,10 @@ class Client:
         Returns:
             A Universe.
         """
-        universes = await self.get_universes(universe_ids=[universe_id])
-        try:
-            return universes[0]
-        except IndexError:
-            raise UniverseNotFound("Invalid universe.") from None
+        universe_data = await self._universe_batcher.get(int(universe_id))
+        if universe_data is None:
+            raise UniverseNotFound("Invalid universe.")
+        return Universe(client=self, data=universe_data)
 
     def get_base_universe(self, universe_id: int) -> BaseUniverse:
         """
@@ -343,12 +535,23 @@ class Client:
         Returns:
             A BaseUniverse.
         """
-        return BaseUniverse(client=self, universe_id=universe_id)
+        return self._get_base_item(BaseUniverse, universe_id)
 
     # Places
+    async def _get_places_data(self, place_ids: List[int]) -> List[dict]:
+        return await self._get_items(
+            "GET",
+            url=self._url_generator.get_url(
+                "games", f"v1/games/multiget-place-details"
+            ),
+            params={"placeIds": place_ids},
+            array_key=None
+        )
+
     async def get_places(self, place_ids: List[int]) -> List[Place]:
         """
         Grabs a list of places corresponding to each ID in the list.
+        Lists larger than the endpoint limit are split into chunks which are sent in parallel.
 
         Arguments:
             place_ids: A list of Roblox place IDs.
@@ -356,13 +559,7 @@ class Client:
         Returns:
             A list of Places.
         """
-        places_response = await self._requests.get(
-            url=self._url_generator.get_url(
-                "games", f"v1/games/multiget-place-details"
-            ),
-            params={"placeIds": place_ids},
-        )
-        places_data = places_response.json()
+        places_data = await gather_chunks(place_ids, _places_batch_size, self._get_places_data)
         return [
             Place(client=self, data=place_data) for place_data in places_data
         ]
@@ -370,6 +567,7 @@ class Client:
     async def get_place(self, place_id: int) -> Place:
         """
         Gets a place with the passed ID.
+        Concurrent calls are batched together into a single request.
 
         Arguments:
             place_id: A Roblox place ID.
@@ -377,11 +575,10 @@ class Client:
         Returns:
             A Place.
         """
-        places = await self.get_places(place_ids=[place_id])
-        try:
-            return places[0]
-        except IndexError:
-            raise PlaceNotFound("Invalid place.") from None
+        place_data = await self._place_batcher.get(int(place_id))
+        if place_data is None:
+            raise PlaceNotFound("Invalid place.")
+        return Place(client=self, data=place_data)
 
     def get_base_place(self, place_id: int) -> BasePlace:
         """
@@ -397,7 +594,24 @@ class Client:
         Returns:
             A BasePlace.
         """
-        return BasePlace(client=self, place_id=place_id)
+        return self._get_base_item(BasePlace, place_id)
+
+    # Jobs
+    def get_base_job(self, job_id: str) -> BaseJob:
+        """
+        Gets a base job.
+
+        !!! note
+            This method does not send any requests - it just generates an object.
+            For more information on bases, please see [Bases](../tutorials/bases.md).
+
+        Arguments:
+            job_id: A Roblox job ID.
+
+        Returns:
+            A BaseJob.
+        """
+        return self._get_base_item(BaseJob, job_id)
 
     # Assets
     async def get_asset(self, asset_id: int) -> EconomyAsset:
@@ -421,7 +635,7 @@ class Client:
                 message="Invalid asset.",
                 response=exception.response
             ) from None
-        asset_data = asset_response.json()
+        asset_data = self._requests.read_json(asset_response)
         return EconomyAsset(client=self, data=asset_data)
 
     def get_base_asset(self, asset_id: int) -> BaseAsset:
@@ -438,12 +652,24 @@ class Client:
         Returns:
             A BaseAsset.
         """
-        return BaseAsset(client=self, asset_id=asset_id)
+        return self._get_base_item(BaseAsset, asset_id)
 
     # Plugins
+    async def _get_plugins_data(self, plugin_ids: List[int]) -> List[dict]:
+        return await self._get_items(
+            "GET",
+            url=self._url_generator.get_url(
+                "develop", "v1/plugins"
+            ),
+            params={
+                "pluginIds": plugin_ids
+            }
+        )
+
     async def get_plugins(self, plugin_ids: List[int]) -> List[Plugin]:
         """
         Grabs a list of plugins corresponding to each ID in the list.
+        Lists larger than the endpoint limit are split into chunks which are sent in parallel.
 
         Arguments:
             plugin_ids: A list of Roblox plugin IDs.
@@ -451,20 +677,13 @@ class Client:
         Returns:
             A list of Plugins.
         """
-        plugins_response = await self._requests.get(
-            url=self._url_generator.get_url(
-                "develop", "v1/plugins"
-            ),
-            params={
-                "pluginIds": plugin_ids
-            }
-        )
-        plugins_data = plugins_response.json()["data"]
+        plugins_data = await gather_chunks(plugin_ids, _plugins_batch_size, self._get_plugins_data)
         return [Plugin(client=self, data=plugin_data) for plugin_data in plugins_data]
 
     async def get_plugin(self, plugin_id: int) -> Plugin:
         """
         Grabs a plugin with the passed ID.
+        Concurrent calls are batched together into a single request.
 
         Arguments:
             plugin_id: A Roblox plugin ID.
@@ -472,11 +691,10 @@ class Client:
         Returns:
             A Plugin.
         """
-        plugins = await self.get_plugins([plugin_id])
-        try:
-            return plugins[0]
-        except IndexError:
-            raise PluginNotFound("Invalid plugin.") from None
+        plugin_data = await self._plugin_batcher.get(int(plugin_id))
+        if plugin_data is None:
+            raise PluginNotFound("Invalid plugin.")
+        return Plugin(client=self, data=plugin_data)
 
     def get_base_plugin(self, plugin_id: int) -> BasePlugin:
         """
@@ -492,7 +710,7 @@ class Client:
         Returns:
             A BasePlugin.
         """
-        return BasePlugin(client=self, plugin_id=plugin_id)
+        return self._get_base_item(BasePlugin, plugin_id)
 
     # Badges
     async def get_badge(self, badge_id: int) -> Badge:
@@ -516,7 +734,7 @@ class Client:
                 message="Invalid badge.",
                 response=exception.response
             ) from None
-        badge_data = badge_response.json()
+        badge_data = self._requests.read_json(badge_response)
         return Badge(client=self, data=badge_data)
 
     def get_base_badge(self, badge_id: int) -> BaseBadge:
@@ -533,7 +751,7 @@ class Client:
         Returns:
             A BaseBadge.
         """
-        return BaseBadge(client=self, badge_id=badge_id)
+        return self._get_base_item(BaseBadge, badge_id)
 
     # Gamepasses
     def get_base_gamepass(self, gamepass_id: int) -> BaseGamePass:
@@ -549,4 +767,4 @@ class Client:
 
         Returns: A BaseGamePass.
         """
-        return BaseGamePass(client=self, gamepass_id=gamepass_id)
+        return self._get_base_item(BaseGamePass, gamepass_id)
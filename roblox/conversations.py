@@ -9,7 +9,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from datetime import datetime
-from dateutil.parser import parse
 
 from enum import Enum
 from typing import List, Optional
@@ -17,6 +16,7 @@ from typing import List, Optional
 from .bases.baseconversation import BaseConversation
 from .partials.partialuniverse import ChatPartialUniverse
 from .partials.partialuser import PartialUser
+from .utilities.datetimes import parse_datetime
 
 if TYPE_CHECKING:
     from .client import Client
@@ -79,8 +79,8 @@ class Conversation(BaseConversation):
             client: The Client object.
             data: The conversation data.
         """
-        super().__init__(client=client, conversation_id=self.id)
         self.id: int = data["id"]
+        super().__init__(client=client, conversation_id=self.id)
         self.title: str = data["title"]
 
         # Technically the initiator could be a group, but in practice that doesn't happen
@@ -99,7 +99,7 @@ class Conversation(BaseConversation):
         self.conversation_title: ConversationTitle = ConversationTitle(
             data=data["conversationTitle"]
         )
-        self.last_updated: datetime = parse(data["lastUpdated"])
+        self.last_updated: datetime = parse_datetime(data["lastUpdated"])
         self.conversation_universe: Optional[ChatPartialUniverse] = data[
                                                                         "conversationUniverse"] and ChatPartialUniverse(
             client=client,
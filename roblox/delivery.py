@@ -4,8 +4,13 @@ Contains classes and functions related to Roblox asset delivery.
 
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
 
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, Iterable, List, Optional, Union, TYPE_CHECKING
+
+from .utilities.bulk import BulkReport, BulkResult, run_bulk
 from .utilities.url import cdn_site
 
 if TYPE_CHECKING:
@@ -22,10 +27,41 @@ def get_cdn_number(cdn_hash: str) -> int:
     Returns: 
         The CDN number for the supplied cdn_hash.
     """
-    i = 31
-    for char in cdn_hash[:32]:
-        i ^= ord(char)  # i ^= int(char, 16) also works
-    return i % 8
+    try:
+        # latin-1 maps every character below 256 to a byte with the same value as its ord()
+        value = int.from_bytes(cdn_hash[:32].encode("latin-1"), "little")
+    except UnicodeEncodeError:
+        i = 31
+        for char in cdn_hash[:32]:
+            i ^= ord(char)  # i ^= int(char, 16) also works
+        return i % 8
+
+    # the characters are XORed together by folding their bytes onto each other, which is much faster than XORing
+    # them one at a time. only the lowest three bits of the result are used
+    value ^= value >> 128
+    value ^= value >> 64
+    value ^= value >> 32
+    value ^= value >> 16
+    value ^= value >> 8
+    return (31 ^ value) & 7
+
+
+def get_cdn_urls(cdn_hashes: Iterable[str], prefix: str, site: str = cdn_site, protocol: str = "https") -> List[str]:
+    """
+    Builds the CDN URLs of many CDN hashes at once.
+
+    Arguments:
+        cdn_hashes: The CDN hashes.
+        prefix: The CDN's subdomain prefix, "t" for thumbnails or "c" for content.
+        site: The site the CDN is located at.
+        protocol: The URL protocol.
+
+    Returns:
+        The URL of each CDN hash, in the same order.
+    """
+    # there are only 8 CDN subdomains, so their roots are built once up front
+    roots = [f"{protocol}://{prefix}{cdn_number}.{site}/" for cdn_number in range(8)]
+    return [roots[get_cdn_number(cdn_hash)] + cdn_hash for cdn_hash in cdn_hashes]
 
 
 class BaseCDNHash:
@@ -45,19 +81,21 @@ class BaseCDNHash:
 
         self._client: Client = client
         self.cdn_hash: str = cdn_hash
+        self._cdn_number: Optional[int] = None
 
     def __repr__(self):
         return f"<{self.__class__.__name__} cdn_hash={self.cdn_hash}>"
 
     def get_cdn_number(self) -> int:
         """
-        Returns the CDN number of this CDN hash.
+        Returns the CDN number of this CDN hash. It is only computed the first time this is called.
 
         Returns:
             The computed number of the given cdn_hash
         """
-
-        return get_cdn_number(self.cdn_hash)
+        if self._cdn_number is None:
+            self._cdn_number = get_cdn_number(self.cdn_hash)
+        return self._cdn_number
 
     def _get_url(self, prefix: str, site: str = cdn_site) -> str:
         cdn_number: int = self.get_cdn_number()
@@ -110,6 +148,104 @@ class ContentCDNHash(BaseCDNHash):
         return self._get_url("c", cdn_site)
 
 
+class CDNStore:
+    """
+    A local, content-addressed store for files downloaded from Roblox's CDNs.
+    Each file is stored at `root/<first two characters of its hash>/<hash>`. The file behind a CDN hash never
+    changes, so a hash that is already in the store is never downloaded again.
+
+    ```python
+    store = CDNStore("cdn")
+    path = await client.delivery.download(thumbnail_cdn_hash, store)
+    ```
+
+    Attributes:
+        root: The directory files are stored in.
+        downloads: How many files have been downloaded into the store.
+        hits: How many downloads were skipped because the file was already stored or being downloaded.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike]):
+        """
+        Arguments:
+            root: The directory to store files in. It is created when the first file is stored.
+        """
+        self.root: Path = Path(root)
+        self.downloads: int = 0
+        self.hits: int = 0
+
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} root={str(self.root)!r} downloads={self.downloads} hits={self.hits}>"
+
+    def __contains__(self, cdn_hash: str) -> bool:
+        return self.get_path(cdn_hash).is_file()
+
+    def get_path(self, cdn_hash: str) -> Path:
+        """
+        Gets the path a CDN hash is stored at, whether or not it is stored.
+
+        Arguments:
+            cdn_hash: The CDN hash.
+
+        Returns:
+            The path.
+        """
+        # hashes are used as file names, so anything that could escape the store is rejected
+        if not cdn_hash.isalnum():
+            raise ValueError(f"Invalid CDN hash {cdn_hash!r}.")
+        return self.root / cdn_hash[:2] / cdn_hash
+
+    async def add(self, cdn_hash: str, writer: Callable[[BinaryIO], Awaitable[Any]]) -> Path:
+        """
+        Stores a file unless it is already stored. Concurrent calls for the same hash share one write, which runs
+        in its own task, so cancelling one of the callers doesn't cancel the write for the others.
+        The file is written to a temporary path first and only moved into place once it is complete, so an
+        interrupted write never leaves a partial file in the store.
+
+        Arguments:
+            cdn_hash: The CDN hash.
+            writer: A coroutine function that writes the file's contents to the file object it is passed.
+
+        Returns:
+            The path the file is stored at.
+        """
+        path = self.get_path(cdn_hash)
+
+        task = self._in_flight.get(cdn_hash)
+        if task is not None:
+            self.hits += 1
+        elif path.is_file():
+            self.hits += 1
+            return path
+        else:
+            task = self._in_flight[cdn_hash] = asyncio.ensure_future(self._write(cdn_hash, path, writer))
+            # every caller may have been cancelled by the time the write fails
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+        return await asyncio.shield(task)
+
+    async def _write(self, cdn_hash: str, path: Path, writer: Callable[[BinaryIO], Awaitable[Any]]) -> Path:
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.{id(asyncio.current_task())}.part")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, "wb") as file:
+                await writer(file)
+            os.replace(temporary_path, path)
+        except BaseException:
+            try:
+                temporary_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+        finally:
+            del self._in_flight[cdn_hash]
+
+        self.downloads += 1
+        return path
+
+
 class DeliveryProvider:
     """
     Provides CDN hashes and other delivery-related objects.
@@ -170,6 +306,36 @@ class DeliveryProvider:
             cdn_hash=cdn_hash
         )
 
+    def get_thumbnail_cdn_urls(self, cdn_hashes: Iterable[Union[str, ThumbnailCDNHash]]) -> List[str]:
+        """
+        Builds the tX.rbxcdn.com URLs of many CDN hashes at once, without creating a CDN hash object for each.
+
+        Arguments:
+            cdn_hashes: The CDN hashes, as strings or ThumbnailCDNHashes.
+
+        Returns:
+            The URL of each CDN hash, in the same order.
+        """
+        return get_cdn_urls(
+            (cdn_hash.cdn_hash if isinstance(cdn_hash, BaseCDNHash) else cdn_hash for cdn_hash in cdn_hashes),
+            prefix="t"
+        )
+
+    def get_content_cdn_urls(self, cdn_hashes: Iterable[Union[str, ContentCDNHash]]) -> List[str]:
+        """
+        Builds the cX.rbxcdn.com URLs of many CDN hashes at once, without creating a CDN hash object for each.
+
+        Arguments:
+            cdn_hashes: The CDN hashes, as strings or ContentCDNHashes.
+
+        Returns:
+            The URL of each CDN hash, in the same order.
+        """
+        return get_cdn_urls(
+            (cdn_hash.cdn_hash if isinstance(cdn_hash, BaseCDNHash) else cdn_hash for cdn_hash in cdn_hashes),
+            prefix="c"
+        )
+
     def get_content_cdn_hash(self, cdn_hash: str) -> ContentCDNHash:
         """
         Gets a Roblox CDN cdn_hash.
@@ -185,3 +351,52 @@ class DeliveryProvider:
             client=self._client,
             cdn_hash=cdn_hash
         )
+
+    async def download(self, cdn_hash: BaseCDNHash, store: CDNStore, chunk_size: int = 65536) -> Path:
+        """
+        Downloads the file behind a CDN hash into a store, unless the store already has it.
+        The file is written to disk in chunks while it is downloaded.
+
+        Arguments:
+            cdn_hash: A ThumbnailCDNHash or ContentCDNHash.
+            store: The store to download the file into.
+            chunk_size: The size, in bytes, of the chunks the file is read in.
+
+        Returns:
+            The path the file is stored at.
+        """
+        return await store.add(
+            cdn_hash=cdn_hash.cdn_hash,
+            writer=lambda file: self._client.requests.download(cdn_hash.get_url(), file, chunk_size=chunk_size)
+        )
+
+    async def download_many(
+            self,
+            cdn_hashes: Iterable[BaseCDNHash],
+            store: CDNStore,
+            concurrency: int = 10,
+            retries: int = 3,
+            progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None
+    ) -> BulkReport:
+        """
+        Downloads the files behind many CDN hashes into a store at once, skipping hashes the store already has.
+        Failures don't stop the other downloads - check the report to see which hashes failed and why.
+
+        Arguments:
+            cdn_hashes: ThumbnailCDNHashes or ContentCDNHashes.
+            store: The store to download the files into.
+            concurrency: The maximum amount of downloads running at the same time.
+            retries: How many times to retry a download after a rate limit, server or network error.
+            progress: A callable that is called with each hash's result and the report as soon as it is done.
+
+        Returns:
+            A report with one result per hash. Use store.get_path to find where each file was stored.
+        """
+        return await run_bulk(
+            items=cdn_hashes,
+            operation=lambda cdn_hash: self.download(cdn_hash, store),
+            concurrency=concurrency,
+            retries=retries,
+            progress=progress,
+            idempotent=True
+        )
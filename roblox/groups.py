@@ -76,7 +76,7 @@ class Group(BaseGroup):
             }
         )
 
-        shout_data = shout_response.json()
+        shout_data = self._client.requests.read_json(shout_response)
 
         old_shout: Optional[Shout] = self.shout
         new_shout: Optional[Shout] = shout_data and Shout(
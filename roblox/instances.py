@@ -57,7 +57,7 @@ class AssetInstance(ItemInstance):
         self._client: Client = client
         super().__init__(client=self._client, data=data)
 
-        self.asset: BaseAsset = BaseAsset(client=self._client, asset_id=data["id"])
+        self.asset: BaseAsset = self._client.get_base_asset(data["id"])
 
 
 class BadgeInstance(ItemInstance):
@@ -69,7 +69,7 @@ class BadgeInstance(ItemInstance):
         self._client: Client = client
         super().__init__(client=self._client, data=data)
 
-        self.badge: BaseBadge = BaseBadge(client=self._client, badge_id=data["id"])
+        self.badge: BaseBadge = self._client.get_base_badge(data["id"])
 
 
 class GamePassInstance(ItemInstance):
@@ -81,7 +81,7 @@ class GamePassInstance(ItemInstance):
         self._client: Client = client
         super().__init__(client=self._client, data=data)
 
-        self.gamepass: BaseGamePass = BaseGamePass(client=self._client, gamepass_id=data["id"])
+        self.gamepass: BaseGamePass = self._client.get_base_gamepass(data["id"])
 
 
 instance_classes = {
@@ -97,7 +97,7 @@ class GameInstance(BaseJob):
         self.ping: int = data["Ping"]
         self.fps: float = data["Fps"]
         self.show_slow_game_message: bool = data["ShowSlowGameMessage"]
-        self.place: BasePlace = BasePlace(client=self._client, place_id=data["PlaceId"])
+        self.place: BasePlace = self._client.get_base_place(data["PlaceId"])
 
         self.current_players: List[GameInstancePlayer] = [
             GameInstancePlayer(
@@ -131,7 +131,7 @@ class GameInstances:
     def __init__(self, client: Client, data: dict):
         self._client: Client = client
 
-        self.place: BasePlace = BasePlace(client=self._client, place_id=data["PlaceId"])
+        self.place: BasePlace = self._client.get_base_place(data["PlaceId"])
         self.show_shutdown_all_button: bool = data["ShowShutdownAllButton"]
         self.is_game_instance_list_unavailable: bool = data["IsGameInstanceListUnavailable"]
         self.collection: List[GameInstance] = [
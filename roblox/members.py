@@ -25,6 +25,8 @@ class MemberRelationship(BaseUser):
         group: The corresponding group.
     """
 
+    __slots__ = ("group",)
+
     def __init__(self, client: Client, user: Union[BaseUser, int], group: Union[BaseGroup, int]):
         self._client: Client = client
         super().__init__(client=self._client, user_id=int(user))
@@ -32,7 +34,7 @@ class MemberRelationship(BaseUser):
         self.group: BaseGroup
 
         if isinstance(group, int):
-            self.group = BaseGroup(client=self._client, group_id=group)
+            self.group = self._client.get_base_group(group)
         else:
             self.group = group
 
@@ -80,6 +82,8 @@ class Member(MemberRelationship):
         has_verified_badge: If the member has a verified badge.
     """
 
+    __slots__ = ("name", "display_name", "has_verified_badge", "role")
+
     def __init__(self, client: Client, data: dict, group: BaseGroup):
         self._client: Client = client
 
@@ -7,9 +7,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from datetime import datetime
-from dateutil.parser import parse
 
 from ..bases.basebadge import BaseBadge
+from ..utilities.datetimes import parse_datetime
 
 if TYPE_CHECKING:
     from ..client import Client
@@ -26,6 +26,8 @@ class PartialBadge(BaseBadge):
         awarded: The date when the badge was awarded.
     """
 
+    __slots__ = ("awarded",)
+
     def __init__(self, client: Client, data: dict):
         """
         Arguments:
@@ -38,4 +40,4 @@ class PartialBadge(BaseBadge):
 
         super().__init__(client=client, badge_id=self.id)
 
-        self.awarded: datetime = parse(data["awardedDate"])
+        self.awarded: datetime = parse_datetime(data["awardedDate"])
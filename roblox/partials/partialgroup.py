@@ -26,6 +26,8 @@ class AssetPartialGroup(BaseGroup):
         has_verified_badge: If the group has a verified badge.
     """
 
+    __slots__ = ("creator", "name", "has_verified_badge")
+
     def __init__(self, client: Client, data: dict):
         """
         Arguments:
@@ -34,7 +36,7 @@ class AssetPartialGroup(BaseGroup):
         """
         self._client: Client = client
 
-        self.creator: BaseUser = BaseUser(client=client, user_id=data["Id"])
+        self.creator: BaseUser = client.get_base_user(data["Id"])
         self.id: int = data["CreatorTargetId"]
         self.name: str = data["Name"]
         self.has_verified_badge: bool = data["HasVerifiedBadge"]
@@ -54,6 +56,8 @@ class UniversePartialGroup(BaseGroup):
         has_verified_badge: If the group has a verified badge.
     """
 
+    __slots__ = ("name", "has_verified_badge")
+
     def __init__(self, client: Client, data: dict):
         """
         Arguments:
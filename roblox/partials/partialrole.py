@@ -23,6 +23,8 @@ class PartialRole(BaseRole):
         rank: The role's rank ID.
     """
 
+    __slots__ = ("name", "rank")
+
     def __init__(self, client: Client, data: dict):
         self._client: Client = client
 
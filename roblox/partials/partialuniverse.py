@@ -24,6 +24,8 @@ class PartialUniverse(BaseUniverse):
         root_place: The universe's root place.
     """
 
+    __slots__ = ("name", "root_place")
+
     def __init__(self, client: Client, data: dict):
         """
         Arguments:
@@ -37,7 +39,7 @@ class PartialUniverse(BaseUniverse):
         super().__init__(client=client, universe_id=self.id)
 
         self.name: str = data["name"]
-        self.root_place: BasePlace = BasePlace(client=client, place_id=data["rootPlaceId"])
+        self.root_place: BasePlace = client.get_base_place(data["rootPlaceId"])
 
 
 class ChatPartialUniverse(BaseUniverse):
@@ -51,6 +53,8 @@ class ChatPartialUniverse(BaseUniverse):
         root_place: The universe's root place.
     """
 
+    __slots__ = ("root_place",)
+
     def __init__(self, client: Client, data: dict):
         """
         Arguments:
@@ -63,4 +67,4 @@ class ChatPartialUniverse(BaseUniverse):
 
         super().__init__(client=client, universe_id=self.id)
 
-        self.root_place: BasePlace = BasePlace(client=client, place_id=data["rootPlaceId"])
+        self.root_place: BasePlace = client.get_base_place(data["rootPlaceId"])
@@ -24,6 +24,8 @@ class PartialUser(BaseUser):
         has_verified_badge: If the user has a verified badge.
     """
 
+    __slots__ = ("name", "display_name", "has_verified_badge")
+
     def __init__(self, client: Client, data: dict):
         """
         Arguments:
@@ -49,6 +51,8 @@ class RequestedUsernamePartialUser(PartialUser):
         requested_username: The requested username.
     """
 
+    __slots__ = ("requested_username",)
+
     def __init__(self, client: Client, data: dict):
         """
         Arguments:
@@ -67,6 +71,8 @@ class PreviousUsernamesPartialUser(PartialUser):
         previous_usernames: A list of the user's previous usernames.
     """
 
+    __slots__ = ("previous_usernames",)
+
     def __init__(self, client: Client, data: dict):
         """
         Arguments:
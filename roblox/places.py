@@ -51,8 +51,8 @@ class Place(BasePlace):
 
         self.is_playable: bool = data["isPlayable"]
         self.reason_prohibited: str = data["reasonProhibited"]
-        self.universe: BaseUniverse = BaseUniverse(client=self._client, universe_id=data["universeId"])
-        self.universe_root_place: BasePlace = BasePlace(client=self._client, place_id=data["universeRootPlaceId"])
+        self.universe: BaseUniverse = self._client.get_base_universe(data["universeId"])
+        self.universe_root_place: BasePlace = self._client.get_base_place(data["universeRootPlaceId"])
 
         self.price: int = data["price"]
         self.image_token: str = data["imageToken"]
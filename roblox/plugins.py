@@ -9,9 +9,8 @@ if TYPE_CHECKING:
     from .client import Client
 from datetime import datetime
 
-from dateutil.parser import parse
-
 from .bases.baseplugin import BasePlugin
+from .utilities.datetimes import parse_datetime
 
 
 class Plugin(BasePlugin):
@@ -42,5 +41,5 @@ class Plugin(BasePlugin):
         self.description: str = data["description"]
         self.comments_enabled: bool = data["commentsEnabled"]
         self.version_id: int = data["versionId"]
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
+        self.created: datetime = parse_datetime(data["created"])
+        self.updated: datetime = parse_datetime(data["updated"])
@@ -0,0 +1,458 @@
+"""
+
+Contains the ClientPool, which spreads requests across several sessions, each with its own account, proxy and rate
+limits.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from enum import Enum
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set
+
+from httpx import AsyncClient, Response
+
+from .client import Client
+from .utilities.cache import ResponseCache
+from .utilities.exceptions import TooManyRequests, Unauthorized
+from .utilities.instrumentation import Instrumentation
+from .utilities.jsoncodec import JSONCodec
+from .utilities.ratelimit import RateLimiter, _parse_retry_after
+from .utilities.requests import CleanAsyncClient, Requests
+from .utilities.transport import TransportSettings
+
+
+# Client arguments that each PoolSession has its own of.
+_per_session_arguments = ("rate_limiter", "transport", "session")
+
+
+class PoolStrategy(Enum):
+    """
+    How a ClientPool picks the session to send each request with.
+    """
+
+    round_robin = "round_robin"
+    least_loaded = "least_loaded"
+
+
+class PoolSession:
+    """
+    Represents one session in a ClientPool.
+
+    Attributes:
+        name: A name to tell this session apart in logs and reprs.
+        requests: The requests object this session sends requests with.
+        in_flight: How many requests this session is currently sending.
+        sent: How many requests this session has sent.
+        failures: How many requests this session has been cooled down for.
+        cooldown_until: The monotonic time at which this session can be used again.
+    """
+
+    def __init__(
+            self,
+            token: Optional[str] = None,
+            proxy: Optional[str] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            transport: Optional[TransportSettings] = None,
+            name: Optional[str] = None
+    ):
+        """
+        Arguments:
+            token: A .ROBLOSECURITY token to authenticate this session with.
+            proxy: The URL of a proxy to send this session's requests through.
+            rate_limiter: A rate limiter for this session's own budget.
+            transport: Connection settings for this session.
+            name: A name to tell this session apart in logs and reprs.
+        """
+        self.name: Optional[str] = name
+        self._token: Optional[str] = token
+        self._proxy: Optional[str] = proxy
+        self._rate_limiter: Optional[RateLimiter] = rate_limiter
+        self._transport: TransportSettings = transport or TransportSettings()
+
+        self.requests: Optional[Requests] = None
+
+        self.in_flight: int = 0
+        self.sent: int = 0
+        self.failures: int = 0
+        self.cooldown_until: float = 0
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} name={self.name!r} in_flight={self.in_flight} sent={self.sent}>"
+
+    def open(
+            self,
+            cache: Optional[ResponseCache],
+            json_codec: JSONCodec,
+            instrumentation: Optional[Instrumentation] = None,
+            xcsrf_token_url: str = "https://auth.roblox.com/v2/logout"
+    ):
+        """
+        Creates this session's requests object. This is called by the ClientPool the session is added to.
+
+        Arguments:
+            cache: The response cache shared by the pool.
+            json_codec: The JSON codec shared by the pool.
+            instrumentation: The instrumentation shared by the pool.
+            xcsrf_token_url: The endpoint to fetch X-CSRF tokens from, on the pool's base URL.
+        """
+        self.requests = Requests(
+            session=CleanAsyncClient(**self._transport.get_session_options(proxy=self._proxy)),
+            cache=cache,
+            rate_limiter=self._rate_limiter,
+            json_codec=json_codec,
+            xcsrf_token_url=xcsrf_token_url,
+            instrumentation=instrumentation
+        )
+        if self._token:
+            self.set_token(self._token)
+
+    def set_token(self, token: Optional[str] = None):
+        """
+        Authenticates this session with the passed .ROBLOSECURITY token.
+
+        Arguments:
+            token: A .ROBLOSECURITY token.
+        """
+        self._token = token
+        if self.requests is not None:
+            self.requests.session.cookies[".ROBLOSECURITY"] = token
+            self.requests.xcsrf_tokens.invalidate()
+
+    def is_available(self, now: float) -> bool:
+        """
+        Returns whether this session is out of its cooldown.
+
+        Arguments:
+            now: The current monotonic time.
+        """
+        return now >= self.cooldown_until
+
+    def cool_down(self, seconds: float):
+        """
+        Stops the pool from picking this session for a number of seconds.
+
+        Arguments:
+            seconds: How long to cool down for.
+        """
+        self.failures += 1
+        self.cooldown_until = max(self.cooldown_until, time.monotonic() + seconds)
+
+
+class PooledRequests:
+    """
+    A requests object that sends each request with one of a pool's sessions.
+    Sessions that are rate limited or unauthorized are cooled down and the request is sent again with another one.
+    It has no session of its own - each session's Requests handles its own cookies, X-CSRF token and rate limits.
+
+    Attributes:
+        json_codec: The codec used to decode JSON responses, shared by every session.
+        sessions: The pool's sessions.
+        strategy: How the session for each request is picked.
+        throttle_cooldown: How long, in seconds, a session is skipped for after a 429 without a Retry-After header.
+        unauthorized_cooldown: How long, in seconds, a session is skipped for after a 401.
+    """
+
+    def __init__(
+            self,
+            sessions: List[PoolSession],
+            strategy: PoolStrategy = PoolStrategy.round_robin,
+            throttle_cooldown: float = 30,
+            unauthorized_cooldown: float = 300,
+            cache: Optional[ResponseCache] = None,
+            json_codec: Optional[JSONCodec] = None,
+            instrumentation: Optional[Instrumentation] = None,
+            xcsrf_token_url: str = "https://auth.roblox.com/v2/logout"
+    ):
+        """
+        Arguments:
+            sessions: The pool's sessions.
+            strategy: How the session for each request is picked.
+            throttle_cooldown: How long, in seconds, a session is skipped for after a 429 without a Retry-After header.
+            unauthorized_cooldown: How long, in seconds, a session is skipped for after a 401.
+            cache: A response cache shared by every session.
+            json_codec: A JSON codec shared by every session.
+            instrumentation: An instrumentation shared by every session.
+            xcsrf_token_url: The endpoint sessions fetch X-CSRF tokens from.
+        """
+        self.json_codec: JSONCodec = json_codec or JSONCodec()
+
+        self.sessions: List[PoolSession] = sessions
+        self.strategy: PoolStrategy = strategy
+        self.throttle_cooldown: float = throttle_cooldown
+        self.unauthorized_cooldown: float = unauthorized_cooldown
+
+        self._next_index: int = 0
+
+        for session in self.sessions:
+            session.open(
+                cache=cache,
+                json_codec=self.json_codec,
+                instrumentation=instrumentation,
+                xcsrf_token_url=xcsrf_token_url
+            )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} sessions={len(self.sessions)} strategy={self.strategy.value}>"
+
+    def _pick(self, excluded: Set[PoolSession]) -> Optional[PoolSession]:
+        now = time.monotonic()
+        count = len(self.sessions)
+        # walk the sessions starting after the last one picked, so ties are broken round-robin
+        candidates = [
+            self.sessions[(self._next_index + offset) % count]
+            for offset in range(count)
+        ]
+        candidates = [
+            session for session in candidates
+            if session not in excluded and session.is_available(now)
+        ]
+        if not candidates:
+            return None
+
+        if self.strategy == PoolStrategy.least_loaded:
+            session = min(candidates, key=lambda candidate: candidate.in_flight)
+        else:
+            session = candidates[0]
+
+        self._next_index = (self.sessions.index(session) + 1) % count
+        return session
+
+    async def _get_session(self) -> PoolSession:
+        while True:
+            session = self._pick(set())
+            if session is not None:
+                return session
+
+            # every session is cooling down, so wait for the first one to come back
+            await asyncio.sleep(max(0.0, min(session.cooldown_until for session in self.sessions) - time.monotonic()))
+
+    def _cool_down(self, session: PoolSession, exception: Exception):
+        if isinstance(exception, TooManyRequests):
+            retry_after = _parse_retry_after(exception.response.headers.get("Retry-After"))
+            session.cool_down(self.throttle_cooldown if retry_after is None else retry_after)
+        else:
+            session.cool_down(self.unauthorized_cooldown)
+
+    async def _dispatch(self, send: Callable[[Requests], Any]) -> Any:
+        session = await self._get_session()
+        excluded: Set[PoolSession] = set()
+
+        while True:
+            current = session
+            current.in_flight += 1
+            current.sent += 1
+            try:
+                return await send(current.requests)
+            except (TooManyRequests, Unauthorized) as exception:
+                self._cool_down(current, exception)
+                excluded.add(current)
+                session = self._pick(excluded)
+                if session is None:
+                    # there's no session left that hasn't failed this request and isn't cooling down
+                    raise
+            finally:
+                current.in_flight -= 1
+
+    async def request(self, method: str, *args, **kwargs) -> Response:
+        """
+        Sends a request with one of the pool's sessions.
+
+        Arguments:
+            method: The request method.
+
+        Returns:
+            An HTTP response.
+        """
+        return await self._dispatch(lambda requests: requests.request(method, *args, **kwargs))
+
+    async def stream(
+            self,
+            method: str,
+            url: str,
+            item_handler: Callable[[Any], None],
+            array_key: Optional[str] = "data",
+            **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Sends a streamed request with one of the pool's sessions. See Requests.stream.
+
+        Arguments:
+            method: The request method.
+            url: The request URL.
+            item_handler: A callable that is passed each decoded array item in order.
+            array_key: The top-level key of the array to stream, or None if the body itself is an array.
+
+        Returns:
+            The body's other top-level values, like page cursors.
+        """
+        return await self._dispatch(
+            lambda requests: requests.stream(method, url, item_handler=item_handler, array_key=array_key, **kwargs)
+        )
+
+    async def download(self, url: str, file: BinaryIO, chunk_size: int = 65536, **kwargs) -> int:
+        """
+        Downloads a URL into a file with one of the pool's sessions. See Requests.download.
+
+        Arguments:
+            url: The URL to download.
+            file: A file opened in binary write mode.
+            chunk_size: The size, in bytes, of the chunks the body is read in.
+
+        Returns:
+            The amount of bytes written.
+        """
+        return await self._dispatch(
+            lambda requests: requests.download(url, file, chunk_size=chunk_size, **kwargs)
+        )
+
+    def read_json(self, response: Response) -> Any:
+        """
+        Decodes a JSON response with the pool's codec.
+
+        Arguments:
+            response: The response.
+
+        Returns:
+            The decoded body.
+        """
+        return self.json_codec.loads(response.content)
+
+    async def get(self, *args, **kwargs) -> Response:
+        """
+        Sends a GET request with one of the pool's sessions.
+
+        Returns:
+            An HTTP response.
+        """
+        return await self.request("GET", *args, **kwargs)
+
+    async def post(self, *args, **kwargs) -> Response:
+        """
+        Sends a POST request with one of the pool's sessions.
+
+        Returns:
+            An HTTP response.
+        """
+        return await self.request("POST", *args, **kwargs)
+
+    async def put(self, *args, **kwargs) -> Response:
+        """
+        Sends a PUT request with one of the pool's sessions.
+
+        Returns:
+            An HTTP response.
+        """
+        return await self.request("PUT", *args, **kwargs)
+
+    async def patch(self, *args, **kwargs) -> Response:
+        """
+        Sends a PATCH request with one of the pool's sessions.
+
+        Returns:
+            An HTTP response.
+        """
+        return await self.request("PATCH", *args, **kwargs)
+
+    async def delete(self, *args, **kwargs) -> Response:
+        """
+        Sends a DELETE request with one of the pool's sessions.
+
+        Returns:
+            An HTTP response.
+        """
+        return await self.request("DELETE", *args, **kwargs)
+
+
+class ClientPool(Client):
+    """
+    A Client which spreads its requests across several sessions, each with its own account, proxy and rate limits.
+    Sessions that are being rate limited or return 401 are skipped for a while and the request is sent again with
+    another session.
+
+    ```python
+    pool = ClientPool(
+        sessions=[
+            PoolSession(token=first_token, proxy="http://10.0.0.1:8080", rate_limiter=RateLimiter(rate=5)),
+            PoolSession(token=second_token, proxy="http://10.0.0.2:8080", rate_limiter=RateLimiter(rate=5)),
+        ],
+        strategy=PoolStrategy.least_loaded
+    )
+    user = await pool.get_user(1)
+    ```
+
+    Attributes:
+        sessions: The pool's sessions.
+        requests: The PooledRequests that hands each request to one of the sessions.
+    """
+
+    def __init__(
+            self,
+            sessions: List[PoolSession],
+            strategy: PoolStrategy = PoolStrategy.round_robin,
+            throttle_cooldown: float = 30,
+            unauthorized_cooldown: float = 300,
+            cache: Optional[ResponseCache] = None,
+            **kwargs
+    ):
+        """
+        Arguments:
+            sessions: The sessions to spread requests across.
+            strategy: How the session for each request is picked.
+            throttle_cooldown: How long, in seconds, a session is skipped for after a 429 without a Retry-After header.
+            unauthorized_cooldown: How long, in seconds, a session is skipped for after a 401.
+            cache: A response cache shared by every session. Responses to authenticated requests are cached per
+                   account, so sessions with different accounts never see each other's responses.
+            **kwargs: Any other Client arguments, except rate_limiter, transport and session which are set per
+                      session instead. A token passed here authenticates every session.
+        """
+        if not sessions:
+            raise ValueError("A ClientPool needs at least one session.")
+        for name in _per_session_arguments:
+            if name in kwargs:
+                raise TypeError(f"{name} is set on each PoolSession instead of on the ClientPool.")
+
+        # these are set first as the Client creates its requests object and sets its token through our overrides
+        self.sessions: List[PoolSession] = sessions
+        self._strategy: PoolStrategy = strategy
+        self._throttle_cooldown: float = throttle_cooldown
+        self._unauthorized_cooldown: float = unauthorized_cooldown
+
+        super().__init__(cache=cache, **kwargs)
+
+    def _create_requests(
+            self,
+            session: Optional[AsyncClient],
+            transport: Optional[TransportSettings],
+            cache: Optional[ResponseCache],
+            rate_limiter: Optional[RateLimiter],
+            json_codec: JSONCodec,
+            instrumentation: Optional[Instrumentation]
+    ) -> PooledRequests:
+        # every request is sent with one of the pool's sessions, so no session of our own is created
+        return PooledRequests(
+            sessions=self.sessions,
+            strategy=self._strategy,
+            throttle_cooldown=self._throttle_cooldown,
+            unauthorized_cooldown=self._unauthorized_cooldown,
+            cache=cache,
+            json_codec=json_codec,
+            instrumentation=instrumentation,
+            xcsrf_token_url=self._url_generator.get_url("auth", "v2/logout")
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} sessions={len(self.sessions)}>"
+
+    def set_token(self, token: Optional[str] = None) -> None:
+        """
+        Authenticates every session in the pool with the passed .ROBLOSECURITY token.
+        To give each session its own account, call set_token on the sessions instead.
+
+        Arguments:
+            token: A .ROBLOSECURITY token to authenticate the sessions with.
+        """
+        for session in self.sessions:
+            session.set_token(token)
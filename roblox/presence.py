@@ -6,22 +6,30 @@ This module contains classes intended to parse and deal with data from Roblox pr
 
 from __future__ import annotations
 
-from datetime import datetime
-from enum import IntEnum
-from typing import Optional, List
+import asyncio
+import inspect
+import time
+from enum import Enum, IntEnum
+from typing import Any, Callable, Dict, Iterable, Optional, List, Tuple
 from typing import TYPE_CHECKING
 
-from dateutil.parser import parse
-
-from .bases.basejob import BaseJob
-from .bases.baseplace import BasePlace
-from .bases.baseuniverse import BaseUniverse
+from .utilities.batching import chunk_list, gather_bounded, gather_chunks
+from .utilities.lazy import LazyAttribute, build_lazy_attributes
 
 if TYPE_CHECKING:
     from .client import Client
+    from .bases.basejob import BaseJob
+    from .bases.baseplace import BasePlace
+    from .bases.baseuniverse import BaseUniverse
     from .bases.baseuser import BaseUser
     from .utilities.types import UserOrUserId
 
+# The maximum amount of user IDs the presence endpoint accepts in a single request.
+_presences_batch_size = 50
+
+# Queued after a watcher's last change once it stops polling, so iterating over it ends.
+_watcher_stopped = object()
+
 
 class PresenceType(IntEnum):
     """
@@ -58,29 +66,303 @@ class Presence:
         self.user_presence_type: PresenceType = PresenceType(data["userPresenceType"])
         self.last_location: str = data["lastLocation"]
 
-        self.place: Optional[BasePlace] = BasePlace(
-            client=client,
-            place_id=data["placeId"]
-        ) if data.get("placeId") else None
+        build_lazy_attributes(self, data, lazy=client.lazy_models)
 
-        self.root_place: Optional[BasePlace] = BasePlace(
-            client=client,
-            place_id=data["rootPlaceId"]
-        ) if data.get("rootPlaceId") else None
+    @LazyAttribute
+    def place(self, data: dict) -> Optional[BasePlace]:
+        return self._client.get_base_place(data["placeId"]) if data.get("placeId") else None
 
-        self.job: Optional[BaseJob] = BaseJob(self._client, data["gameId"]) if data.get("gameId") else None
+    @LazyAttribute
+    def root_place(self, data: dict) -> Optional[BasePlace]:
+        return self._client.get_base_place(data["rootPlaceId"]) if data.get("rootPlaceId") else None
 
-        self.universe: Optional[BaseUniverse] = BaseUniverse(
-            client=client,
-            universe_id=data["universeId"]
-        ) if data.get("universeId") else None
+    @LazyAttribute
+    def job(self, data: dict) -> Optional[BaseJob]:
+        return self._client.get_base_job(data["gameId"]) if data.get("gameId") else None
 
-        self.user: BaseUser = client.get_base_user(data["userId"])
+    @LazyAttribute
+    def universe(self, data: dict) -> Optional[BaseUniverse]:
+        return self._client.get_base_universe(data["universeId"]) if data.get("universeId") else None
+
+    @LazyAttribute
+    def user(self, data: dict) -> BaseUser:
+        return self._client.get_base_user(data["userId"])
 
     def __repr__(self):
         return f"<{self.__class__.__name__} user_presence_type={self.user_presence_type}>"
 
 
+class PresenceChangeType(Enum):
+    """
+    Represents how a user's presence changed.
+    """
+
+    online = "online"
+    offline = "offline"
+    place_changed = "place_changed"
+    type_changed = "type_changed"
+
+
+# the raw presence values a change is detected on
+_PresenceSnapshot = Tuple[int, Optional[int], Optional[int], Optional[str]]
+
+
+def _get_snapshot(presence_data: dict) -> _PresenceSnapshot:
+    return (
+        presence_data["userPresenceType"],
+        presence_data.get("placeId"),
+        presence_data.get("universeId"),
+        presence_data.get("gameId")
+    )
+
+
+class PresenceChange:
+    """
+    Represents a change in a user's presence, detected by a PresenceWatcher.
+
+    Attributes:
+        user: The user whose presence changed.
+        change_type: How the presence changed.
+        previous_type: The user's previous presence type, or None if this is the first time the user was polled.
+        previous_place: The place the user was previously in, if any.
+        presence: The user's new presence.
+    """
+
+    def __init__(self, client: Client, data: dict, previous: Optional[_PresenceSnapshot]):
+        """
+        Arguments:
+            client: The Client this object belongs to.
+            data: The user's new raw presence data.
+            previous: The user's previous presence snapshot.
+        """
+        self._client: Client = client
+
+        self.user: BaseUser = client.get_base_user(data["userId"])
+        self.presence: Presence = Presence(client=client, data=data)
+        self.previous_type: Optional[PresenceType] = PresenceType(previous[0]) if previous else None
+        self.previous_place: Optional[BasePlace] = client.get_base_place(previous[1]) \
+            if previous and previous[1] else None
+
+        if self.presence.user_presence_type == PresenceType.offline:
+            self.change_type: PresenceChangeType = PresenceChangeType.offline
+        elif self.previous_type is None or self.previous_type == PresenceType.offline:
+            self.change_type = PresenceChangeType.online
+        elif previous[1:] != _get_snapshot(data)[1:]:
+            self.change_type = PresenceChangeType.place_changed
+        else:
+            self.change_type = PresenceChangeType.type_changed
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} user={self.user!r} change_type={self.change_type.value!r}>"
+
+
+class PresenceWatcher:
+    """
+    Polls the presence of a set of users on a schedule and reports the users whose presence changed.
+    Users are polled in endpoint-sized batches, and each batch's raw data is compared with the last snapshot, so
+    objects are only built for users whose presence changed.
+
+    Changes are passed to the callback if one is set. Otherwise, they can be read by iterating over the watcher:
+    ```python
+    watcher = client.presence.watch(user_ids, interval=30)
+    async for change in watcher:
+        print(change.user.id, change.change_type)
+    ```
+    Iteration ends once stop is called and the changes that were already queued have been read. Batches that fail
+    are retried on the next poll, but once max_failed_polls polls in a row fail for every batch, like when the
+    client's token is no longer valid, polling stops and the last exception is raised by the iteration.
+
+    Attributes:
+        interval: How long, in seconds, from the start of one poll to the start of the next.
+        concurrency: The maximum amount of batches polled at the same time.
+        callback: A callable, or coroutine function, that is passed each change instead of queueing it.
+        emit_initial: Whether users' first polled presences are reported as changes too.
+        max_failed_polls: How many polls in a row can fail for every batch before polling stops.
+        polls: How many polls have been completed.
+        failures: How many batches have failed to be polled. Their users keep their last snapshot.
+        failed_polls: How many polls in a row have failed for every batch.
+        last_exception: The exception the last failed batch raised, if any.
+    """
+
+    def __init__(
+            self,
+            client: Client,
+            users: Iterable[UserOrUserId],
+            interval: float = 30,
+            concurrency: int = 10,
+            callback: Optional[Callable[[PresenceChange], Any]] = None,
+            emit_initial: bool = False,
+            max_failed_polls: int = 3
+    ):
+        """
+        Arguments:
+            client: The Client this object belongs to.
+            users: The users to watch.
+            interval: How long, in seconds, from the start of one poll to the start of the next.
+            concurrency: The maximum amount of batches polled at the same time.
+            callback: A callable, or coroutine function, that is passed each change instead of queueing it.
+            emit_initial: Whether users' first polled presences are reported as changes too.
+            max_failed_polls: How many polls in a row can fail for every batch before polling stops.
+        """
+        self._client: Client = client
+
+        self.interval: float = interval
+        self.concurrency: int = concurrency
+        self.callback: Optional[Callable[[PresenceChange], Any]] = callback
+        self.emit_initial: bool = emit_initial
+        self.max_failed_polls: int = max_failed_polls
+
+        self.polls: int = 0
+        self.failures: int = 0
+        self.failed_polls: int = 0
+        self.last_exception: Optional[Exception] = None
+
+        # dicts keep the users in the order they were added, and hold None until a user is first polled
+        self._snapshots: Dict[int, Optional[_PresenceSnapshot]] = dict.fromkeys(map(int, users))
+        self._changes: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} users={len(self._snapshots)} polls={self.polls}>"
+
+    def add_users(self, users: Iterable[UserOrUserId]):
+        """
+        Starts watching more users.
+
+        Arguments:
+            users: The users to watch.
+        """
+        for user_id in map(int, users):
+            self._snapshots.setdefault(user_id, None)
+
+    def remove_users(self, users: Iterable[UserOrUserId]):
+        """
+        Stops watching users.
+
+        Arguments:
+            users: The users to stop watching.
+        """
+        for user_id in map(int, users):
+            self._snapshots.pop(user_id, None)
+
+    async def poll(self) -> List[PresenceChange]:
+        """
+        Polls every watched user's presence once.
+
+        Returns:
+            The changes since the last poll.
+        """
+        chunks = chunk_list(list(self._snapshots), _presences_batch_size)
+        results = await gather_bounded(
+            (self._client.presence._get_presences_data(chunk) for chunk in chunks),
+            limit=self.concurrency,
+            return_exceptions=True
+        )
+
+        changes: List[PresenceChange] = []
+        succeeded = False
+        for result in results:
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                self.failures += 1
+                self.last_exception = result
+                continue
+
+            succeeded = True
+
+            for presence_data in result:
+                user_id = presence_data["userId"]
+                if user_id not in self._snapshots:
+                    # removed while this poll was running
+                    continue
+
+                snapshot = _get_snapshot(presence_data)
+                previous = self._snapshots[user_id]
+                if snapshot == previous:
+                    continue
+
+                self._snapshots[user_id] = snapshot
+                if previous is not None or self.emit_initial:
+                    changes.append(PresenceChange(client=self._client, data=presence_data, previous=previous))
+
+        self.polls += 1
+        if succeeded or not results:
+            self.failed_polls = 0
+        else:
+            self.failed_polls += 1
+        return changes
+
+    def start(self):
+        """
+        Starts polling in the background. Iterating over the watcher starts it automatically.
+        """
+        if self._changes is None:
+            self._changes = asyncio.Queue()
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+            self._task.add_done_callback(self._on_done)
+
+    def stop(self):
+        """
+        Stops polling. Changes that were already queued can still be read, after which iterating over the watcher
+        ends.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._changes.put_nowait(_watcher_stopped)
+
+    def _on_done(self, task: asyncio.Task):
+        if task.cancelled() or task is not self._task:
+            # stopped, and stop already ended the iteration
+            return
+
+        self._task = None
+        exception = task.exception()
+        if exception is not None:
+            # hand the exception to whoever is iterating, instead of leaving them waiting forever
+            self._changes.put_nowait(exception)
+        self._changes.put_nowait(_watcher_stopped)
+
+    async def _run(self):
+        while True:
+            started = time.monotonic()
+
+            changes = await self.poll()
+            if self.failed_polls >= self.max_failed_polls:
+                # every batch keeps failing, which retrying won't fix - _on_done hands this to the iterator
+                raise self.last_exception
+
+            for change in changes:
+                if self.callback is None:
+                    self._changes.put_nowait(change)
+                    continue
+                result = self.callback(change)
+                if inspect.isawaitable(result):
+                    await result
+
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def __aiter__(self):
+        self.start()
+        return self
+
+    async def __anext__(self) -> PresenceChange:
+        while True:
+            change = await self._changes.get()
+            if change is _watcher_stopped:
+                if self._task is not None:
+                    # started again since this was queued
+                    continue
+                # leave it queued, so later calls end straight away too
+                self._changes.put_nowait(_watcher_stopped)
+                raise StopAsyncIteration
+            if isinstance(change, BaseException):
+                raise change
+            return change
+
+
 class PresenceProvider:
     """
     The PresenceProvider is an object that represents https://presence.roblox.com/ and provides multiple functions
@@ -90,22 +372,65 @@ class PresenceProvider:
     def __init__(self, client: Client):
         self._client: Client = client
 
-    async def get_user_presences(self, users: List[UserOrUserId]) -> List[Presence]:
+    async def _get_presences_data(self, user_ids: List[int]) -> List[dict]:
+        presences_response = await self._client.requests.post(
+            url=self._client.url_generator.get_url("presence", "v1/presence/users"),
+            json={
+                "userIds": user_ids
+            }
+        )
+        return self._client.requests.read_json(presences_response)["userPresences"]
+
+    async def get_user_presences(self, users: List[UserOrUserId], concurrency: int = 10) -> List[Presence]:
         """
         Grabs a list of Presence objects corresponding to each user in the list.
+        Users are split into batches of 50, with at most concurrency batches fetched at the same time.
 
         Arguments:
             users: The list of users you want to get Presences from.
+            concurrency: The maximum amount of batches fetched at the same time.
 
         Returns:
             A list of Presences.
         """
-
-        presences_response = await self._client.requests.post(
-            url=self._client.url_generator.get_url("presence", "v1/presence/users"),
-            json={
-                "userIds": list(map(int, users))
-            }
+        presences_data = await gather_chunks(
+            items=list(map(int, users)),
+            chunk_size=_presences_batch_size,
+            fetcher=self._get_presences_data,
+            concurrency=concurrency
         )
-        presences_data = presences_response.json()["userPresences"]
         return [Presence(client=self._client, data=presence_data) for presence_data in presences_data]
+
+    def watch(
+            self,
+            users: Iterable[UserOrUserId],
+            interval: float = 30,
+            concurrency: int = 10,
+            callback: Optional[Callable[[PresenceChange], Any]] = None,
+            emit_initial: bool = False,
+            max_failed_polls: int = 3
+    ) -> PresenceWatcher:
+        """
+        Creates a watcher that polls the presence of users on a schedule and reports the users whose presence
+        changed. See PresenceWatcher.
+
+        Arguments:
+            users: The users to watch.
+            interval: How long, in seconds, from the start of one poll to the start of the next.
+            concurrency: The maximum amount of batches polled at the same time.
+            callback: A callable, or coroutine function, that is passed each change instead of queueing it.
+            emit_initial: Whether users' first polled presences are reported as changes too.
+            max_failed_polls: How many polls in a row can fail for every batch before polling stops.
+
+        Returns:
+            A PresenceWatcher. It starts polling once it is iterated over or start is called.
+        """
+        return PresenceWatcher(
+            client=self._client,
+            users=users,
+            interval=interval,
+            concurrency=concurrency,
+            callback=callback,
+            emit_initial=emit_initial,
+            max_failed_polls=max_failed_polls
+        )
@@ -11,9 +11,8 @@ if TYPE_CHECKING:
     from .client import Client
 from datetime import datetime
 
-from dateutil.parser import parse
-
 from .partials.partialuser import PartialUser
+from .utilities.datetimes import parse_datetime
 
 
 class Shout:
@@ -40,8 +39,8 @@ class Shout:
         self._client: Client = client
 
         self.body: str = data["body"]
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
+        self.created: datetime = parse_datetime(data["created"])
+        self.updated: datetime = parse_datetime(data["updated"])
         self.poster: PartialUser = PartialUser(
             client=self._client,
             data=data["poster"]
@@ -3,13 +3,16 @@ Contains classes related to 3D thumbnails.
 """
 from __future__ import annotations
 
+import asyncio
+import math
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import Client
-from typing import List
+from typing import List, Optional
 
-from .delivery import ThumbnailCDNHash
+from .delivery import CDNStore, ThumbnailCDNHash
+from .utilities.obj import OBJMesh, parse_obj
 
 
 class ThreeDThumbnailVector3:
@@ -61,6 +64,52 @@ class ThreeDThumbnailAABB:
         self.min: ThreeDThumbnailVector3 = ThreeDThumbnailVector3(data["min"])
         self.max: ThreeDThumbnailVector3 = ThreeDThumbnailVector3(data["max"])
 
+    def get_render_distance(self) -> float:
+        """
+        Calculates the maximum render distance the same way Roblox does, from the length of the maximum position.
+
+        Returns:
+            The maximum render distance.
+        """
+        return math.sqrt(self.max.x ** 2 + self.max.y ** 2 + self.max.z ** 2) * 4
+
+
+class ThreeDThumbnailBundle:
+    """
+    Represents the downloaded files of a 3D thumbnail.
+
+    Attributes:
+        thumbnail: The 3D thumbnail these files belong to.
+        mesh: The parsed geometry of the OBJ file.
+        mtl: The contents of the MTL file.
+        textures: The contents of each PNG texture, in the same order as the thumbnail's textures. This is empty if
+                  textures weren't loaded.
+        aabb: The bounding box of the mesh's vertices, in the same form as the thumbnail's own AABB data, or None
+              if the mesh has no vertices.
+    """
+
+    def __init__(self, thumbnail: ThreeDThumbnail, mesh: OBJMesh, mtl: str, textures: List[bytes]):
+        """
+        Arguments:
+            thumbnail: The 3D thumbnail these files belong to.
+            mesh: The parsed geometry of the OBJ file.
+            mtl: The contents of the MTL file.
+            textures: The contents of each PNG texture.
+        """
+        self.thumbnail: ThreeDThumbnail = thumbnail
+        self.mesh: OBJMesh = mesh
+        self.mtl: str = mtl
+        self.textures: List[bytes] = textures
+
+        bounds = mesh.get_bounds()
+        self.aabb: Optional[ThreeDThumbnailAABB] = ThreeDThumbnailAABB({
+            "min": dict(zip("xyz", bounds[0])),
+            "max": dict(zip("xyz", bounds[1]))
+        }) if bounds else None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} mesh={self.mesh!r} textures={len(self.textures)}>"
+
 
 class ThreeDThumbnail:
     """
@@ -85,3 +134,42 @@ class ThreeDThumbnail:
         ]
         self.camera: ThreeDThumbnailCamera = ThreeDThumbnailCamera(data["camera"])
         self.aabb: ThreeDThumbnailAABB = ThreeDThumbnailAABB(data["aabb"])
+
+    async def _get_file(self, cdn_hash: ThumbnailCDNHash, store: Optional[CDNStore]) -> bytes:
+        if store is None:
+            file_response = await self._client.requests.get(url=cdn_hash.get_url())
+            return file_response.content
+
+        path = await self._client.delivery.download(cdn_hash, store)
+        with open(path, "rb") as file:
+            return file.read()
+
+    async def get_bundle(self, store: Optional[CDNStore] = None, load_textures: bool = True) -> ThreeDThumbnailBundle:
+        """
+        Downloads the OBJ, MTL and texture files of this 3D thumbnail at the same time and parses the OBJ geometry
+        in a thread pool, so the event loop isn't blocked.
+
+        Arguments:
+            store: A CDNStore to keep the files in, so files shared between thumbnails are only downloaded once.
+            load_textures: Whether to download the textures.
+
+        Returns:
+            A ThreeDThumbnailBundle.
+
+        Raises:
+            ValueError: If the OBJ file is malformed.
+        """
+        textures = self.textures if load_textures else []
+        obj_data, mtl_data, *textures_data = await asyncio.gather(
+            self._get_file(self.obj, store),
+            self._get_file(self.mtl, store),
+            *(self._get_file(texture, store) for texture in textures)
+        )
+        # parsing a detailed mesh takes long enough to stall every other request, so it's done on a worker thread
+        mesh = await asyncio.get_running_loop().run_in_executor(None, parse_obj, obj_data)
+        return ThreeDThumbnailBundle(
+            thumbnail=self,
+            mesh=mesh,
+            mtl=mtl_data.decode("utf-8", errors="replace"),
+            textures=textures_data
+        )
@@ -5,14 +5,17 @@ Contains objects related to Roblox thumbnails.
 """
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import Client
 from enum import Enum
-from typing import Optional, List, Union, Tuple
+from typing import Any, Dict, Iterable, Optional, List, Union, Tuple
 
-from .threedthumbnails import ThreeDThumbnail
+from .delivery import CDNStore
+from .threedthumbnails import ThreeDThumbnail, ThreeDThumbnailBundle
+from .utilities.batching import RequestBatcher, gather_bounded
 from .utilities.types import AssetOrAssetId, BadgeOrBadgeId, GamePassOrGamePassId, GroupOrGroupId, PlaceOrPlaceId, \
     UniverseOrUniverseId, UserOrUserId
 
@@ -61,6 +64,9 @@ class AvatarThumbnailType(Enum):
 
 SizeTupleOrString = Union[Tuple[int, int], str]
 
+# The maximum amount of IDs the thumbnail endpoints accept in a single request.
+_thumbnails_batch_size = 100
+
 
 def _to_size_string(size_item: SizeTupleOrString):
     if isinstance(size_item, tuple):
@@ -105,7 +111,7 @@ class Thumbnail:
         threed_response = await self._client.requests.get(
             url=self.image_url
         )
-        threed_data = threed_response.json()
+        threed_data = self._client.requests.read_json(threed_response)
         return ThreeDThumbnail(
             client=self._client,
             data=threed_data
@@ -141,6 +147,8 @@ class UniverseThumbnails:
 class ThumbnailProvider:
     """
     The ThumbnailProvider that provides multiple functions for generating user thumbnails.
+    IDs passed to methods that return lists of thumbnails are deduplicated and split into requests of 100, and
+    concurrent calls asking for the same size and format are sent together.
     """
 
     def __init__(self, client: Client):
@@ -149,6 +157,83 @@ class ThumbnailProvider:
             client: Client object.
         """
         self._client: Client = client
+        self._batchers: Dict[Tuple, RequestBatcher] = {}
+
+    async def _get_thumbnails_data(
+            self,
+            path: str,
+            ids_name: str,
+            params: Dict[str, Any],
+            target_ids: List[int],
+            use_cache: bool
+    ) -> List[dict]:
+        thumbnails_response = await self._client.requests.get(
+            url=self._client.url_generator.get_url("thumbnails", path),
+            params={
+                ids_name: target_ids,
+                **params
+            },
+            use_cache=use_cache
+        )
+        return self._client.requests.read_json(thumbnails_response)["data"]
+
+    def _get_batcher(self, path: str, ids_name: str, params: Dict[str, Any], use_cache: bool) -> RequestBatcher:
+        # callers asking for the same endpoint, size and format share a batcher, so their IDs are sent together
+        key = (path, ids_name, tuple(sorted(params.items())), use_cache)
+        batcher = self._batchers.get(key)
+        if batcher is None:
+            batcher = RequestBatcher(
+                fetcher=lambda target_ids: self._get_thumbnails_data(path, ids_name, params, target_ids, use_cache),
+                key=lambda thumbnail_data: thumbnail_data["targetId"],
+                batch_size=_thumbnails_batch_size
+            )
+            self._batchers[key] = batcher
+        return batcher
+
+    async def _get_thumbnails(
+            self,
+            path: str,
+            ids_name: str,
+            items: Iterable[Any],
+            params: Dict[str, Any],
+            wait_for_final: bool = False,
+            poll_delay: float = 1,
+            max_poll_delay: float = 8,
+            max_polls: int = 6
+    ) -> Dict[int, Thumbnail]:
+        target_ids = list(dict.fromkeys(map(int, items)))
+
+        batcher = self._get_batcher(path, ids_name, params, use_cache=True)
+        results = await asyncio.gather(*(batcher.get(target_id) for target_id in target_ids))
+        thumbnails_data = {
+            target_id: thumbnail_data
+            for target_id, thumbnail_data in zip(target_ids, results)
+            if thumbnail_data is not None
+        }
+
+        if wait_for_final:
+            # pending thumbnails are polled again without the cache, so a cached pending response isn't reused
+            poll_batcher = self._get_batcher(path, ids_name, params, use_cache=False)
+            for _ in range(max_polls):
+                pending_ids = [
+                    target_id for target_id, thumbnail_data in thumbnails_data.items()
+                    if thumbnail_data["state"] == ThumbnailState.pending.value
+                ]
+                if not pending_ids:
+                    break
+
+                await asyncio.sleep(poll_delay)
+                poll_delay = min(poll_delay * 2, max_poll_delay)
+
+                results = await asyncio.gather(*(poll_batcher.get(target_id) for target_id in pending_ids))
+                for target_id, thumbnail_data in zip(pending_ids, results):
+                    if thumbnail_data is not None:
+                        thumbnails_data[target_id] = thumbnail_data
+
+        return {
+            target_id: Thumbnail(client=self._client, data=thumbnail_data)
+            for target_id, thumbnail_data in thumbnails_data.items()
+        }
 
     async def get_asset_thumbnails(
             self,
@@ -157,6 +242,7 @@ class ThumbnailProvider:
             size: SizeTupleOrString = (30, 30),
             image_format: ThumbnailFormat = ThumbnailFormat.png,
             is_circular: bool = False,
+            wait_for_final: bool = False
     ) -> List[Thumbnail]:
         """
         Returns asset thumbnails for the asset ID passed.
@@ -191,25 +277,59 @@ class ThumbnailProvider:
             size: size of the image.
             image_format: Format of the image.
             is_circular: if the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
 
         Returns:
             A list of Thumbnails.
         """
-        thumbnails_response = await self._client.requests.get(
-            url=self._client.url_generator.get_url("thumbnails", "v1/assets"),
+        thumbnails = await self._get_thumbnails(
+            path="v1/assets",
+            ids_name="assetIds",
+            items=assets,
             params={
-                "assetIds": list(map(int, assets)),
                 "returnPolicy": return_policy.value,
                 "size": _to_size_string(size),
                 "format": image_format.value,
-                "isCircular": is_circular,
+                "isCircular": is_circular
             },
+            wait_for_final=wait_for_final
         )
-        thumbnails_data = thumbnails_response.json()["data"]
-        return [
-            Thumbnail(client=self._client, data=thumbnail_data)
-            for thumbnail_data in thumbnails_data
-        ]
+        return list(thumbnails.values())
+
+    async def get_asset_thumbnail_map(
+            self,
+            assets: Iterable[AssetOrAssetId],
+            return_policy: ThumbnailReturnPolicy = ThumbnailReturnPolicy.place_holder,
+            size: SizeTupleOrString = (30, 30),
+            image_format: ThumbnailFormat = ThumbnailFormat.png,
+            is_circular: bool = False,
+            wait_for_final: bool = True
+    ) -> Dict[int, Thumbnail]:
+        """
+        Returns asset thumbnails for each asset ID passed, keyed by asset ID.
+        Unlike get_asset_thumbnails, pending thumbnails are polled again until they're final by default.
+        See get_asset_thumbnails for the supported sizes.
+
+        Arguments:
+            assets: Assets you want the thumbnails of.
+            return_policy: How you want it returns look at enum.
+            size: size of the image.
+            image_format: Format of the image.
+            is_circular: if the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
+
+        Returns:
+            A dictionary mapping asset IDs to Thumbnails.
+        """
+        thumbnails = await self.get_asset_thumbnails(
+            assets=assets,
+            return_policy=return_policy,
+            size=size,
+            image_format=image_format,
+            is_circular=is_circular,
+            wait_for_final=wait_for_final
+        )
+        return {thumbnail.target_id: thumbnail for thumbnail in thumbnails}
 
     async def get_asset_thumbnail_3d(self, asset: AssetOrAssetId) -> Thumbnail:
         """
@@ -227,7 +347,7 @@ class ThumbnailProvider:
             ),
             params={"assetId": int(asset)},
         )
-        thumbnail_data = thumbnail_response.json()
+        thumbnail_data = self._client.requests.read_json(thumbnail_response)
         return Thumbnail(client=self._client, data=thumbnail_data)
 
     async def get_badge_icons(
@@ -236,6 +356,7 @@ class ThumbnailProvider:
             size: SizeTupleOrString = (150, 150),
             image_format: ThumbnailFormat = ThumbnailFormat.png,
             is_circular: bool = False,
+            wait_for_final: bool = False
     ) -> List[Thumbnail]:
         """
         Returns badge icons for each badge ID passed.
@@ -247,24 +368,23 @@ class ThumbnailProvider:
             size: size of the image.
             image_format: Format of the image.
             is_circular: if the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
 
         Returns:
             A list of Thumbnails.
         """
-        thumbnails_response = await self._client.requests.get(
-            url=self._client.url_generator.get_url("thumbnails", "v1/badges/icons"),
+        thumbnails = await self._get_thumbnails(
+            path="v1/badges/icons",
+            ids_name="badgeIds",
+            items=badges,
             params={
-                "badgeIds": list(map(int, badges)),
                 "size": _to_size_string(size),
                 "format": image_format.value,
-                "isCircular": is_circular,
+                "isCircular": is_circular
             },
+            wait_for_final=wait_for_final
         )
-        thumbnails_data = thumbnails_response.json()["data"]
-        return [
-            Thumbnail(client=self._client, data=thumbnail_data)
-            for thumbnail_data in thumbnails_data
-        ]
+        return list(thumbnails.values())
 
     async def get_gamepass_icons(
             self,
@@ -273,6 +393,7 @@ class ThumbnailProvider:
             size: SizeTupleOrString = (150, 150),
             image_format: ThumbnailFormat = ThumbnailFormat.png,
             is_circular: bool = False,
+            wait_for_final: bool = False
     ) -> List[Thumbnail]:
         """
         Returns gamepass icons for each gamepass ID passed.
@@ -284,24 +405,23 @@ class ThumbnailProvider:
             size: size of the image.
             image_format: Format of the image.
             is_circular: If the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
 
         Returns:
             A list of Thumbnails.
         """
-        thumbnails_response = await self._client.requests.get(
-            url=self._client.url_generator.get_url("thumbnails", "v1/game-passes"),
+        thumbnails = await self._get_thumbnails(
+            path="v1/game-passes",
+            ids_name="gamePassIds",
+            items=gamepasses,
             params={
-                "gamePassIds": list(map(int, gamepasses)),
                 "size": _to_size_string(size),
                 "format": image_format.value,
-                "isCircular": is_circular,
+                "isCircular": is_circular
             },
+            wait_for_final=wait_for_final
         )
-        thumbnails_data = thumbnails_response.json()["data"]
-        return [
-            Thumbnail(client=self._client, data=thumbnail_data)
-            for thumbnail_data in thumbnails_data
-        ]
+        return list(thumbnails.values())
 
     async def get_universe_icons(
             self,
@@ -310,6 +430,7 @@ class ThumbnailProvider:
             size: SizeTupleOrString = (50, 50),
             image_format: ThumbnailFormat = ThumbnailFormat.png,
             is_circular: bool = False,
+            wait_for_final: bool = False
     ) -> List[Thumbnail]:
         """
         Returns universe icons for each universe ID passed.
@@ -327,25 +448,24 @@ class ThumbnailProvider:
             size: size of the image.
             image_format: Format of the image.
             is_circular: If the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
 
         Returns:
             A list of Thumbnails.
         """
-        thumbnails_response = await self._client.requests.get(
-            url=self._client.url_generator.get_url("thumbnails", "v1/games/icons"),
+        thumbnails = await self._get_thumbnails(
+            path="v1/games/icons",
+            ids_name="universeIds",
+            items=universes,
             params={
-                "universeIds": list(map(int, universes)),
                 "returnPolicy": return_policy.value,
                 "size": _to_size_string(size),
                 "format": image_format.value,
-                "isCircular": is_circular,
+                "isCircular": is_circular
             },
+            wait_for_final=wait_for_final
         )
-        thumbnails_data = thumbnails_response.json()["data"]
-        return [
-            Thumbnail(client=self._client, data=thumbnail_data)
-            for thumbnail_data in thumbnails_data
-        ]
+        return list(thumbnails.values())
 
     async def get_universe_thumbnails(
             self,
@@ -389,7 +509,7 @@ class ThumbnailProvider:
                 "isCircular": is_circular,
             },
         )
-        thumbnails_data = thumbnails_response.json()["data"]
+        thumbnails_data = self._client.requests.read_json(thumbnails_response)["data"]
         return [
             UniverseThumbnails(client=self._client, data=thumbnail_data)
             for thumbnail_data in thumbnails_data
@@ -401,6 +521,7 @@ class ThumbnailProvider:
             size: SizeTupleOrString = (150, 150),
             image_format: ThumbnailFormat = ThumbnailFormat.png,
             is_circular: bool = False,
+            wait_for_final: bool = False
     ) -> List[Thumbnail]:
         """
         Returns icons for each group ID passed.
@@ -413,24 +534,23 @@ class ThumbnailProvider:
             size: size of the image.
             image_format: Format of the image.
             is_circular: If the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
 
         Returns:
             A list of Thumbnails.
         """
-        thumbnails_response = await self._client.requests.get(
-            url=self._client.url_generator.get_url("thumbnails", "v1/groups/icons"),
+        thumbnails = await self._get_thumbnails(
+            path="v1/groups/icons",
+            ids_name="groupIds",
+            items=groups,
             params={
-                "groupIds": list(map(int, groups)),
                 "size": _to_size_string(size),
                 "format": image_format.value,
-                "isCircular": is_circular,
+                "isCircular": is_circular
             },
+            wait_for_final=wait_for_final
         )
-        thumbnails_data = thumbnails_response.json()["data"]
-        return [
-            Thumbnail(client=self._client, data=thumbnail_data)
-            for thumbnail_data in thumbnails_data
-        ]
+        return list(thumbnails.values())
 
     async def get_place_icons(
             self,
@@ -439,6 +559,7 @@ class ThumbnailProvider:
             size: SizeTupleOrString = (50, 50),
             image_format: ThumbnailFormat = ThumbnailFormat.png,
             is_circular: bool = False,
+            wait_for_final: bool = False
     ) -> List[Thumbnail]:
         """
         Returns icons for each place ID passed.
@@ -456,24 +577,23 @@ class ThumbnailProvider:
             size: size of the image.
             image_format: Format of the image.
             is_circular: if the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
         Returns:
             A List of Thumbnails.
         """
-        thumbnails_response = await self._client.requests.get(
-            url=self._client.url_generator.get_url("thumbnails", "v1/places/gameicons"),
+        thumbnails = await self._get_thumbnails(
+            path="v1/places/gameicons",
+            ids_name="placeIds",
+            items=places,
             params={
-                "placeIds": list(map(int, places)),
                 "returnPolicy": return_policy.value,
                 "size": _to_size_string(size),
                 "format": image_format.value,
-                "isCircular": is_circular,
+                "isCircular": is_circular
             },
+            wait_for_final=wait_for_final
         )
-        thumbnails_data = thumbnails_response.json()["data"]
-        return [
-            Thumbnail(client=self._client, data=thumbnail_data)
-            for thumbnail_data in thumbnails_data
-        ]
+        return list(thumbnails.values())
 
     async def get_user_avatar_thumbnails(
             self,
@@ -482,6 +602,7 @@ class ThumbnailProvider:
             size: SizeTupleOrString = None,
             image_format: ThumbnailFormat = ThumbnailFormat.png,
             is_circular: bool = False,
+            wait_for_final: bool = False
     ) -> List[Thumbnail]:
         """
         Returns avatar thumbnails for each user ID passed.
@@ -511,6 +632,7 @@ class ThumbnailProvider:
             size: size of the image.
             image_format: Format of the image.
             is_circular: If the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
 
         Returns:
             A list of Thumbnails.
@@ -528,21 +650,53 @@ class ThumbnailProvider:
         else:
             raise ValueError("Avatar type is invalid.")
 
-        thumbnails_response = await self._client.requests.get(
-            url=self._client.url_generator.get_url("thumbnails", f"v1/users/{uri}"),
+        thumbnails = await self._get_thumbnails(
+            path=f"v1/users/{uri}",
+            ids_name="userIds",
+            items=users,
             params={
-                "userIds": list(map(int, users)),
                 "size": _to_size_string(size),
                 "format": image_format.value,
-                "isCircular": is_circular,
+                "isCircular": is_circular
             },
+            wait_for_final=wait_for_final
         )
+        return list(thumbnails.values())
 
-        thumbnails_data = thumbnails_response.json()["data"]
-        return [
-            Thumbnail(client=self._client, data=thumbnail_data)
-            for thumbnail_data in thumbnails_data
-        ]
+    async def get_user_avatar_thumbnail_map(
+            self,
+            users: Iterable[UserOrUserId],
+            type: AvatarThumbnailType = AvatarThumbnailType.full_body,
+            size: SizeTupleOrString = None,
+            image_format: ThumbnailFormat = ThumbnailFormat.png,
+            is_circular: bool = False,
+            wait_for_final: bool = True
+    ) -> Dict[int, Thumbnail]:
+        """
+        Returns avatar thumbnails for each user ID passed, keyed by user ID.
+        Unlike get_user_avatar_thumbnails, pending thumbnails are polled again until they're final by default.
+        See get_user_avatar_thumbnails for the valid sizes.
+
+        Arguments:
+            users: Id of the users you want the thumbnails of.
+            type: Type of avatar thumbnail you want look at enum.
+            size: size of the image.
+            image_format: Format of the image.
+            is_circular: If the image is a circle yes or no.
+            wait_for_final: Whether to poll pending thumbnails again, with backoff, until they're final.
+
+        Returns:
+            A dictionary mapping user IDs to Thumbnails.
+        """
+        thumbnails = await self.get_user_avatar_thumbnails(
+            users=users,
+            type=type,
+            size=size,
+            image_format=image_format,
+            is_circular=is_circular,
+            wait_for_final=wait_for_final
+        )
+        return {thumbnail.target_id: thumbnail for thumbnail in thumbnails}
 
     async def get_user_avatar_thumbnail_3d(self, user: UserOrUserId) -> Thumbnail:
         """
@@ -560,5 +714,30 @@ class ThumbnailProvider:
                 "userId": int(user)
             },
         )
-        thumbnail_data = thumbnail_response.json()
+        thumbnail_data = self._client.requests.read_json(thumbnail_response)
         return Thumbnail(client=self._client, data=thumbnail_data)
+
+    async def get_3d_bundles(
+            self,
+            thumbnails: List[ThreeDThumbnail],
+            store: Optional[CDNStore] = None,
+            load_textures: bool = True,
+            concurrency: int = 5
+    ) -> List[ThreeDThumbnailBundle]:
+        """
+        Downloads the files of many 3D thumbnails at once and parses their geometry.
+        See ThreeDThumbnail.get_bundle.
+
+        Arguments:
+            thumbnails: The 3D thumbnails, as returned by Thumbnail.get_3d_data.
+            store: A CDNStore to keep the files in, so files shared between thumbnails are only downloaded once.
+            load_textures: Whether to download the textures.
+            concurrency: The maximum amount of thumbnails downloaded at the same time.
+
+        Returns:
+            A list of ThreeDThumbnailBundles, in the same order as the thumbnails.
+        """
+        return await gather_bounded(
+            (thumbnail.get_bundle(store=store, load_textures=load_textures) for thumbnail in thumbnails),
+            limit=concurrency
+        )
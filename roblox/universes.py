@@ -13,13 +13,13 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Union
 
-from dateutil.parser import parse
-
 from .bases.baseplace import BasePlace
 from .bases.baseuniverse import BaseUniverse
 from .creatortype import CreatorType
 from .partials.partialgroup import UniversePartialGroup
 from .partials.partialuser import PartialUser
+from .utilities.datetimes import parse_datetime
+from .utilities.lazy import LazyAttribute, build_lazy_attributes
 
 
 class UniverseAvatarType(Enum):
@@ -95,16 +95,8 @@ class Universe(BaseUniverse):
 
         self.id: int = data["id"]
         super().__init__(client=client, universe_id=self.id)
-        self.root_place: BasePlace = BasePlace(client=client, place_id=data["rootPlaceId"])
         self.name: str = data["name"]
         self.description: str = data["description"]
-        self.creator_type: Enum = CreatorType(data["creator"]["type"])
-        # isRNVAccount is not part of PartialUser, UniversePartialGroup
-        self.creator: Union[PartialUser, UniversePartialGroup]
-        if self.creator_type == CreatorType.group:
-            self.creator = UniversePartialGroup(client, data["creator"])
-        elif self.creator_type == CreatorType.user:
-            self.creator = PartialUser(client, data["creator"])
         self.price: Optional[int] = data["price"]
         self.allowed_gear_genres: List[str] = data["allowedGearGenres"]
         self.allowed_gear_categories: List[str] = data["allowedGearCategories"]
@@ -113,13 +105,44 @@ class Universe(BaseUniverse):
         self.playing: int = data["playing"]
         self.visits: int = data["visits"]
         self.max_players: int = data["maxPlayers"]
-        self.created: datetime = parse(data["created"])
-        self.updated: datetime = parse(data["updated"])
         self.studio_access_to_apis_allowed: bool = data["studioAccessToApisAllowed"]
         self.create_vip_servers_allowed: bool = data["createVipServersAllowed"]
-        self.universe_avatar_type: UniverseAvatarType = UniverseAvatarType(data["universeAvatarType"])
-        self.genre: UniverseGenre = UniverseGenre(data["genre"])
         self.is_all_genre: bool = data["isAllGenre"]
         # gameRating seems to be null across all games, so I omitted it from this class.
         self.is_favorited_by_user: bool = data["isFavoritedByUser"]
         self.favorited_count: int = data["favoritedCount"]
+
+        build_lazy_attributes(self, data, lazy=client.lazy_models)
+
+    @LazyAttribute
+    def root_place(self, data: dict) -> BasePlace:
+        return self._client.get_base_place(data["rootPlaceId"])
+
+    @LazyAttribute
+    def creator_type(self, data: dict) -> Enum:
+        return CreatorType(data["creator"]["type"])
+
+    @LazyAttribute
+    def creator(self, data: dict) -> Union[PartialUser, UniversePartialGroup]:
+        # isRNVAccount is not part of PartialUser, UniversePartialGroup
+        creator_type = CreatorType(data["creator"]["type"])
+        if creator_type == CreatorType.group:
+            return UniversePartialGroup(self._client, data["creator"])
+        elif creator_type == CreatorType.user:
+            return PartialUser(self._client, data["creator"])
+
+    @LazyAttribute
+    def created(self, data: dict) -> datetime:
+        return parse_datetime(data["created"])
+
+    @LazyAttribute
+    def updated(self, data: dict) -> datetime:
+        return parse_datetime(data["updated"])
+
+    @LazyAttribute
+    def universe_avatar_type(self, data: dict) -> UniverseAvatarType:
+        return UniverseAvatarType(data["universeAvatarType"])
+
+    @LazyAttribute
+    def genre(self, data: dict) -> UniverseGenre:
+        return UniverseGenre(data["genre"])
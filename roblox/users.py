@@ -11,9 +11,9 @@ if TYPE_CHECKING:
     from .client import Client
 
 from datetime import datetime
-from dateutil.parser import parse
 
 from .bases.baseuser import BaseUser
+from .utilities.datetimes import parse_datetime
 
 class User(BaseUser):
     """
@@ -43,5 +43,5 @@ class User(BaseUser):
         self.display_name: str = data["displayName"]
         self.is_banned: bool = data["isBanned"]
         self.description: str = data["description"]
-        self.created: datetime = parse(data["created"])
+        self.created: datetime = parse_datetime(data["created"])
         self.has_verified_badge: bool = data["hasVerifiedBadge"]
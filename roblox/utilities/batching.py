@@ -0,0 +1,202 @@
+"""
+
+This module contains utilities used internally by ro.py to split, batch and coalesce requests.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set
+
+from .exceptions import HTTPException
+
+
+def chunk_list(items: Sequence[Any], chunk_size: int) -> List[List[Any]]:
+    """
+    Splits a sequence into lists of at most chunk_size items.
+
+    Arguments:
+        items: The items to split.
+        chunk_size: The maximum size of each chunk.
+
+    Returns:
+        A list of chunks.
+    """
+    return [list(items[index:index + chunk_size]) for index in range(0, len(items), chunk_size)]
+
+
+async def gather_chunks(
+        items: Sequence[Any],
+        chunk_size: int,
+        fetcher: Callable[[List[Any]], Awaitable[List[Any]]],
+        concurrency: int = 10
+) -> List[Any]:
+    """
+    Splits items into endpoint-sized chunks, fetches the chunks in parallel and joins the results in chunk order.
+
+    Arguments:
+        items: The items to split, usually IDs.
+        chunk_size: The maximum amount of items the endpoint accepts in one request.
+        fetcher: A coroutine function that takes a chunk and returns a list of results.
+        concurrency: The maximum amount of chunks fetched at the same time.
+
+    Returns:
+        The joined results of every chunk.
+    """
+    chunks = chunk_list(items, chunk_size)
+    if len(chunks) == 1:
+        return await fetcher(chunks[0])
+
+    results = await gather_bounded((fetcher(chunk) for chunk in chunks), limit=concurrency)
+    return [item for result in results for item in result]
+
+
+async def gather_bounded(
+        awaitables: Iterable[Awaitable[Any]],
+        limit: int,
+        return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Runs awaitables concurrently with at most limit of them running at once and returns their results in input order.
+
+    Arguments:
+        awaitables: The awaitables to run.
+        limit: The maximum amount of awaitables running at the same time.
+        return_exceptions: Whether to return exceptions in place of results instead of raising the first one.
+
+    Returns:
+        A list of results, in the same order as the awaitables.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[Any]) -> Any:
+        try:
+            await semaphore.acquire()
+        except asyncio.CancelledError:
+            # close coroutines that never got to start, so they aren't reported as never awaited
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+        try:
+            return await awaitable
+        finally:
+            semaphore.release()
+
+    return await asyncio.gather(
+        *(run(awaitable) for awaitable in awaitables),
+        return_exceptions=return_exceptions
+    )
+
+
+def _is_rejection(exception: Exception) -> bool:
+    status = exception.status if isinstance(exception, HTTPException) else None
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+class RequestBatcher:
+    """
+    Coalesces concurrent single-key lookups into batched requests.
+    Keys requested within the same window are fetched together, split into chunks of at most batch_size keys.
+    Keys that are already being fetched are shared between callers instead of being requested again.
+    If a batch is rejected with a 4xx error other than 429, it is split in half and each half is fetched again, so a
+    single bad key only fails the callers waiting on it.
+    Keys are compared with the keys of the raw results, so they must be passed in the same type, usually ints.
+
+    Attributes:
+        batch_size: The maximum amount of keys sent in one request.
+        delay: How long, in seconds, to wait for more keys before sending a batch.
+    """
+
+    def __init__(
+            self,
+            fetcher: Callable[[List[Hashable]], Awaitable[List[Any]]],
+            key: Callable[[Any], Hashable],
+            batch_size: int,
+            delay: float = 0.01
+    ):
+        """
+        Arguments:
+            fetcher: A coroutine function that takes a list of keys and returns a list of raw results.
+            key: A callable that returns the key of a raw result.
+            batch_size: The maximum amount of keys sent in one request.
+            delay: How long, in seconds, to wait for more keys before sending a batch.
+        """
+        self._fetcher: Callable[[List[Hashable]], Awaitable[List[Any]]] = fetcher
+        self._key: Callable[[Any], Hashable] = key
+
+        self.batch_size: int = batch_size
+        self.delay: float = delay
+
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Gets the raw result for a single key.
+
+        Arguments:
+            key: The key to fetch.
+
+        Returns:
+            The raw result, or None if the endpoint did not return anything for this key.
+        """
+        future = self._pending.get(key) or self._in_flight.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+
+            if len(self._pending) >= self.batch_size or self.delay <= 0:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.delay, self._flush)
+
+        # shield the shared future so one cancelled caller doesn't cancel everyone else waiting on this key
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = {}
+        self._in_flight.update(pending)
+
+        for chunk in chunk_list(list(pending), self.batch_size):
+            task = asyncio.ensure_future(self._resolve({key: pending[key] for key in chunk}))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, futures: Dict[Hashable, asyncio.Future]):
+        try:
+            results = await self._fetcher(list(futures))
+        except Exception as exception:
+            if len(futures) > 1 and _is_rejection(exception):
+                # find the keys the endpoint rejected instead of failing every caller in the batch
+                keys = list(futures)
+                middle = len(keys) // 2
+                await asyncio.gather(
+                    self._resolve({key: futures[key] for key in keys[:middle]}),
+                    self._resolve({key: futures[key] for key in keys[middle:]})
+                )
+                return
+            for key, future in futures.items():
+                self._in_flight.pop(key, None)
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        results_by_key = {self._key(result): result for result in results}
+        for key, future in futures.items():
+            self._in_flight.pop(key, None)
+            if not future.done():
+                future.set_result(results_by_key.get(key))
@@ -0,0 +1,203 @@
+"""
+
+This module contains the bulk operation runner used by ro.py to act on thousands of users at once.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from httpx import ConnectError, ConnectTimeout, PoolTimeout, TransportError
+
+from .batching import chunk_list
+from .exceptions import HTTPException, TooManyRequests
+from .ratelimit import _parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+
+class BulkResult:
+    """
+    Represents the outcome of a bulk operation for a single item.
+
+    Attributes:
+        item: The item the operation was run on, usually a user or user ID.
+        exception: The exception the last attempt raised, or None if the operation succeeded.
+        attempts: How many times the operation was attempted.
+    """
+
+    __slots__ = ("item", "exception", "attempts")
+
+    def __init__(self, item: Any, exception: Optional[BaseException] = None, attempts: int = 1):
+        """
+        Arguments:
+            item: The item the operation was run on.
+            exception: The exception the last attempt raised, if any.
+            attempts: How many times the operation was attempted.
+        """
+        self.item: Any = item
+        self.exception: Optional[BaseException] = exception
+        self.attempts: int = attempts
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} item={self.item!r} succeeded={self.succeeded} attempts={self.attempts}>"
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Whether the operation succeeded for this item.
+        """
+        return self.exception is None
+
+
+class BulkReport:
+    """
+    Represents the outcome of a bulk operation, with one result per item in the order the items were passed in.
+
+    Attributes:
+        results: Every item's result.
+        total: How many items the operation is run on.
+        completed: How many items have finished, successfully or not.
+    """
+
+    def __init__(self, total: int):
+        """
+        Arguments:
+            total: How many items the operation is run on.
+        """
+        self.results: List[Optional[BulkResult]] = [None] * total
+        self.total: int = total
+        self.completed: int = 0
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} total={self.total} succeeded={len(self.succeeded)} " \
+               f"failed={len(self.failed)}>"
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self) -> Iterator[BulkResult]:
+        return iter(self.results)
+
+    @property
+    def succeeded(self) -> List[BulkResult]:
+        """
+        The results of items the operation succeeded for.
+        """
+        return [result for result in self.results if result is not None and result.succeeded]
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        """
+        The results of items the operation failed for after every retry.
+        """
+        return [result for result in self.results if result is not None and not result.succeeded]
+
+
+def is_transient_error(exception: BaseException, idempotent: bool = False) -> bool:
+    """
+    Returns whether an exception is worth retrying.
+    Rate limits and errors raised before the request was sent are always worth retrying. Server errors and other
+    network errors may come after the request was carried out, so they are only worth retrying if sending the
+    request again can't do anything twice.
+
+    Arguments:
+        exception: The exception.
+        idempotent: Whether the operation can safely be carried out more than once.
+    """
+    if isinstance(exception, (ConnectError, ConnectTimeout, PoolTimeout)):
+        return True
+    if isinstance(exception, TransportError):
+        return idempotent
+    if not isinstance(exception, HTTPException) or exception.status is None:
+        return False
+    return exception.status == 429 or (idempotent and exception.status >= 500)
+
+
+def _get_retry_delay(exception: BaseException, retry_delay: float, attempt: int) -> float:
+    if isinstance(exception, TooManyRequests):
+        retry_after = _parse_retry_after(exception.response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after
+    delay = retry_delay * 2 ** attempt
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+async def run_bulk(
+        items: Iterable[Any],
+        operation: Callable[[Any], Awaitable[Any]],
+        concurrency: int = 10,
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[BulkResult, BulkReport], Any]] = None,
+        idempotent: bool = False
+) -> BulkReport:
+    """
+    Runs an operation on every item, with at most concurrency operations running at once.
+    Operations that fail with a transient error are retried with exponential backoff, or after the Retry-After delay
+    of a 429 response. Any other exception is recorded in the item's result instead of being raised.
+    Server and network errors are only retried for idempotent operations - see is_transient_error.
+
+    Arguments:
+        items: The items to run the operation on.
+        operation: A coroutine function that takes an item, or a list of items if batch_size is set.
+        concurrency: The maximum amount of operations running at the same time.
+        retries: How many times to retry an operation that failed with a transient error.
+        retry_delay: The base delay, in seconds, between retries.
+        batch_size: If set, items are split into lists of at most this many items and the operation is run on each
+                    list. Every item in a list gets the list's result.
+        progress: A callable that is called with each item's result and the report as soon as the item finishes.
+                  Exceptions it raises are logged and don't stop the operation.
+        idempotent: Whether the operation can safely be run more than once on the same item.
+
+    Returns:
+        A report with one result per item.
+    """
+    items = list(items)
+    report = BulkReport(total=len(items))
+
+    if batch_size is None:
+        units: List[Tuple[int, Any]] = [(index, item) for index, item in enumerate(items)]
+    else:
+        units = []
+        for chunk_index, chunk in enumerate(chunk_list(items, batch_size)):
+            units.append((chunk_index * batch_size, chunk))
+
+    unit_iterator = iter(units)
+
+    async def run_unit(unit: Any) -> Tuple[Optional[BaseException], int]:
+        attempt = 0
+        while True:
+            try:
+                await operation(unit)
+                return None, attempt + 1
+            except Exception as exception:
+                if attempt >= retries or not is_transient_error(exception, idempotent=idempotent):
+                    return exception, attempt + 1
+                await asyncio.sleep(_get_retry_delay(exception, retry_delay, attempt))
+                attempt += 1
+
+    async def worker():
+        # every worker pulls the next unit from the shared iterator, so there are never more than concurrency
+        # coroutines alive no matter how many items there are
+        for start, unit in unit_iterator:
+            exception, attempts = await run_unit(unit)
+            unit_items = unit if batch_size is not None else [unit]
+            for offset, item in enumerate(unit_items):
+                result = BulkResult(item=item, exception=exception, attempts=attempts)
+                report.results[start + offset] = result
+                report.completed += 1
+                if progress is not None:
+                    try:
+                        progress(result, report)
+                    except Exception:
+                        # a broken callback shouldn't lose the report or leave the other workers running unobserved
+                        logger.exception("Bulk operation progress callback failed for %r", item)
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(units)))))
+    return report
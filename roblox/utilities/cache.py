@@ -0,0 +1,353 @@
+"""
+
+This module contains the response cache used by ro.py to avoid re-requesting nearly static data.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional, Pattern, Set, Tuple
+
+from httpx import Request, Response
+
+# These headers describe the encoded body on the wire, which doesn't match the decoded body we store.
+_excluded_headers: Set[str] = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CacheEntry:
+    """
+    Represents a cached response.
+    Entries only hold plain data so that they can be stored by any backend.
+
+    Attributes:
+        url: The URL the response was fetched from.
+        status_code: The response's status code.
+        headers: The response's headers as a list of name-value pairs.
+        content: The response's raw body.
+        stored_at: The UNIX timestamp at which the response was stored.
+        ttl: How long, in seconds, this entry is fresh for.
+        stale_ttl: How long, in seconds, this entry can be served while it is revalidated after it stops being fresh.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            status_code: int,
+            headers: List[Tuple[str, str]],
+            content: bytes,
+            stored_at: float,
+            ttl: float,
+            stale_ttl: float = 0
+    ):
+        self.url: str = url
+        self.status_code: int = status_code
+        self.headers: List[Tuple[str, str]] = headers
+        self.content: bytes = content
+        self.stored_at: float = stored_at
+        self.ttl: float = ttl
+        self.stale_ttl: float = stale_ttl
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} url={self.url!r} status_code={self.status_code} ttl={self.ttl}>"
+
+    def is_fresh(self, now: float) -> bool:
+        """
+        Returns whether this entry can be served without revalidating it.
+
+        Arguments:
+            now: The current UNIX timestamp.
+        """
+        return now < self.stored_at + self.ttl
+
+    def is_usable(self, now: float) -> bool:
+        """
+        Returns whether this entry can still be served, either fresh or stale.
+
+        Arguments:
+            now: The current UNIX timestamp.
+        """
+        return now < self.stored_at + self.ttl + self.stale_ttl
+
+    def to_response(self) -> Response:
+        """
+        Rebuilds an HTTP response from this entry.
+
+        Returns:
+            An HTTP response.
+        """
+        return Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=Request("GET", self.url)
+        )
+
+
+class CacheBackend(ABC):
+    """
+    Represents storage for cached responses. Subclass this to store responses somewhere other than memory, like a
+    local disk or an sqlite database.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Gets the entry stored under a key.
+
+        Arguments:
+            key: The cache key.
+
+        Returns:
+            The entry, or None if nothing is stored under this key.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Stores an entry under a key.
+
+        Arguments:
+            key: The cache key.
+            entry: The entry to store.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Deletes the entry stored under a key, if there is one.
+
+        Arguments:
+            key: The cache key.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Deletes every stored entry.
+        """
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    A bounded in-memory cache backend which evicts the least recently used entries first.
+
+    Attributes:
+        max_size: The maximum amount of entries held at once.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Arguments:
+            max_size: The maximum amount of entries held at once.
+        """
+        self.max_size: int = max_size
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class ResponseCache:
+    """
+    Caches successful GET responses for endpoints matching a set of URL patterns.
+    Entries that are no longer fresh can still be served for stale_ttl seconds while they are refreshed in the
+    background.
+
+    ```python
+    cache = ResponseCache(
+        ttls={
+            r"users\\.roblox\\.com/v1/users/\\d+$": 300,
+            r"groups\\.roblox\\.com/v1/groups/\\d+/roles$": 600,
+            r"games\\.roblox\\.com/v1/games\\?": 60
+        },
+        stale_ttl=30
+    )
+    client = Client(cache=cache)
+    ```
+
+    Responses to authenticated requests are cached per account, so one account's responses are never served to
+    another.
+
+    Attributes:
+        backend: The backend entries are stored in.
+        default_ttl: The TTL used for URLs that don't match any pattern. If this is None, those URLs aren't cached.
+        stale_ttl: How long, in seconds, an entry can be served while it is revalidated after it stops being fresh.
+        hits: How many requests were served by a fresh entry.
+        stale_hits: How many requests were served by a stale entry.
+        misses: How many cacheable requests were sent to Roblox.
+    """
+
+    def __init__(
+            self,
+            ttls: Optional[Dict[str, float]] = None,
+            default_ttl: Optional[float] = None,
+            stale_ttl: float = 0,
+            backend: Optional[CacheBackend] = None,
+            max_size: int = 1024
+    ):
+        """
+        Arguments:
+            ttls: A dictionary mapping regular expressions, which are searched for in the full request URL, to the
+                  TTL in seconds of the responses they match. The first matching pattern is used.
+            default_ttl: The TTL used for URLs that don't match any pattern. If this is None, those URLs aren't cached.
+            stale_ttl: How long, in seconds, an entry can be served while it is revalidated after it stops being fresh.
+            backend: The backend to store entries in. Defaults to a MemoryCacheBackend.
+            max_size: The maximum amount of entries held by the default MemoryCacheBackend.
+        """
+        self._ttls: List[Tuple[Pattern, float]] = [
+            (re.compile(pattern), ttl) for pattern, ttl in (ttls or {}).items()
+        ]
+        self.default_ttl: Optional[float] = default_ttl
+        self.stale_ttl: float = stale_ttl
+        self.backend: CacheBackend = backend or MemoryCacheBackend(max_size=max_size)
+
+        self.hits: int = 0
+        self.stale_hits: int = 0
+        self.misses: int = 0
+
+        self._revalidating: Set[str] = set()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} hits={self.hits} stale_hits={self.stale_hits} misses={self.misses}>"
+
+    def get_key(self, request: Request) -> str:
+        """
+        Gets the cache key of a request. This is its URL, followed by a digest of the .ROBLOSECURITY cookie it is
+        sent with, if any. The token itself is never part of the key, so backends don't store it.
+
+        Arguments:
+            request: The request.
+
+        Returns:
+            The cache key.
+        """
+        url = str(request.url)
+        for cookie in request.headers.get("Cookie", "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == ".ROBLOSECURITY" and value:
+                return f"{url} {hashlib.sha256(value.encode()).hexdigest()[:32]}"
+        return url
+
+    def get_ttl(self, url: str) -> Optional[float]:
+        """
+        Gets the TTL responses from this URL should be cached for.
+
+        Arguments:
+            url: The full request URL.
+
+        Returns:
+            The TTL in seconds, or None if responses from this URL shouldn't be cached.
+        """
+        for pattern, ttl in self._ttls:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    async def get(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Gets a usable entry and records a hit or a miss.
+
+        Arguments:
+            key: The cache key.
+
+        Returns:
+            A tuple containing the entry, or None on a miss, and whether the entry should be revalidated.
+        """
+        entry = await self.backend.get(key)
+        now = time.time()
+
+        if entry is not None:
+            if entry.is_fresh(now):
+                self.hits += 1
+                return entry, False
+            if entry.is_usable(now):
+                self.stale_hits += 1
+                return entry, True
+            await self.backend.delete(key)
+
+        self.misses += 1
+        return None, False
+
+    async def set(self, key: str, response: Response, ttl: float) -> None:
+        """
+        Stores a response.
+
+        Arguments:
+            key: The cache key.
+            response: The response to store.
+            ttl: How long, in seconds, the response is fresh for.
+        """
+        await self.backend.set(key, CacheEntry(
+            url=str(response.request.url),
+            status_code=response.status_code,
+            headers=[
+                (name, value) for name, value in response.headers.multi_items()
+                if name.lower() not in _excluded_headers
+            ],
+            content=response.content,
+            stored_at=time.time(),
+            ttl=ttl,
+            stale_ttl=self.stale_ttl
+        ))
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Deletes a cached response.
+
+        Arguments:
+            key: The cache key, which is the full request URL for unauthenticated requests. See get_key.
+        """
+        await self.backend.delete(key)
+
+    async def clear(self) -> None:
+        """
+        Deletes every cached response.
+        """
+        await self.backend.clear()
+
+    def start_revalidation(self, key: str) -> bool:
+        """
+        Marks a key as being revalidated.
+
+        Arguments:
+            key: The cache key.
+
+        Returns:
+            Whether the caller should revalidate the key, which is False if it is already being revalidated.
+        """
+        if key in self._revalidating:
+            return False
+        self._revalidating.add(key)
+        return True
+
+    def finish_revalidation(self, key: str) -> None:
+        """
+        Marks a key as no longer being revalidated.
+
+        Arguments:
+            key: The cache key.
+        """
+        self._revalidating.discard(key)
@@ -0,0 +1,67 @@
+"""
+
+This module contains the timestamp parser used by ro.py to build datetimes from Roblox responses.
+
+"""
+
+import re
+from datetime import datetime, tzinfo
+from typing import Dict
+
+from dateutil import tz
+from dateutil.parser import parse
+
+# Roblox returns ISO 8601 timestamps with 0 to 7 fractional digits and either a "Z" or a numeric offset.
+# Fractional digits past the sixth are dropped, just like dateutil does.
+_timestamp_pattern = re.compile(
+    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,6})\d*)?(Z|[+-]\d{2}:?\d{2})?$"
+)
+
+_timezones: Dict[str, tzinfo] = {}
+
+
+def _get_timezone(offset: str) -> tzinfo:
+    timezone = _timezones.get(offset)
+
+    if timezone is None:
+        if offset == "Z":
+            seconds = 0
+        else:
+            sign = -1 if offset[0] == "-" else 1
+            seconds = sign * (int(offset[1:3]) * 3600 + int(offset[-2:]) * 60)
+
+        # these match the tzinfo objects dateutil would create for the same offset
+        timezone = tz.UTC if seconds == 0 else tz.tzoffset(None, seconds)
+        _timezones[offset] = timezone
+
+    return timezone
+
+
+def parse_datetime(timestamp: str) -> datetime:
+    """
+    Parses a timestamp returned by a Roblox endpoint.
+    Timestamps in the ISO 8601 formats Roblox uses are parsed with datetime.fromisoformat, and anything else falls back
+    to dateutil.
+
+    Arguments:
+        timestamp: The timestamp.
+
+    Returns:
+        A datetime.
+    """
+    match = _timestamp_pattern.match(timestamp)
+    if match is None:
+        return parse(timestamp)
+
+    seconds, fraction, offset = match.groups()
+    parsed = datetime.fromisoformat(seconds)
+
+    if fraction:
+        return parsed.replace(
+            microsecond=int(fraction.ljust(6, "0")),
+            tzinfo=_get_timezone(offset) if offset else None
+        )
+    elif offset:
+        return parsed.replace(tzinfo=_get_timezone(offset))
+
+    return parsed
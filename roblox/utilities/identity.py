@@ -0,0 +1,52 @@
+"""
+
+This module contains the identity map used by ro.py to reuse base objects for repeated IDs.
+
+"""
+
+from typing import Any, Callable, Hashable, Tuple, Type, TypeVar
+from weakref import WeakValueDictionary
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    """
+    Maps (type, ID) pairs to the live object representing them, so that every lookup for the same ID gets back the
+    same object for as long as something else holds a reference to it.
+    Objects are only weakly referenced, so they are dropped from the map once they are garbage collected.
+    """
+
+    def __init__(self):
+        self._items: WeakValueDictionary[Tuple[Type, Hashable], Any] = WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} size={len(self._items)}>"
+
+    def get(self, item_type: Type[T], item_id: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Gets the live object for an ID, creating and storing it if there isn't one.
+
+        Arguments:
+            item_type: The object's type.
+            item_id: The object's ID.
+            factory: A callable that creates the object.
+
+        Returns:
+            The object.
+        """
+        key = (item_type, item_id)
+        item = self._items.get(key)
+        if item is None:
+            item = factory()
+            self._items[key] = item
+        return item
+
+    def clear(self):
+        """
+        Forgets every stored object.
+        """
+        self._items.clear()
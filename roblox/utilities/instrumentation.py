@@ -0,0 +1,423 @@
+"""
+
+This module contains the request instrumentation ro.py uses to time requests and count retries, X-CSRF token
+refreshes and cache hits.
+
+"""
+
+from __future__ import annotations
+
+import inspect
+import re
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from httpx import Response
+
+# segments that hold an ID or a CDN hash are replaced so URLs for the same route share an endpoint
+_id_segment = re.compile(r"/\d+(?=/|$)")
+_hash_segment = re.compile(r"/[0-9a-fA-F]{32,}(?=/|$)")
+
+# 1ms to about 70 seconds, each bucket 25% wider than the last
+_default_buckets = tuple(0.001 * 1.25 ** exponent for exponent in range(51))
+
+
+def get_endpoint(url: str) -> str:
+    """
+    Turns a request URL into the endpoint template it belongs to, like `groups.roblox.com/v1/groups/{id}/users`.
+    The protocol and query string are dropped, numeric path segments become `{id}` and CDN hashes become `{hash}`.
+
+    Arguments:
+        url: The request URL.
+
+    Returns:
+        The endpoint template.
+    """
+    url = url.split("?", 1)[0]
+    url = url.split("://", 1)[-1]
+    return _hash_segment.sub("/{hash}", _id_segment.sub("/{id}", url))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace("\"", "\\\"")
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f"{name}=\"{_escape_label(str(value))}\"" for name, value in labels.items()) + "}"
+
+
+class LatencyHistogram:
+    """
+    Counts request durations in fixed buckets, so percentiles can be estimated without keeping every duration.
+
+    Attributes:
+        buckets: The upper bounds of the buckets, in seconds, in ascending order. Durations above the last bound are
+                 counted in an extra overflow bucket.
+        counts: How many durations fell in each bucket, including the overflow bucket.
+        count: How many durations were recorded.
+        sum: The sum of every recorded duration, in seconds.
+        max: The longest recorded duration, in seconds.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets: Tuple[float, ...] = _default_buckets):
+        """
+        Arguments:
+            buckets: The upper bounds of the buckets, in seconds, in ascending order.
+        """
+        self.buckets: Tuple[float, ...] = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} count={self.count} p50={self.p50:.3f} p99={self.p99:.3f}>"
+
+    def observe(self, duration: float):
+        """
+        Records a duration.
+
+        Arguments:
+            duration: The duration, in seconds.
+        """
+        self.counts[bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.sum += duration
+        if duration > self.max:
+            self.max = duration
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Estimates a percentile of the recorded durations by interpolating within the bucket it falls in.
+
+        Arguments:
+            percentile: The percentile, from 0 to 100.
+
+        Returns:
+            The estimated duration, in seconds, or 0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = percentile / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                # the estimate can't be above the longest duration actually seen
+                return min(lower + (upper - lower) * (rank - seen) / bucket_count, self.max)
+            seen += bucket_count
+        return self.max
+
+    @property
+    def p50(self) -> float:
+        """
+        The estimated median duration, in seconds.
+        """
+        return self.get_percentile(50)
+
+    @property
+    def p95(self) -> float:
+        """
+        The estimated 95th percentile duration, in seconds.
+        """
+        return self.get_percentile(95)
+
+    @property
+    def p99(self) -> float:
+        """
+        The estimated 99th percentile duration, in seconds.
+        """
+        return self.get_percentile(99)
+
+
+class RequestRecord:
+    """
+    Represents a single attempt at sending a request, as passed to instrumentation hooks.
+    Request hooks are called before the request is sent, so only the first five attributes are set. Response hooks
+    are called once it is done.
+
+    Attributes:
+        method: The request method.
+        url: The request URL.
+        endpoint: The endpoint template the URL belongs to.
+        attempt: How many times this request was already retried.
+        started: The perf_counter time the attempt started at.
+        elapsed: How long, in seconds, the attempt took, or None if it isn't done.
+        response: The response, or None if the attempt failed before one was received.
+        exception: The exception the attempt failed with, if any.
+    """
+
+    __slots__ = ("method", "url", "endpoint", "attempt", "started", "elapsed", "response", "exception")
+
+    def __init__(self, method: str, url: str, endpoint: str, attempt: int):
+        self.method: str = method
+        self.url: str = url
+        self.endpoint: str = endpoint
+        self.attempt: int = attempt
+        self.started: float = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.response: Optional[Response] = None
+        self.exception: Optional[BaseException] = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} method={self.method!r} endpoint={self.endpoint!r} elapsed={self.elapsed}>"
+
+    @property
+    def status(self) -> str:
+        """
+        The response's status code as a string, or "error" if no response was received.
+        """
+        return str(self.response.status_code) if self.response is not None else "error"
+
+
+RequestHook = Callable[[RequestRecord], Any]
+
+
+class Instrumentation:
+    """
+    Times every request attempt per endpoint template and counts retries, X-CSRF token refreshes and cache hits.
+    Pass it to the Client to instrument its requests:
+    ```python
+    instrumentation = Instrumentation()
+    client = Client(instrumentation=instrumentation)
+    ...
+    for (method, endpoint), histogram in instrumentation.get_slowest(5):
+        print(method, endpoint, histogram.p99)
+    ```
+
+    Attributes:
+        buckets: The upper bounds, in seconds, of the latency histogram buckets.
+        histograms: The latency histogram of each (method, endpoint) pair.
+        statuses: How many attempts of each (method, endpoint) pair ended with each status.
+        counters: Counts of events that aren't tied to an endpoint, like retries and cache hits.
+        request_hooks: Callables, or coroutine functions, called with a RequestRecord before each attempt is sent.
+        response_hooks: Callables, or coroutine functions, called with a RequestRecord after each attempt is done.
+        endpoint_resolver: The callable that turns a URL into its endpoint template.
+    """
+
+    def __init__(
+            self,
+            buckets: Iterable[float] = _default_buckets,
+            endpoint_resolver: Callable[[str], str] = get_endpoint
+    ):
+        """
+        Arguments:
+            buckets: The upper bounds, in seconds, of the latency histogram buckets.
+            endpoint_resolver: A callable that turns a URL into its endpoint template.
+        """
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.endpoint_resolver: Callable[[str], str] = endpoint_resolver
+
+        self.histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.statuses: Dict[Tuple[str, str, str], int] = {}
+        self.counters: Dict[str, int] = {
+            "retries": 0,
+            "xcsrf_fetches": 0,
+            "xcsrf_refreshes": 0,
+            "cache_hits": 0,
+            "cache_stale_hits": 0,
+            "cache_misses": 0
+        }
+
+        self.request_hooks: List[RequestHook] = []
+        self.response_hooks: List[RequestHook] = []
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} endpoints={len(self.histograms)} counters={self.counters}>"
+
+    def add_request_hook(self, hook: RequestHook):
+        """
+        Adds a hook that is called with a RequestRecord before each request attempt is sent.
+        Exceptions raised by hooks aren't caught, so they fail the request.
+
+        Arguments:
+            hook: A callable or coroutine function.
+        """
+        self.request_hooks.append(hook)
+
+    def add_response_hook(self, hook: RequestHook):
+        """
+        Adds a hook that is called with a RequestRecord once each request attempt is done, whether or not it failed.
+        Exceptions raised by hooks aren't caught, so they fail the request.
+
+        Arguments:
+            hook: A callable or coroutine function.
+        """
+        self.response_hooks.append(hook)
+
+    def increment(self, name: str, amount: int = 1):
+        """
+        Increments a counter.
+
+        Arguments:
+            name: The counter's name.
+            amount: How much to increment it by.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    async def start(self, method: str, url: str, attempt: int = 0) -> RequestRecord:
+        """
+        Starts timing a request attempt and calls the request hooks.
+
+        Arguments:
+            method: The request method.
+            url: The request URL.
+            attempt: How many times this request was already retried.
+
+        Returns:
+            The attempt's record, which should be passed to finish once the attempt is done.
+        """
+        record = RequestRecord(method=method.upper(), url=url, endpoint=self.endpoint_resolver(url), attempt=attempt)
+        for hook in self.request_hooks:
+            result = hook(record)
+            if inspect.isawaitable(result):
+                await result
+        # hooks shouldn't count towards the request's latency
+        record.started = time.perf_counter()
+        return record
+
+    async def finish(self, record: RequestRecord):
+        """
+        Records how long a request attempt took and calls the response hooks.
+
+        Arguments:
+            record: The attempt's record, with its response or exception set.
+        """
+        record.elapsed = time.perf_counter() - record.started
+
+        key = (record.method, record.endpoint)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram(self.buckets)
+        histogram.observe(record.elapsed)
+
+        status_key = (record.method, record.endpoint, record.status)
+        self.statuses[status_key] = self.statuses.get(status_key, 0) + 1
+
+        for hook in self.response_hooks:
+            result = hook(record)
+            if inspect.isawaitable(result):
+                await result
+
+    def get_slowest(self, limit: int = 10, percentile: float = 99) -> List[Tuple[Tuple[str, str], LatencyHistogram]]:
+        """
+        Gets the endpoints with the highest latency at a percentile, to find the ones that dominate tail latency.
+
+        Arguments:
+            limit: The maximum amount of endpoints to return.
+            percentile: The percentile to rank endpoints by, from 0 to 100.
+
+        Returns:
+            A list of ((method, endpoint), histogram) tuples, slowest first.
+        """
+        return sorted(
+            self.histograms.items(),
+            key=lambda item: item[1].get_percentile(percentile),
+            reverse=True
+        )[:limit]
+
+    def reset(self):
+        """
+        Clears every histogram and counter. Hooks are kept.
+        """
+        self.histograms.clear()
+        self.statuses.clear()
+        for name in self.counters:
+            self.counters[name] = 0
+
+    def export_prometheus(self, prefix: str = "roblox") -> str:
+        """
+        Exports the histograms and counters in the Prometheus text exposition format, to be served from a /metrics
+        endpoint.
+
+        Arguments:
+            prefix: The prefix of every metric name.
+
+        Returns:
+            The metrics as text.
+        """
+        lines: List[str] = [
+            f"# HELP {prefix}_request_duration_seconds How long request attempts took, per endpoint.",
+            f"# TYPE {prefix}_request_duration_seconds histogram"
+        ]
+        for (method, endpoint), histogram in self.histograms.items():
+            labels = {"method": method, "endpoint": endpoint}
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                cumulative += bucket_count
+                lines.append(
+                    f"{prefix}_request_duration_seconds_bucket{_format_labels({**labels, 'le': repr(bound)})} "
+                    f"{cumulative}"
+                )
+            lines.append(
+                f"{prefix}_request_duration_seconds_bucket{_format_labels({**labels, 'le': '+Inf'})} {histogram.count}"
+            )
+            lines.append(f"{prefix}_request_duration_seconds_sum{_format_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{prefix}_request_duration_seconds_count{_format_labels(labels)} {histogram.count}")
+
+        lines.append(f"# HELP {prefix}_responses_total Request attempts per endpoint and status code.")
+        lines.append(f"# TYPE {prefix}_responses_total counter")
+        for (method, endpoint, status), count in self.statuses.items():
+            labels = {"method": method, "endpoint": endpoint, "status": status}
+            lines.append(f"{prefix}_responses_total{_format_labels(labels)} {count}")
+
+        for name, count in self.counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryAdapter:
+    """
+    Forwards request durations and statuses to OpenTelemetry metrics. This requires the opentelemetry-api package.
+    ```python
+    instrumentation = Instrumentation()
+    OpenTelemetryAdapter(instrumentation)
+    client = Client(instrumentation=instrumentation)
+    ```
+
+    Attributes:
+        instrumentation: The instrumentation this adapter reads from.
+    """
+
+    def __init__(self, instrumentation: Instrumentation, meter: Any = None):
+        """
+        Arguments:
+            instrumentation: The instrumentation to forward metrics from. The adapter adds a response hook to it.
+            meter: The OpenTelemetry meter to create instruments with. Defaults to a meter named "roblox" from the
+                   global meter provider.
+        """
+        if meter is None:
+            from opentelemetry import metrics
+            meter = metrics.get_meter("roblox")
+
+        self.instrumentation: Instrumentation = instrumentation
+        self._duration = meter.create_histogram(
+            name="roblox.request.duration",
+            unit="s",
+            description="How long request attempts took, per endpoint."
+        )
+        self._retries = meter.create_counter(
+            name="roblox.request.retries",
+            description="How many request attempts were retries."
+        )
+
+        instrumentation.add_response_hook(self._record)
+
+    def _record(self, record: RequestRecord):
+        attributes = {
+            "http.request.method": record.method,
+            "roblox.endpoint": record.endpoint,
+            "http.response.status_code": record.status
+        }
+        self._duration.record(record.elapsed, attributes=attributes)
+        if record.attempt:
+            self._retries.add(1, attributes=attributes)
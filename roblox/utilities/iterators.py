@@ -5,17 +5,74 @@ This module contains iterators used internally by ro.py to provide paginated inf
 """
 from __future__ import annotations
 
+import asyncio
+import weakref
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..client import Client
 
 from enum import Enum
-from typing import Callable, Optional, AsyncIterator, Any
+from typing import Callable, Dict, Optional, AsyncIterator, Any, List, Tuple
 
 from .exceptions import NoMoreItems
 
 
+async def _get_page(
+        client: Client,
+        url: str,
+        params: dict,
+        array_key: Optional[str],
+        handler: Optional[Callable],
+        handler_kwargs: dict,
+        stream: bool
+) -> Tuple[list, Dict[str, Any]]:
+    # returns the page's handled items and its top-level values
+    def handle(item_data):
+        return handler(client=client, data=item_data, **handler_kwargs)
+
+    if stream:
+        items = []
+        fields = await client.requests.stream(
+            "GET",
+            url,
+            item_handler=lambda item_data: items.append(handle(item_data) if handler else item_data),
+            array_key=array_key,
+            params=params
+        )
+        return items, fields
+
+    page_response = await client.requests.get(url=url, params=params)
+    page_data = client.requests.read_json(page_response)
+    items = page_data if array_key is None else page_data[array_key]
+
+    if handler:
+        items = [handle(item_data) for item_data in items]
+
+    return items, ({} if array_key is None else page_data)
+
+
+async def _prefetch_pages(iterator_ref: weakref.ref, queue: asyncio.Queue):
+    while True:
+        iterator = iterator_ref()
+        if iterator is None:
+            return
+
+        try:
+            result = await iterator._next_page(), None
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            result = None, exception
+
+        # only hold a weak reference while waiting for the consumer, so an abandoned iterator can be collected
+        del iterator
+        # this blocks once the buffer is full, which stops us from fetching too far ahead of the consumer
+        await queue.put(result)
+        if result[1] is not None:
+            return
+
+
 class SortOrder(Enum):
     """
     Order in which page data should load in.
@@ -56,6 +113,7 @@ class IteratorItems(AsyncIterator):
                 raise StopAsyncIteration
 
         if self._max_items is not None and self._global_position >= self._max_items:
+            self._iterator.stop_prefetching()
             raise StopAsyncIteration
 
         # if we got here we know there are more items
@@ -69,6 +127,12 @@ class IteratorItems(AsyncIterator):
         self._global_position += 1
         return item
 
+    async def aclose(self):
+        """
+        Stops the underlying iterator from fetching pages in the background. See RobloxIterator.aclose.
+        """
+        await self._iterator.aclose()
+
 
 class IteratorPages(AsyncIterator):
     """
@@ -88,22 +152,90 @@ class IteratorPages(AsyncIterator):
         except NoMoreItems:
             raise StopAsyncIteration
 
+    async def aclose(self):
+        """
+        Stops the underlying iterator from fetching pages in the background. See RobloxIterator.aclose.
+        """
+        await self._iterator.aclose()
+
 
 class RobloxIterator:
     """
     Represents a basic iterator which all iterators should implement.
+
+    Attributes:
+        max_items: The maximum amount of items to return when this iterator is looped through.
+        prefetch: How many pages to fetch in the background ahead of the page being consumed. 0 disables prefetching.
     """
 
-    def __init__(self, max_items: int = None):
+    def __init__(self, max_items: int = None, prefetch: int = 0):
         self.max_items: Optional[int] = max_items
+        self.prefetch: int = prefetch
+
+        self._prefetch_queue: Optional[asyncio.Queue] = None
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._prefetch_finalizer: Optional[weakref.finalize] = None
 
     async def next(self):
         """
         Moves to the next page and returns that page's data.
         """
+        if self.prefetch > 0:
+            return await self._next_prefetched_page()
+
+        return await self._next_page()
 
+    async def _next_page(self):
         raise NotImplementedError
 
+    async def _next_prefetched_page(self):
+        if self._prefetch_task is None:
+            self._prefetch_queue = asyncio.Queue(maxsize=self.prefetch)
+            self._prefetch_task = asyncio.ensure_future(_prefetch_pages(weakref.ref(self), self._prefetch_queue))
+            # cancel the worker if this iterator is garbage collected without being closed
+            self._prefetch_finalizer = weakref.finalize(self, self._prefetch_task.cancel)
+
+        page, exception = await self._prefetch_queue.get()
+
+        if exception is not None:
+            # the worker stops after an exception, so the next call starts a new one from the current position
+            self.stop_prefetching()
+            raise exception
+
+        return page
+
+    def stop_prefetching(self):
+        """
+        Stops fetching pages in the background and discards any pages that were fetched ahead.
+        """
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            self._prefetch_finalizer.detach()
+            self._prefetch_task = None
+            self._prefetch_queue = None
+            self._prefetch_finalizer = None
+
+    async def aclose(self):
+        """
+        Stops fetching pages in the background and waits for the background fetch to finish stopping.
+        Iterators used as async context managers are closed automatically:
+        ```python
+        async with group.get_members(prefetch=2) as members:
+            async for member in members:
+                ...
+        ```
+        """
+        task = self._prefetch_task
+        self.stop_prefetching()
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
     async def flatten(self, max_items: int = None) -> list:
         """
         Flattens the data into a list.
@@ -121,6 +253,7 @@ class RobloxIterator:
                 break
 
             if max_items is not None and len(items) >= max_items:
+                self.stop_prefetching()
                 break
 
         return items[:max_items]
@@ -163,6 +296,8 @@ class PageIterator(RobloxIterator):
         extra_parameters: Extra parameters to pass to the endpoint.
         handler: A callable object to use to convert raw endpoint data to parsed objects.
         handler_kwargs: Extra keyword arguments to pass to the handler.
+        prefetch: How many pages to fetch in the background ahead of the page being consumed.
+        stream: Whether pages are decoded item by item while they're downloaded instead of all at once.
         next_cursor: Cursor to use to advance to the next page.
         previous_cursor: Cursor to use to advance to the previous page.
         iterator_position: What position in the iterator_items the iterator is currently at.
@@ -178,7 +313,9 @@ class PageIterator(RobloxIterator):
             max_items: int = None,
             extra_parameters: Optional[dict] = None,
             handler: Optional[Callable] = None,
-            handler_kwargs: Optional[dict] = None
+            handler_kwargs: Optional[dict] = None,
+            prefetch: int = 0,
+            stream: Optional[bool] = None
     ):
         """
         Parameters:
@@ -190,13 +327,17 @@ class PageIterator(RobloxIterator):
             extra_parameters: Extra parameters to pass to the endpoint.
             handler: A callable object to use to convert raw endpoint data to parsed objects.
             handler_kwargs: Extra keyword arguments to pass to the handler.
+            prefetch: How many pages to fetch in the background ahead of the page being consumed.
+            stream: Whether to decode pages item by item while they're downloaded. Defaults to the client's
+                    stream_responses setting.
         """
-        super().__init__(max_items=max_items)
+        super().__init__(max_items=max_items, prefetch=prefetch)
 
         self._client: Client = client
 
         # store some basic arguments in the object
         self.url: str = url
+        self.stream: bool = client.stream_responses if stream is None else stream
         self.sort_order: SortOrder = sort_order
         self.page_size: int = page_size
 
@@ -213,10 +354,7 @@ class PageIterator(RobloxIterator):
         self.iterator_items: list = []
         self.next_started: bool = False
 
-    async def next(self):
-        """
-        Advances the iterator to the next page.
-        """
+    async def _next_page(self):
         if self.next_started and not self.next_cursor:
             """
             If we just started and there is no cursor, this is the last page, because we can go back but not forward.
@@ -227,46 +365,44 @@ class PageIterator(RobloxIterator):
         if not self.next_started:
             self.next_started = True
 
-        page_response = await self._client.requests.get(
+        data, page_data = await _get_page(
+            client=self._client,
             url=self.url,
             params={
                 "cursor": self.next_cursor,
                 "limit": self.page_size,
                 "sortOrder": self.sort_order.value,
                 **self.extra_parameters
-            }
+            },
+            array_key="data",
+            handler=self.handler,
+            handler_kwargs=self.handler_kwargs,
+            stream=self.stream
         )
-        page_data = page_response.json()
 
         # fill in cursors
         self.next_cursor = page_data["nextPageCursor"]
         self.previous_cursor = page_data["previousPageCursor"]
 
-        data = page_data["data"]
-
-        if self.handler:
-            data = [
-                self.handler(
-                    client=self._client,
-                    data=item_data,
-                    **self.handler_kwargs
-                ) for item_data in data
-            ]
-
         return data
 
 
 class PageNumberIterator(RobloxIterator):
     """
     Represents an iterator that is advanced with page numbers and sizes, like those seen on chat.roblox.com.
+    As page numbers are known ahead of time, setting page_window above 1 fetches that many pages in parallel.
+    Pages are still returned in order, and the window stops at the first empty page.
 
     Attributes:
         url: The endpoint to hit for new page data.
         page_number: The current page number.
         page_size: The size of each page.
+        page_window: How many page numbers to fetch in parallel.
         extra_parameters: Extra parameters to pass to the endpoint.
         handler: A callable object to use to convert raw endpoint data to parsed objects.
         handler_kwargs: Extra keyword arguments to pass to the handler.
+        prefetch: How many pages to fetch in the background ahead of the page being consumed.
+        stream: Whether pages are decoded item by item while they're downloaded instead of all at once.
     """
 
     def __init__(
@@ -276,15 +412,20 @@ class PageNumberIterator(RobloxIterator):
             page_size: int = 10,
             extra_parameters: Optional[dict] = None,
             handler: Optional[Callable] = None,
-            handler_kwargs: Optional[dict] = None
+            handler_kwargs: Optional[dict] = None,
+            prefetch: int = 0,
+            page_window: int = 1,
+            stream: Optional[bool] = None
     ):
-        super().__init__()
+        super().__init__(prefetch=prefetch)
 
         self._client: Client = client
 
         self.url: str = url
+        self.stream: bool = client.stream_responses if stream is None else stream
         self.page_number: int = 1
         self.page_size: int = page_size
+        self.page_window: int = page_window
 
         self.extra_parameters: dict = extra_parameters or {}
         self.handler: Callable = handler
@@ -293,33 +434,58 @@ class PageNumberIterator(RobloxIterator):
         self.iterator_position = 0
         self.iterator_items = []
 
-    async def next(self):
-        """
-        Advances the iterator to the next page.
-        """
-        page_response = await self._client.requests.get(
+        # pages fetched by the current window that haven't been returned yet
+        self._window_pages: List[list] = []
+        self._window_ended: bool = False
+
+    async def _get_page_data(self, page_number: int) -> list:
+        data, _ = await _get_page(
+            client=self._client,
             url=self.url,
             params={
-                "pageNumber": self.page_number,
+                "pageNumber": page_number,
                 "pageSize": self.page_size,
                 **self.extra_parameters
-            }
+            },
+            array_key=None,
+            handler=self.handler,
+            handler_kwargs=self.handler_kwargs,
+            stream=self.stream
         )
-        data = page_response.json()
+        return data
 
-        if len(data) == 0:
-            raise NoMoreItems("No more items.")
+    async def _next_window_page_data(self) -> list:
+        if not self._window_pages:
+            if self._window_ended:
+                raise NoMoreItems("No more items.")
 
-        self.page_number += 1
+            pages = await asyncio.gather(*(
+                self._get_page_data(page_number)
+                for page_number in range(self.page_number, self.page_number + self.page_window)
+            ))
+
+            for page_data in pages:
+                if len(page_data) == 0:
+                    # every page after the first empty one is empty too, so there's no need for another window
+                    self._window_ended = True
+                    break
+                self._window_pages.append(page_data)
+
+            if not self._window_pages:
+                raise NoMoreItems("No more items.")
+
+        return self._window_pages.pop(0)
+
+    async def _next_page(self):
+        if self.page_window > 1:
+            data = await self._next_window_page_data()
+        else:
+            data = await self._get_page_data(self.page_number)
 
-        if self.handler:
-            data = [
-                self.handler(
-                    client=self._client,
-                    data=item_data,
-                    **self.handler_kwargs
-                ) for item_data in data
-            ]
+            if len(data) == 0:
+                raise NoMoreItems("No more items.")
+
+        self.page_number += 1
 
         return data
 
@@ -333,6 +499,8 @@ class CursoredPageIterator(RobloxIterator):
         extra_url_parameters: Extra url parameters to pass to the endpoint.
         handler: A callable object to use to convert raw endpoint data to parsed objects.
         handler_kwargs: Extra keyword arguments to pass to the handler.
+        prefetch: How many pages to fetch in the background ahead of the page being consumed.
+        stream: Whether pages are decoded item by item while they're downloaded instead of all at once.
     """
 
     def __init__(
@@ -342,7 +510,9 @@ class CursoredPageIterator(RobloxIterator):
             extra_url_parameters: dict,
             max_items: Optional[int] = None,
             handler: Optional[Callable] = None,
-            handler_kwargs: Optional[dict] = None
+            handler_kwargs: Optional[dict] = None,
+            prefetch: int = 0,
+            stream: Optional[bool] = None
     ) -> None:
         """
         Parameters:
@@ -352,13 +522,17 @@ class CursoredPageIterator(RobloxIterator):
             extra_url_parameters: Extra url parameters to pass to the endpoint.
             handler: A callable object to use to convert raw endpoint data to parsed objects.
             handler_kwargs: Extra keyword arguments to pass to the handler.
+            prefetch: How many pages to fetch in the background ahead of the page being consumed.
+            stream: Whether to decode pages item by item while they're downloaded. Defaults to the client's
+                    stream_responses setting.
         """
-        super().__init__(max_items=max_items)
+        super().__init__(max_items=max_items, prefetch=prefetch)
 
         self._client: Client = client
 
         # store some basic arguments in the object
         self.url: str = url
+        self.stream: bool = client.stream_responses if stream is None else stream
 
         self.extra_url_parameters: dict = extra_url_parameters or {}
         self.handler: Optional[Callable] = handler
@@ -369,10 +543,7 @@ class CursoredPageIterator(RobloxIterator):
         self.next_cursor: Optional[str] = None
         self.previous_cursor: Optional[str] = None
 
-    async def next(self) -> list[Any]:
-        """
-        Advances the iterator to the next page.
-        """
+    async def _next_page(self) -> list[Any]:
         if self.started and not self.next_cursor:
             """
             If we just started and there is no cursor, this is the last page, because we can go back but not forward.
@@ -383,26 +554,19 @@ class CursoredPageIterator(RobloxIterator):
         if not self.started:
             self.started = True
 
-        response = await self._client.requests.get(
+        page_items, response_json = await _get_page(
+            client=self._client,
             url=self.url,
             params={
                 "cursor": self.next_cursor if self.next_cursor else "",
                 **self.extra_url_parameters
-            }
+            },
+            array_key="PageItems",
+            handler=self.handler,
+            handler_kwargs=self.handler_kwargs,
+            stream=self.stream
         )
-        response_json: dict = response.json()
         self.previous_cursor = response_json["PreviousCursor"]
         self.next_cursor = response_json["NextCursor"]
 
-        page_items: list[Any] = response_json["PageItems"]
-
-        if self.handler:
-            page_items = [
-                self.handler(
-                    client=self._client,
-                    data=page_data,
-                    **self.handler_kwargs
-                ) for page_data in page_items
-            ]
-
         return page_items
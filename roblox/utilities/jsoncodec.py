@@ -0,0 +1,128 @@
+"""
+
+This module contains the JSON codecs ro.py can use to decode responses and encode request bodies.
+
+"""
+
+import json
+from json import JSONDecodeError
+from typing import Any, Dict, Type, Union
+
+
+class JSONCodec:
+    """
+    Decodes and encodes JSON with the standard library's json module.
+    Subclass this and override loads and dumps to use another JSON library.
+
+    Attributes:
+        name: The codec's name.
+    """
+
+    name: str = "json"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} name={self.name!r}>"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document.
+
+        Arguments:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            JSONDecodeError: If the document is malformed.
+        """
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encodes a value as a UTF-8 JSON document.
+
+        Arguments:
+            value: The value to encode.
+
+        Returns:
+            The encoded document.
+        """
+        # these match the options httpx uses to encode json= bodies
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Decodes and encodes JSON with orjson.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return self._orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Decodes and encodes JSON with ujson.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._ujson.loads(data)
+        except ValueError as exception:
+            raise JSONDecodeError(str(exception), data if isinstance(data, str) else "", 0) from None
+
+    def dumps(self, value: Any) -> bytes:
+        return self._ujson.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+_codecs: Dict[str, Type[JSONCodec]] = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec
+}
+
+# the order codecs are tried in when the fastest available one is requested
+_auto_codecs = ("orjson", "ujson", "json")
+
+
+def get_json_codec(name: str = "json") -> JSONCodec:
+    """
+    Creates a JSON codec by name.
+
+    Arguments:
+        name: "json", "orjson", "ujson", or "auto" for the fastest one that is installed. "auto" falls back to the
+              standard library when neither orjson nor ujson is installed.
+
+    Returns:
+        A JSON codec.
+    """
+    if name == "auto":
+        for codec_name in _auto_codecs:
+            try:
+                return _codecs[codec_name]()
+            except ImportError:
+                continue
+
+    try:
+        codec_type = _codecs[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec {name!r}.") from None
+
+    return codec_type()
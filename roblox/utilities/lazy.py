@@ -0,0 +1,77 @@
+"""
+
+This module contains utilities used internally by ro.py to build model attributes lazily.
+
+"""
+
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+
+class LazyAttribute:
+    """
+    A model attribute that is built from the model's raw data the first time it is read.
+    Once built, the value is stored on the instance and read like any other attribute.
+
+    Attributes:
+        builder: A callable that takes the model and its raw data and returns the attribute's value.
+        name: The attribute's name.
+    """
+
+    def __init__(self, builder: Callable[[Any, dict], Any]):
+        """
+        Arguments:
+            builder: A callable that takes the model and its raw data and returns the attribute's value.
+        """
+        self.builder: Callable[[Any, dict], Any] = builder
+        self.name: str = builder.__name__
+        self.__doc__ = builder.__doc__
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+
+        value = self.builder(instance, instance._data)
+        # this is a non-data descriptor, so the instance attribute takes priority on every later read
+        instance.__dict__[self.name] = value
+        return value
+
+
+_lazy_attributes: Dict[Type, List[Tuple[str, LazyAttribute]]] = {}
+
+
+def _get_lazy_attributes(cls: Type) -> List[Tuple[str, LazyAttribute]]:
+    attributes = _lazy_attributes.get(cls)
+
+    if attributes is None:
+        attributes = []
+        names = set()
+        for base in cls.__mro__:
+            for name, attribute in vars(base).items():
+                if isinstance(attribute, LazyAttribute) and name not in names:
+                    names.add(name)
+                    attributes.append((name, attribute))
+        _lazy_attributes[cls] = attributes
+
+    return attributes
+
+
+def build_lazy_attributes(instance: Any, data: dict, lazy: bool = False):
+    """
+    Builds every lazy attribute of a model now, or stores the raw data so they can be built when they're first read.
+
+    Arguments:
+        instance: The model.
+        data: The model's raw data.
+        lazy: Whether to build the attributes when they're first read instead of now.
+    """
+    if lazy:
+        instance._data = data
+        return
+
+    instance_dict = instance.__dict__
+    for name, attribute in _get_lazy_attributes(type(instance)):
+        if name not in instance_dict:
+            instance_dict[name] = attribute.builder(instance, data)
@@ -0,0 +1,138 @@
+"""
+
+This module contains the Wavefront OBJ parser used by ro.py to read 3D thumbnail geometry.
+
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import List, Optional, Tuple, Union
+
+Vector3Tuple = Tuple[float, float, float]
+
+
+class OBJMesh:
+    """
+    Represents the geometry of an OBJ file, stored in flat typed arrays instead of lists of per-vertex objects.
+    Faces are split into triangles, so every three entries of the face arrays make up one triangle.
+
+    Attributes:
+        vertices: The vertex positions, as x, y, z triples.
+        normals: The vertex normals, as x, y, z triples.
+        uvs: The texture coordinates, as u, v pairs.
+        faces: The 0-based vertex index of each triangle corner.
+        face_uvs: The 0-based texture coordinate index of each triangle corner, or -1 if it has none.
+        face_normals: The 0-based normal index of each triangle corner, or -1 if it has none.
+        materials: The name of each material used with `usemtl` and the index of the first triangle it applies to.
+    """
+
+    def __init__(self):
+        self.vertices: array = array("f")
+        self.normals: array = array("f")
+        self.uvs: array = array("f")
+        self.faces: array = array("I")
+        self.face_uvs: array = array("i")
+        self.face_normals: array = array("i")
+        self.materials: List[Tuple[str, int]] = []
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} vertices={self.vertex_count} triangles={self.triangle_count}>"
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        The amount of vertices in the mesh.
+        """
+        return len(self.vertices) // 3
+
+    @property
+    def triangle_count(self) -> int:
+        """
+        The amount of triangles in the mesh.
+        """
+        return len(self.faces) // 3
+
+    def get_bounds(self) -> Optional[Tuple[Vector3Tuple, Vector3Tuple]]:
+        """
+        Computes the axis-aligned bounding box of the mesh's vertices.
+
+        Returns:
+            The minimum and maximum corners as (x, y, z) tuples, or None if the mesh has no vertices.
+        """
+        if not self.vertices:
+            return None
+
+        # strided slices of an array are arrays too, so min and max never build per-vertex objects
+        xs, ys, zs = self.vertices[0::3], self.vertices[1::3], self.vertices[2::3]
+        return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+
+
+def _parse_index(value: str, count: int, kind: str, line_number: int) -> int:
+    try:
+        index = int(value)
+    except ValueError:
+        index = 0
+    # OBJ indices are 1-based, and negative indices count back from the last element defined so far
+    resolved = index - 1 if index > 0 else count + index
+    if index == 0 or not 0 <= resolved < count:
+        raise ValueError(f"Line {line_number} of the OBJ file has an invalid {kind} index: {value!r}.")
+    return resolved
+
+
+def parse_obj(data: Union[bytes, str]) -> OBJMesh:
+    """
+    Parses the geometry of a Wavefront OBJ file.
+    Only vertices, texture coordinates, normals, faces and material switches are read. Polygons with more than three
+    corners are split into triangles.
+
+    Arguments:
+        data: The OBJ file's contents.
+
+    Returns:
+        The parsed mesh.
+
+    Raises:
+        ValueError: If a face refers to a vertex, texture coordinate or normal that isn't defined before it.
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", errors="replace")
+
+    mesh = OBJMesh()
+    vertices, normals, uvs = mesh.vertices, mesh.normals, mesh.uvs
+    faces, face_uvs, face_normals = mesh.faces, mesh.face_uvs, mesh.face_normals
+
+    for line_number, line in enumerate(data.splitlines(), start=1):
+        parts = line.split()
+        if not parts:
+            continue
+        keyword = parts[0]
+
+        if keyword == "v":
+            vertices.extend(map(float, parts[1:4]))
+        elif keyword == "vn":
+            normals.extend(map(float, parts[1:4]))
+        elif keyword == "vt":
+            uvs.extend(map(float, parts[1:3]))
+        elif keyword == "f":
+            vertex_count, uv_count, normal_count = len(vertices) // 3, len(uvs) // 2, len(normals) // 3
+            corners = []
+            for corner in parts[1:]:
+                indices = corner.split("/")
+                corners.append((
+                    _parse_index(indices[0], vertex_count, "vertex", line_number),
+                    _parse_index(indices[1], uv_count, "texture coordinate", line_number)
+                    if len(indices) > 1 and indices[1] else -1,
+                    _parse_index(indices[2], normal_count, "normal", line_number)
+                    if len(indices) > 2 and indices[2] else -1
+                ))
+            # split the polygon into a fan of triangles around its first corner
+            for index in range(1, len(corners) - 1):
+                for vertex, uv, normal in (corners[0], corners[index], corners[index + 1]):
+                    faces.append(vertex)
+                    face_uvs.append(uv)
+                    face_normals.append(normal)
+        elif keyword == "usemtl":
+            mesh.materials.append((parts[1] if len(parts) > 1 else "", len(faces) // 3))
+
+    return mesh
@@ -0,0 +1,238 @@
+"""
+
+This module contains the rate limiter used by ro.py to schedule requests within Roblox's rate limits.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Set, Tuple
+
+from httpx import URL, Response
+
+_number_pattern = re.compile(r"\d+(?:\.\d+)?")
+
+_idempotent_methods: Set[str] = {"get", "head", "options", "put", "delete"}
+
+
+def _parse_header_number(value: Optional[str]) -> Optional[float]:
+    # rate limit headers can hold several comma-separated policies, like "10, 10;w=60", so we take the first number
+    if not value:
+        return None
+    match = _number_pattern.search(value)
+    return float(match.group()) if match else None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    A token bucket which allows bursts of up to capacity requests and refills at rate requests per second.
+    Callers that run out of tokens wait in order until a token is available.
+
+    Attributes:
+        rate: How many tokens are added every second.
+        capacity: The maximum amount of tokens the bucket can hold.
+        tokens: The amount of tokens currently in the bucket.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Arguments:
+            rate: How many tokens are added every second.
+            capacity: The maximum amount of tokens the bucket can hold.
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.tokens: float = capacity
+
+        self._updated_at: float = time.monotonic()
+        self._paused_until: float = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} rate={self.rate} capacity={self.capacity} tokens={self.tokens:.2f}>"
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self):
+        """
+        Waits until a token is available and takes it.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """
+        Stops handing out tokens for a number of seconds and empties the bucket.
+
+        Arguments:
+            seconds: How long to pause for.
+        """
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self.tokens = 0
+        self._updated_at = self._paused_until
+
+
+class RateLimiter:
+    """
+    Schedules requests through a token bucket per subdomain (users, groups, games, thumbnails...) and decides when
+    and how long to wait before retrying rate-limited and failed requests.
+
+    ```python
+    client = Client(rate_limiter=RateLimiter(
+        rate=5,
+        burst=10,
+        limits={"thumbnails": (20, 40)}
+    ))
+    ```
+
+    Attributes:
+        rate: The default amount of requests per second for each subdomain.
+        burst: The default amount of requests that can be sent at once for each subdomain.
+        limits: A dictionary mapping subdomain names to (rate, burst) tuples that override the defaults.
+        max_retries: The maximum amount of times a request is retried.
+        backoff_base: The base delay, in seconds, of the exponential backoff.
+        backoff_max: The maximum delay, in seconds, of the exponential backoff.
+    """
+
+    def __init__(
+            self,
+            rate: float = 10,
+            burst: float = 10,
+            limits: Optional[Dict[str, Tuple[float, float]]] = None,
+            max_retries: int = 3,
+            backoff_base: float = 0.5,
+            backoff_max: float = 30
+    ):
+        """
+        Arguments:
+            rate: The default amount of requests per second for each subdomain.
+            burst: The default amount of requests that can be sent at once for each subdomain.
+            limits: A dictionary mapping subdomain names to (rate, burst) tuples that override the defaults.
+            max_retries: The maximum amount of times a request is retried.
+            backoff_base: The base delay, in seconds, of the exponential backoff.
+            backoff_max: The maximum delay, in seconds, of the exponential backoff.
+        """
+        self.rate: float = rate
+        self.burst: float = burst
+        self.limits: Dict[str, Tuple[float, float]] = limits or {}
+        self.max_retries: int = max_retries
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} rate={self.rate} burst={self.burst} max_retries={self.max_retries}>"
+
+    def get_bucket(self, url: str) -> TokenBucket:
+        """
+        Gets the token bucket for the subdomain of a URL.
+
+        Arguments:
+            url: The request URL.
+
+        Returns:
+            A TokenBucket.
+        """
+        host = URL(url).host
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self.limits.get(host.split(".", 1)[0], (self.rate, self.burst))
+            bucket = TokenBucket(rate=rate, capacity=burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str):
+        """
+        Waits until a request to this URL fits within its subdomain's budget.
+
+        Arguments:
+            url: The request URL.
+        """
+        await self.get_bucket(url).acquire()
+
+    def update(self, url: str, response: Response):
+        """
+        Updates the subdomain's budget from a response's rate limit headers.
+
+        Arguments:
+            url: The request URL.
+            response: The response.
+        """
+        remaining = _parse_header_number(response.headers.get("x-ratelimit-remaining"))
+        reset = _parse_header_number(response.headers.get("x-ratelimit-reset"))
+        if remaining is not None and remaining < 1 and reset:
+            self.get_bucket(url).pause(reset)
+
+    def get_retry_delay(self, method: str, url: str, response: Response, attempt: int) -> Optional[float]:
+        """
+        Decides whether a response should be retried and how long to wait before doing so.
+        429 responses are always retried. 5xx responses are only retried for idempotent methods.
+
+        Arguments:
+            method: The request method.
+            url: The request URL.
+            response: The response.
+            attempt: How many times this request has already been retried.
+
+        Returns:
+            The delay in seconds, or None if the response shouldn't be retried.
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        status = response.status_code
+        if status == 429:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                retry_after = _parse_header_number(response.headers.get("x-ratelimit-reset"))
+            if retry_after is None:
+                retry_after = self._get_backoff(attempt)
+            # hold back every other request to this subdomain as well instead of letting them hit the limit too
+            self.get_bucket(url).pause(retry_after)
+            return retry_after
+        elif status >= 500 and method.lower() in _idempotent_methods:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            return retry_after if retry_after is not None else self._get_backoff(attempt)
+
+        return None
+
+    def _get_backoff(self, attempt: int) -> float:
+        # exponential backoff with "equal jitter", so retries from concurrent requests don't line up
+        delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
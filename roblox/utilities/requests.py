@@ -7,12 +7,19 @@ This module contains classes used internally by ro.py for sending requests to Ro
 from __future__ import annotations
 
 import asyncio
+from contextlib import asynccontextmanager
 from json import JSONDecodeError
-from typing import Dict
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Optional
 
-from httpx import AsyncClient, Response
+from httpx import AsyncClient, Request, Response
 
+from .cache import ResponseCache
 from .exceptions import get_exception_from_status_code
+from .instrumentation import Instrumentation, RequestRecord
+from .jsoncodec import JSONCodec
+from .ratelimit import RateLimiter
+from .streaming import JSONArrayStreamDecoder
+from .xcsrf import XCSRFTokenManager
 
 _xcsrf_allowed_methods: Dict[str, bool] = {
     "post": True,
@@ -27,8 +34,8 @@ class CleanAsyncClient(AsyncClient):
     This is a clean-on-delete version of httpx.AsyncClient.
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
 
     def __del__(self):
         try:
@@ -44,17 +51,35 @@ class Requests:
     Attributes:
         session: Base session object to use when sending requests.
         xcsrf_token_name: The header that will contain the Cross-Site Request Forgery token.
+        cache: The response cache used for GET requests, or None if responses aren't cached.
+        rate_limiter: The rate limiter used to schedule and retry requests, or None if requests aren't scheduled.
+        json_codec: The codec used to decode JSON responses and encode json= request bodies.
+        xcsrf_tokens: The manager that fetches and shares the X-CSRF token sent with requests that change data.
+        instrumentation: The instrumentation that times requests and counts retries, or None if requests aren't
+                         instrumented.
     """
 
     def __init__(
             self,
             session: CleanAsyncClient = None,
-            xcsrf_token_name: str = "X-CSRF-Token"
+            xcsrf_token_name: str = "X-CSRF-Token",
+            cache: Optional[ResponseCache] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            json_codec: Optional[JSONCodec] = None,
+            xcsrf_token_url: str = "https://auth.roblox.com/v2/logout",
+            instrumentation: Optional[Instrumentation] = None
     ):
         """
         Arguments:
             session: A custom session object to use for sending requests, compatible with httpx.AsyncClient.
             xcsrf_token_name: The header to place X-CSRF-Token data into.
+            cache: A response cache to use for GET requests.
+            rate_limiter: A rate limiter to schedule requests with and retry 429 and 5xx responses.
+            json_codec: The codec to decode JSON responses and encode json= request bodies with. Defaults to the
+                        standard library's json module.
+            xcsrf_token_url: The endpoint to fetch X-CSRF tokens from.
+            instrumentation: The instrumentation to time requests and count retries, cache hits and X-CSRF token
+                             refreshes with.
         """
         self.session: CleanAsyncClient
 
@@ -64,6 +89,11 @@ class Requests:
             self.session = session
 
         self.xcsrf_token_name: str = xcsrf_token_name
+        self.cache: Optional[ResponseCache] = cache
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.json_codec: JSONCodec = json_codec or JSONCodec()
+        self.xcsrf_tokens: XCSRFTokenManager = XCSRFTokenManager(url=xcsrf_token_url, header_name=xcsrf_token_name)
+        self.instrumentation: Optional[Instrumentation] = instrumentation
 
         self.session.headers["User-Agent"] = "Roblox/WinInet"
         self.session.headers["Referer"] = "www.roblox.com"
@@ -77,45 +107,315 @@ class Requests:
             An HTTP response.
         """
 
+        use_cache = kwargs.pop("use_cache", True)
+        self._encode_json(kwargs)
+
+        if self.cache is not None and use_cache and method.lower() == "get" and not kwargs.get("stream"):
+            return await self._cached_request(method, *args, **kwargs)
+
+        return await self._request(method, *args, **kwargs)
+
+    def read_json(self, response: Response) -> Any:
+        """
+        Decodes a JSON response with this object's codec.
+
+        Arguments:
+            response: The response.
+
+        Returns:
+            The decoded body.
+        """
+        return self.json_codec.loads(response.content)
+
+    def _encode_json(self, kwargs: dict):
+        # encoding the body once up front also means retries don't encode it again
+        value = kwargs.pop("json", None)
+        if value is None:
+            return
+
+        headers = dict(kwargs.get("headers") or {})
+        if not any(name.lower() == "content-type" for name in headers):
+            headers["Content-Type"] = "application/json"
+        kwargs["headers"] = headers
+        kwargs["content"] = self.json_codec.dumps(value)
+
+    async def _cached_request(self, method: str, *args, **kwargs) -> Response:
+        request = self.session.build_request(
+            method,
+            *args,
+            **{key: value for key, value in kwargs.items() if key not in ("handle_xcsrf_token", "skip_roblox")}
+        )
+        key = self.cache.get_key(request)
+        ttl = self.cache.get_ttl(str(request.url))
+
+        if ttl is None:
+            return await self._request(method, *args, **kwargs)
+
+        entry, revalidate = await self.cache.get(key)
+
+        if self.instrumentation is not None:
+            if entry is None:
+                self.instrumentation.increment("cache_misses")
+            else:
+                self.instrumentation.increment("cache_stale_hits" if revalidate else "cache_hits")
+
+        if entry is not None:
+            if revalidate and self.cache.start_revalidation(key):
+                # serve the stale entry now and refresh it in the background
+                asyncio.ensure_future(self._revalidate(key, ttl, method, *args, **kwargs))
+            return entry.to_response()
+
+        response = await self._request(method, *args, **kwargs)
+        if not response.is_error:
+            await self.cache.set(key, response, ttl)
+        return response
+
+    async def _revalidate(self, key: str, ttl: float, method: str, *args, **kwargs):
+        try:
+            response = await self._request(method, *args, **kwargs)
+            if not response.is_error:
+                await self.cache.set(key, response, ttl)
+        except Exception:
+            # the stale entry stays in place and the next request tries again
+            pass
+        finally:
+            self.cache.finish_revalidation(key)
+
+    @asynccontextmanager
+    async def _instrument(self, method: str, url: str, attempt: int = 0) -> AsyncIterator[Optional[RequestRecord]]:
+        if self.instrumentation is None:
+            yield None
+            return
+
+        record = await self.instrumentation.start(method, url, attempt)
+        try:
+            yield record
+        except Exception as exception:
+            record.exception = exception
+            raise
+        finally:
+            await self.instrumentation.finish(record)
+
+    async def _send_attempt(
+            self,
+            attempt: int,
+            method: str,
+            url: str,
+            send: Callable[[], Awaitable[Response]]
+    ) -> Response:
+        async with self._instrument(method, url, attempt) as record:
+            response = await send()
+            if record is not None:
+                record.response = response
+            return response
+
+    async def _send(self, method: str, *args, **kwargs) -> Response:
+        return await self._send_with_retries(
+            method,
+            str(kwargs.get("url") or args[0]),
+            lambda: self.session.request(method, *args, **kwargs)
+        )
+
+    async def _send_with_retries(self, method: str, url: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        if self.rate_limiter is None:
+            return await self._send_attempt(0, method, url, send)
+
+        attempt = 0
+
+        while True:
+            await self.rate_limiter.acquire(url)
+            response = await self._send_attempt(attempt, method, url, send)
+            self.rate_limiter.update(url, response)
+
+            delay = self.rate_limiter.get_retry_delay(method, url, response, attempt)
+            if delay is None:
+                return response
+
+            attempt += 1
+            if self.instrumentation is not None:
+                self.instrumentation.increment("retries")
+            await asyncio.sleep(delay)
+
+    async def _fetch_xcsrf_token(self, request: Request) -> Response:
+        # token fetches are scheduled, retried and timed like any other request
+        if self.instrumentation is not None:
+            self.instrumentation.increment("xcsrf_fetches")
+        return await self._send_with_retries(request.method, str(request.url), lambda: self.session.send(request))
+
+    async def _request(self, method: str, *args, **kwargs) -> Response:
         handle_xcsrf_token = kwargs.pop("handle_xcsrf_token", True)
         skip_roblox = kwargs.pop("skip_roblox", False)
 
-        response = await self.session.request(method, *args, **kwargs)
+        use_xcsrf_token = handle_xcsrf_token and not skip_roblox and _xcsrf_allowed_methods.get(method.lower())
+        token = None
+        if use_xcsrf_token:
+            token = await self._add_xcsrf_token(kwargs)
+
+        response = await self._send(method, *args, **kwargs)
 
         if skip_roblox:
             return response
 
-        method = method.lower()
-
-        if handle_xcsrf_token and self.xcsrf_token_name in response.headers and _xcsrf_allowed_methods.get(method):
-            self.session.headers[self.xcsrf_token_name] = response.headers[self.xcsrf_token_name]
-            if response.status_code == 403:  # Request failed, send it again
-                response = await self.session.request(method, *args, **kwargs)
+        if use_xcsrf_token and self._update_xcsrf_token(response, token, kwargs):
+            # The token was rotated, send the request again with the new one
+            response = await self._send(method, *args, **kwargs)
 
         if kwargs.get("stream"):
             # Streamed responses should not be decoded, so we immediately return the response.
             return response
 
         if response.is_error:
-            # Something went wrong, parse an error
-            content_type = response.headers.get("Content-Type")
-            errors = None
-            if content_type and content_type.startswith("application/json"):
-                data = None
-                try:
-                    data = response.json()
-                except JSONDecodeError:
-                    pass
-                errors = data and data.get("errors")
-
-            exception = get_exception_from_status_code(response.status_code)(
-                response=response,
-                errors=errors
-            )
-            raise exception
+            raise self._get_exception(response)
         else:
             return response
 
+    async def _add_xcsrf_token(self, kwargs: dict) -> Optional[str]:
+        # only authenticated sessions need a token, so we don't fetch one for anyone else
+        if ".ROBLOSECURITY" not in self.session.cookies:
+            return None
+
+        token = await self.xcsrf_tokens.get_token(self.session, send=self._fetch_xcsrf_token)
+        if token is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), self.xcsrf_token_name: token}
+        return token
+
+    def _update_xcsrf_token(self, response: Response, token: Optional[str], kwargs: dict) -> bool:
+        # returns whether the request was rejected for using an old token and should be sent again
+        new_token = response.headers.get(self.xcsrf_token_name)
+        if new_token is None:
+            return False
+
+        self.xcsrf_tokens.update(new_token)
+        if response.status_code != 403 or new_token == token:
+            return False
+
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), self.xcsrf_token_name: new_token}
+        if self.instrumentation is not None:
+            self.instrumentation.increment("xcsrf_refreshes")
+        return True
+
+    def _get_exception(self, response: Response) -> Exception:
+        # Something went wrong, parse an error
+        content_type = response.headers.get("Content-Type")
+        errors = None
+        if content_type and content_type.startswith("application/json"):
+            data = None
+            try:
+                data = self.read_json(response)
+            except JSONDecodeError:
+                pass
+            errors = data and data.get("errors")
+
+        return get_exception_from_status_code(response.status_code)(
+            response=response,
+            errors=errors
+        )
+
+    async def stream(
+            self,
+            method: str,
+            url: str,
+            item_handler: Callable[[Any], None],
+            array_key: Optional[str] = "data",
+            **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Sends a request and decodes the array in its JSON body item by item while the body is downloaded, passing
+        each item to item_handler as soon as it is complete. The whole body is never held in memory at once.
+        Streamed responses are rate limited and retried like any other request, but they aren't cached.
+
+        Arguments:
+            method: The request method.
+            url: The request URL.
+            item_handler: A callable that is passed each decoded array item in order.
+            array_key: The top-level key of the array to stream, or None if the body itself is an array.
+
+        Returns:
+            The body's other top-level values, like page cursors.
+        """
+        handle_xcsrf_token = kwargs.pop("handle_xcsrf_token", True)
+        kwargs.pop("use_cache", None)
+        self._encode_json(kwargs)
+        attempt = 0
+        xcsrf_retried = False
+
+        use_xcsrf_token = handle_xcsrf_token and _xcsrf_allowed_methods.get(method.lower())
+        token = None
+        if use_xcsrf_token:
+            token = await self._add_xcsrf_token(kwargs)
+
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(url)
+
+            async with self._instrument(method, url, attempt) as record, \
+                    self.session.stream(method, url, **kwargs) as response:
+                if record is not None:
+                    record.response = response
+                delay = None
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(url, response)
+                    delay = self.rate_limiter.get_retry_delay(method, url, response, attempt)
+
+                if use_xcsrf_token and not xcsrf_retried and self._update_xcsrf_token(response, token, kwargs):
+                    xcsrf_retried = True
+                    continue
+
+                if delay is None:
+                    if response.is_error:
+                        await response.aread()
+                        raise self._get_exception(response)
+
+                    decoder = JSONArrayStreamDecoder(array_key=array_key)
+                    async for chunk in response.aiter_bytes():
+                        for item in decoder.feed(chunk):
+                            item_handler(item)
+                    for item in decoder.close():
+                        item_handler(item)
+
+                    return decoder.fields
+
+            attempt += 1
+            if self.instrumentation is not None:
+                self.instrumentation.increment("retries")
+            await asyncio.sleep(delay)
+
+    async def download(self, url: str, file: BinaryIO, chunk_size: int = 65536, **kwargs) -> int:
+        """
+        Sends a GET request and writes its body to a file in chunks while it is downloaded, so the whole body is
+        never held in memory at once. Chunks are written from the default thread pool, so the file must not be
+        written to by anything else during the download. Downloads are rate limited, but they aren't retried or
+        cached.
+
+        Arguments:
+            url: The URL to download.
+            file: A file opened in binary write mode.
+            chunk_size: The size, in bytes, of the chunks the body is read in.
+
+        Returns:
+            The amount of bytes written.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(url)
+
+        async with self._instrument("GET", url) as record, self.session.stream("GET", url, **kwargs) as response:
+            if record is not None:
+                record.response = response
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(url, response)
+
+            if response.is_error:
+                await response.aread()
+                raise self._get_exception(response)
+
+            # writes run in the default thread pool, so many downloads at once don't stall the event loop on disk
+            loop = asyncio.get_running_loop()
+            size = 0
+            async for chunk in response.aiter_bytes(chunk_size):
+                await loop.run_in_executor(None, file.write, chunk)
+                size += len(chunk)
+            return size
+
     async def get(self, *args, **kwargs) -> Response:
         """
         Sends a GET request.
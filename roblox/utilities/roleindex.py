@@ -0,0 +1,149 @@
+"""
+
+This module contains the role index used by ro.py to look up a group's roles without fetching them every time.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..roles import Role
+
+
+class RoleIndex:
+    """
+    Caches a group's role table and indexes it by rank, ID and name.
+    The table is fetched again once it is older than ttl, after invalidate is called, or when a caller that found a
+    role to be out of date asks for a refresh. Every fetch bumps the index's version.
+
+    Attributes:
+        ttl: How long, in seconds, the role table is used for before it is fetched again.
+        version: How many times the role table has been fetched.
+        roles: The roles, in the order Roblox returned them.
+        by_rank: The roles, keyed by rank.
+        by_id: The roles, keyed by ID.
+        by_name: The roles, keyed by name.
+    """
+
+    def __init__(self, fetcher: Callable[[], Awaitable[List[Role]]], ttl: float = 300):
+        """
+        Arguments:
+            fetcher: A coroutine function that fetches the group's roles.
+            ttl: How long, in seconds, the role table is used for before it is fetched again.
+        """
+        self._fetcher: Callable[[], Awaitable[List[Role]]] = fetcher
+        self.ttl: float = ttl
+
+        self.version: int = 0
+        self.roles: List[Role] = []
+        self.by_rank: Dict[int, Role] = {}
+        self.by_id: Dict[int, Role] = {}
+        self.by_name: Dict[str, Role] = {}
+
+        self._fetched_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} version={self.version} roles={len(self.roles)}>"
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def is_stale(self) -> bool:
+        """
+        Returns whether the role table has to be fetched before it is used.
+        """
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self.ttl
+
+    def invalidate(self):
+        """
+        Marks the role table as out of date, so the next lookup fetches it again.
+        """
+        self._fetched_at = None
+
+    def update(self, roles: List[Role]):
+        """
+        Replaces the role table with freshly fetched roles.
+
+        Arguments:
+            roles: The group's roles.
+        """
+        self.roles = roles
+        self.by_rank = {role.rank: role for role in roles}
+        self.by_id = {role.id: role for role in roles}
+        self.by_name = {role.name: role for role in roles}
+        self.version += 1
+        self._fetched_at = time.monotonic()
+
+    async def refresh(self, version: Optional[int] = None):
+        """
+        Fetches the role table again.
+        Concurrent callers share one fetch.
+
+        Arguments:
+            version: The version the caller found to be out of date. If the table has been fetched again since, it
+                     isn't fetched a second time.
+        """
+        async with self._get_lock():
+            if version is not None and version != self.version and not self.is_stale():
+                return
+            self.update(await self._fetcher())
+
+    async def get_roles(self) -> List[Role]:
+        """
+        Gets the group's roles, fetching them first if the table is out of date.
+
+        Returns:
+            A list of the group's roles.
+        """
+        if self.is_stale():
+            await self.refresh(self.version)
+        return self.roles
+
+    async def get_by_rank(self, rank: int) -> Optional[Role]:
+        """
+        Gets the role with a rank number.
+
+        Arguments:
+            rank: The rank number. (0-255)
+
+        Returns:
+            The role, or None if there is no role with this rank.
+        """
+        if self.is_stale():
+            await self.refresh(self.version)
+        return self.by_rank.get(rank)
+
+    async def get_by_id(self, role_id: int) -> Optional[Role]:
+        """
+        Gets the role with an ID.
+
+        Arguments:
+            role_id: The role's ID.
+
+        Returns:
+            The role, or None if the group has no role with this ID.
+        """
+        if self.is_stale():
+            await self.refresh(self.version)
+        return self.by_id.get(role_id)
+
+    async def get_by_name(self, name: str) -> Optional[Role]:
+        """
+        Gets the role with a name.
+
+        Arguments:
+            name: The role's name.
+
+        Returns:
+            The role, or None if the group has no role with this name.
+        """
+        if self.is_stale():
+            await self.refresh(self.version)
+        return self.by_name.get(name)
@@ -0,0 +1,120 @@
+"""
+
+This module contains utilities used internally by ro.py to filter paginated results and select the best of them.
+
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from .exceptions import NoMoreItems
+from .iterators import RobloxIterator
+
+
+async def scan_pages(
+        iterator: RobloxIterator,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        max_matches: Optional[int] = None,
+        max_pages: Optional[int] = None
+) -> AsyncIterator[Any]:
+    """
+    Walks through an iterator's pages and yields every item that matches a predicate as soon as its page arrives.
+    The iterator stops fetching pages, including pages it is prefetching, as soon as the scan ends.
+
+    Arguments:
+        iterator: The iterator to walk through.
+        predicate: A callable that returns whether an item should be yielded. Every item is yielded if this is None.
+        max_matches: How many matches to yield before stopping.
+        max_pages: How many pages to read before stopping.
+
+    Returns:
+        An async iterator of matching items.
+    """
+    matches = 0
+    pages = 0
+
+    try:
+        while max_pages is None or pages < max_pages:
+            try:
+                page = await iterator.next()
+            except NoMoreItems:
+                return
+            pages += 1
+
+            for item in page:
+                if predicate is not None and not predicate(item):
+                    continue
+                yield item
+                matches += 1
+                if max_matches is not None and matches >= max_matches:
+                    return
+    finally:
+        iterator.stop_prefetching()
+
+
+class _Reversed:
+    # inverts an item's ordering, so heapq's min-heap can keep the k smallest keys by evicting the largest one
+    __slots__ = ("key", "index", "item")
+
+    def __init__(self, key: Any, index: int, item: Any):
+        self.key: Any = key
+        self.index: int = index
+        self.item: Any = item
+
+    def __lt__(self, other: _Reversed) -> bool:
+        if self.key == other.key:
+            return self.index > other.index
+        return other.key < self.key
+
+
+class TopK:
+    """
+    Keeps the k items with the smallest keys out of a stream of items, using O(k) memory.
+    Items with equal keys are kept in the order they were added.
+
+    Attributes:
+        limit: How many items to keep.
+        key: A callable that returns the key to compare items by.
+    """
+
+    def __init__(self, limit: int, key: Callable[[Any], Any]):
+        """
+        Arguments:
+            limit: How many items to keep.
+            key: A callable that returns the key to compare items by.
+        """
+        self.limit: int = limit
+        self.key: Callable[[Any], Any] = key
+
+        self._heap: List[_Reversed] = []
+        self._index: int = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def add(self, item: Any):
+        """
+        Adds an item, dropping the item with the largest key if more than limit items are held.
+
+        Arguments:
+            item: The item.
+        """
+        if self.limit <= 0:
+            return
+
+        entry = _Reversed(key=self.key(item), index=self._index, item=item)
+        self._index += 1
+
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        elif self._heap[0] < entry:
+            # the new item's key is smaller than the largest one held
+            heapq.heapreplace(self._heap, entry)
+
+    def get_items(self) -> List[Any]:
+        """
+        Returns the items held, from the smallest key to the largest.
+        """
+        return [entry.item for entry in sorted(self._heap, reverse=True)]
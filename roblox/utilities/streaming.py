@@ -0,0 +1,175 @@
+"""
+
+This module contains the incremental JSON decoder used by ro.py to build objects while responses are downloaded.
+
+"""
+
+import codecs
+import re
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Dict, List, Optional
+
+_whitespace_pattern = re.compile(r"[ \t\n\r]*")
+
+# characters that can follow the part of a number that has arrived so far
+_number_continuations = frozenset("0123456789.eE+-")
+
+_decoder = JSONDecoder()
+
+# decoder states
+_start = 0
+_key = 1
+_value = 2
+_items = 3
+_done = 4
+
+
+class JSONArrayStreamDecoder:
+    """
+    Decodes a JSON body chunk by chunk, returning the items of one array as soon as each of them is complete.
+    Every other top-level value is decoded whole and stored in fields.
+
+    ```python
+    decoder = JSONArrayStreamDecoder(array_key="data")
+    async for chunk in response.aiter_bytes():
+        for item in decoder.feed(chunk):
+            ...
+    decoder.close()
+    cursor = decoder.fields["nextPageCursor"]
+    ```
+
+    Attributes:
+        array_key: The top-level key of the array to stream, or None if the body itself is an array.
+        fields: The top-level values that were decoded, other than the streamed array.
+    """
+
+    def __init__(self, array_key: Optional[str] = "data"):
+        """
+        Arguments:
+            array_key: The top-level key of the array to stream, or None if the body itself is an array.
+        """
+        self.array_key: Optional[str] = array_key
+        self.fields: Dict[str, Any] = {}
+
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._position: int = 0
+        self._state: int = _start
+        self._current_key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Adds a chunk of the body.
+
+        Arguments:
+            chunk: The next chunk of the raw body.
+
+        Returns:
+            The array items that were completed by this chunk.
+        """
+        self._buffer = self._buffer[self._position:] + self._text_decoder.decode(chunk)
+        self._position = 0
+        return self._decode(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Marks the end of the body.
+
+        Returns:
+            The array items that were completed by the end of the body.
+
+        Raises:
+            JSONDecodeError: If the body was malformed or incomplete.
+        """
+        self._buffer = self._buffer[self._position:] + self._text_decoder.decode(b"", final=True)
+        self._position = 0
+        items = self._decode(final=True)
+
+        if self._state != _done:
+            raise JSONDecodeError("Incomplete JSON body", self._buffer, self._position)
+
+        return items
+
+    def _skip(self, separators: str = "") -> Optional[str]:
+        # skips whitespace and any of the separators, then returns the next character without consuming it
+        buffer = self._buffer
+        position = _whitespace_pattern.match(buffer, self._position).end()
+        while position < len(buffer) and buffer[position] in separators:
+            position = _whitespace_pattern.match(buffer, position + 1).end()
+        self._position = position
+        return buffer[position] if position < len(buffer) else None
+
+    def _decode_value(self, final: bool) -> Any:
+        # raises JSONDecodeError when the value isn't complete yet
+        buffer = self._buffer
+        value, end = _decoder.raw_decode(buffer, self._position)
+        if not final and (
+                end == len(buffer)
+                or (buffer[end] in _number_continuations and type(value) in (int, float))
+        ):
+            # numbers can't be told apart from the start of a longer number until something other than a fraction
+            # or exponent follows them - "1." or "1e+" is decoded as 1 if the chunk ends there
+            raise JSONDecodeError("Value may be incomplete", buffer, end)
+        self._position = end
+        return value
+
+    def _decode(self, final: bool) -> List[Any]:
+        items = []
+
+        try:
+            while self._state != _done:
+                if self._state == _start:
+                    character = self._skip()
+                    if character is None:
+                        break
+                    expected = "[" if self.array_key is None else "{"
+                    if character != expected:
+                        raise JSONDecodeError(f"Expected {expected!r}", self._buffer, self._position)
+                    self._position += 1
+                    self._state = _items if self.array_key is None else _key
+
+                elif self._state == _key:
+                    character = self._skip(",")
+                    if character is None:
+                        break
+                    if character == "}":
+                        self._position += 1
+                        self._state = _done
+                        continue
+
+                    start = self._position
+                    key = self._decode_value(final)
+                    if self._skip() != ":":
+                        # the separator hasn't arrived yet, so decode the key again with the next chunk
+                        self._position = start
+                        break
+                    self._position += 1
+                    self._current_key = key
+                    self._state = _value
+
+                elif self._state == _value:
+                    character = self._skip()
+                    if character is None:
+                        break
+                    if self._current_key == self.array_key and character == "[":
+                        self._position += 1
+                        self._state = _items
+                    else:
+                        self.fields[self._current_key] = self._decode_value(final)
+                        self._state = _key
+
+                elif self._state == _items:
+                    character = self._skip(",")
+                    if character is None:
+                        break
+                    if character == "]":
+                        self._position += 1
+                        self._state = _done if self.array_key is None else _key
+                        continue
+
+                    items.append(self._decode_value(final))
+        except JSONDecodeError:
+            if final:
+                raise
+
+        return items
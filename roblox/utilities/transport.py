@@ -0,0 +1,138 @@
+"""
+
+This module contains the connection settings ro.py uses to build its HTTP session.
+
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from httpx import AsyncHTTPTransport, Limits, Proxy, Timeout
+
+try:
+    import h2  # noqa: F401
+    _h2_installed = True
+except ImportError:
+    _h2_installed = False
+
+
+class TransportSettings:
+    """
+    Connection pool, keep-alive, HTTP/2 and timeout settings for the client's HTTP session.
+    A single connection pool is shared by every Roblox subdomain, so connections to a subdomain are reused by every
+    request to it for as long as they are kept alive.
+
+    ```python
+    client = Client(transport=TransportSettings(max_connections=50, read_timeout=15))
+    ```
+
+    Attributes:
+        max_connections: The maximum amount of open connections across all subdomains.
+        max_keepalive_connections: The maximum amount of idle connections kept open for reuse.
+        keepalive_expiry: How long, in seconds, an idle connection is kept open for.
+        http2: Whether to use HTTP/2, which multiplexes concurrent requests to a subdomain over one connection.
+               This requires the h2 package, which is installed with the http2 extra.
+        connect_timeout: How long, in seconds, to wait for a connection to be established.
+        read_timeout: How long, in seconds, to wait for a chunk of response data.
+        write_timeout: How long, in seconds, to wait for a chunk of request data to be sent.
+        pool_timeout: How long, in seconds, to wait for a free connection from the pool. None waits indefinitely.
+        retries: How many times to retry failed connection attempts.
+    """
+
+    def __init__(
+            self,
+            max_connections: Optional[int] = 100,
+            max_keepalive_connections: Optional[int] = 20,
+            keepalive_expiry: Optional[float] = 5.0,
+            http2: bool = False,
+            connect_timeout: Optional[float] = 5.0,
+            read_timeout: Optional[float] = 5.0,
+            write_timeout: Optional[float] = 5.0,
+            pool_timeout: Optional[float] = 5.0,
+            retries: int = 0
+    ):
+        """
+        The defaults match httpx's own defaults.
+
+        Arguments:
+            max_connections: The maximum amount of open connections across all subdomains.
+            max_keepalive_connections: The maximum amount of idle connections kept open for reuse.
+            keepalive_expiry: How long, in seconds, an idle connection is kept open for.
+            http2: Whether to use HTTP/2. This requires the h2 package.
+            connect_timeout: How long, in seconds, to wait for a connection to be established.
+            read_timeout: How long, in seconds, to wait for a chunk of response data.
+            write_timeout: How long, in seconds, to wait for a chunk of request data to be sent.
+            pool_timeout: How long, in seconds, to wait for a free connection from the pool.
+            retries: How many times to retry failed connection attempts.
+        """
+        self.max_connections: Optional[int] = max_connections
+        self.max_keepalive_connections: Optional[int] = max_keepalive_connections
+        self.keepalive_expiry: Optional[float] = keepalive_expiry
+        self.http2: bool = http2
+        self.connect_timeout: Optional[float] = connect_timeout
+        self.read_timeout: Optional[float] = read_timeout
+        self.write_timeout: Optional[float] = write_timeout
+        self.pool_timeout: Optional[float] = pool_timeout
+        self.retries: int = retries
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} max_connections={self.max_connections} http2={self.http2}>"
+
+    @classmethod
+    def high_throughput(cls) -> TransportSettings:
+        """
+        Settings for running hundreds of requests at once.
+        Concurrent requests to a subdomain are multiplexed over a few long-lived HTTP/2 connections when the h2
+        package is installed. Without it, every pooled HTTP/1.1 connection is kept alive between bursts instead of
+        being closed and reopened, and requests queue for a free connection instead of timing out.
+        Read timeouts are also relaxed, as responses take longer under load.
+
+        Returns:
+            The high throughput settings.
+        """
+        return cls(
+            max_connections=100,
+            max_keepalive_connections=100,
+            keepalive_expiry=60,
+            http2=_h2_installed,
+            connect_timeout=10,
+            read_timeout=30,
+            write_timeout=10,
+            pool_timeout=None,
+            retries=2
+        )
+
+    def get_session_options(self, proxy: Optional[str] = None) -> dict:
+        """
+        Gets the keyword arguments that apply these settings to an httpx.AsyncClient.
+
+        Arguments:
+            proxy: The URL of a proxy to send requests through.
+
+        Returns:
+            A dictionary of keyword arguments.
+        """
+        if self.http2 and not _h2_installed:
+            # httpx only notices the missing package once the first request is sent
+            raise ImportError("HTTP/2 requires the h2 package. Install it with: pip install roblox[http2]")
+
+        return {
+            "transport": AsyncHTTPTransport(
+                http2=self.http2,
+                limits=Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                retries=self.retries,
+                # older httpx versions only accept a Proxy object here, not a URL
+                proxy=Proxy(proxy) if proxy else None
+            ),
+            "timeout": Timeout(
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                write=self.write_timeout,
+                pool=self.pool_timeout
+            )
+        }
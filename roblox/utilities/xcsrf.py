@@ -0,0 +1,152 @@
+"""
+
+This module contains the X-CSRF token manager used by ro.py to authorize requests that change data.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from httpx import AsyncClient, Request, Response
+
+
+class XCSRFTokenManager:
+    """
+    Fetches an X-CSRF token before it is first needed and shares it between every request, so that requests don't
+    have to be rejected once and sent again to learn it. The token is refreshed in the background shortly before it
+    is considered too old, and concurrent callers wait on a single fetch instead of each sending their own.
+
+    Attributes:
+        url: The endpoint tokens are fetched from. A POST request to it without a token is always rejected with a new
+             token, without doing anything else.
+        header_name: The header tokens are sent and received in.
+        max_age: How long, in seconds, a token is used for before it is fetched again.
+        refresh_margin: How long, in seconds, before max_age the token is refreshed in the background.
+        token: The current token, or None if there isn't one.
+        fetches: How many times a token was fetched ahead of time.
+        rotations: How many times a response handed out a different token than the one we had.
+    """
+
+    def __init__(
+            self,
+            url: str = "https://auth.roblox.com/v2/logout",
+            header_name: str = "X-CSRF-Token",
+            max_age: float = 300,
+            refresh_margin: float = 60
+    ):
+        """
+        Arguments:
+            url: The endpoint to fetch tokens from.
+            header_name: The header tokens are sent and received in.
+            max_age: How long, in seconds, a token is used for before it is fetched again.
+            refresh_margin: How long, in seconds, before max_age to refresh the token in the background.
+        """
+        self.url: str = url
+        self.header_name: str = header_name
+        self.max_age: float = max_age
+        self.refresh_margin: float = refresh_margin
+
+        self.token: Optional[str] = None
+        self.fetches: int = 0
+        self.rotations: int = 0
+
+        self._updated_at: Optional[float] = None
+        # bumped by invalidate, so a fetch that was already running when the account changed is discarded
+        self._generation: int = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Future] = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} fetches={self.fetches} rotations={self.rotations}>"
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _get_age(self) -> Optional[float]:
+        return None if self._updated_at is None else time.monotonic() - self._updated_at
+
+    async def get_token(
+            self,
+            session: AsyncClient,
+            send: Optional[Callable[[Request], Awaitable[Response]]] = None
+    ) -> Optional[str]:
+        """
+        Gets the current token, fetching a new one first if there isn't one or it is too old.
+
+        Arguments:
+            session: The session to build token requests with.
+            send: A coroutine function that sends a token request, so it goes through the same rate limiting and
+                  instrumentation as other requests. Defaults to sending it with the session directly.
+
+        Returns:
+            The token, or None if Roblox didn't hand one out.
+        """
+        age = self._get_age()
+
+        if age is not None and age < self.max_age:
+            if age >= self.max_age - self.refresh_margin and self._refresh_task is None:
+                self._refresh_task = asyncio.ensure_future(self._refresh(session, send))
+            return self.token
+
+        async with self._get_lock():
+            # another caller may have fetched a token while we were waiting for the lock
+            age = self._get_age()
+            if age is None or age >= self.max_age:
+                await self._fetch(session, send)
+
+        return self.token
+
+    def update(self, token: str):
+        """
+        Stores a token handed out by a response.
+
+        Arguments:
+            token: The token.
+        """
+        if token != self.token:
+            self.token = token
+            self.rotations += 1
+        self._updated_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        Forgets the current token, so the next caller fetches a new one. This should be called whenever the session
+        switches accounts, as tokens are tied to the account they were handed out to.
+        """
+        self.token = None
+        self._updated_at = None
+        self._generation += 1
+
+    async def _refresh(self, session: AsyncClient, send: Optional[Callable[[Request], Awaitable[Response]]]):
+        try:
+            async with self._get_lock():
+                await self._fetch(session, send)
+        except Exception:
+            # the current token stays in place until it's too old, and the next caller tries again
+            pass
+        finally:
+            self._refresh_task = None
+
+    async def _fetch(self, session: AsyncClient, send: Optional[Callable[[Request], Awaitable[Response]]]):
+        generation = self._generation
+        request = session.build_request("POST", self.url)
+        # sending a valid token here would log the account out, so make sure the session doesn't add one
+        if self.header_name in request.headers:
+            del request.headers[self.header_name]
+
+        response = await (send or session.send)(request)
+        await response.aclose()
+
+        self.fetches += 1
+        if generation != self._generation:
+            return
+        token = response.headers.get(self.header_name)
+        if token is not None and token != self.token:
+            self.token = token
+        # we also wait max_age before asking again if no token was handed out
+        self._updated_at = time.monotonic()
@@ -32,7 +32,13 @@ setup_info = {
     "install_requires": [
         "httpx>=0.21.0",
         "python-dateutil>=2.8.0"
-    ]
+    ],
+    "extras_require": {
+        "orjson": ["orjson>=3.6.0"],
+        "ujson": ["ujson>=5.0.0"],
+        "http2": ["httpx[http2]>=0.21.0"],
+        "opentelemetry": ["opentelemetry-api>=1.12.0"]
+    }
 }
 
 
@@ -0,0 +1,19 @@
+"""
+Shared fixtures. Clients are given an httpx session with a MockTransport, so no request leaves the process.
+"""
+
+from typing import Callable
+
+import pytest
+from httpx import AsyncClient, MockTransport, Request, Response
+
+from roblox import Client
+
+
+def make_client(handler: Callable[[Request], Response], **kwargs) -> Client:
+    return Client(session=AsyncClient(transport=MockTransport(handler)), **kwargs)
+
+
+@pytest.fixture
+def mock_client() -> Callable[..., Client]:
+    return make_client
@@ -0,0 +1,132 @@
+"""
+Tests for coalescing single-key lookups into batches and for chunked multiget requests.
+"""
+
+import asyncio
+import json
+
+import pytest
+from httpx import Request, Response
+
+from roblox.utilities.batching import RequestBatcher, chunk_list, gather_bounded, gather_chunks
+from roblox.utilities.exceptions import BadRequest, InternalServerError
+
+
+def _get_exception(exception_type, status: int):
+    request = Request("GET", "https://games.roblox.com/v1/games")
+    return exception_type(Response(status, request=request, json={"errors": [{"code": 0, "message": "Error"}]}))
+
+
+def test_chunk_list():
+    assert chunk_list(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+
+
+def test_gather_bounded_keeps_order_and_limit():
+    state = {"running": 0, "most": 0}
+
+    async def run(value):
+        state["running"] += 1
+        state["most"] = max(state["most"], state["running"])
+        await asyncio.sleep(0.001 * (value % 4))
+        state["running"] -= 1
+        return value
+
+    assert asyncio.run(gather_bounded((run(value) for value in range(20)), limit=3)) == list(range(20))
+    assert state["most"] == 3
+
+
+def test_gather_chunks():
+    chunks = []
+
+    async def fetcher(chunk):
+        chunks.append(chunk)
+        await asyncio.sleep(0)
+        return [value * 2 for value in chunk]
+
+    assert asyncio.run(gather_chunks(list(range(7)), 3, fetcher, concurrency=2)) == [value * 2 for value in range(7)]
+    assert sorted(chunks) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_concurrent_keys_are_coalesced():
+    batches = []
+
+    async def fetcher(keys):
+        batches.append(keys)
+        return [{"id": key} for key in keys if key != 404]
+
+    async def main():
+        batcher = RequestBatcher(fetcher=fetcher, key=lambda data: data["id"], batch_size=3, delay=0.01)
+        return await asyncio.gather(*(batcher.get(key) for key in [1, 2, 2, 3, 4, 404, 1]))
+
+    results = asyncio.run(main())
+    assert results == [{"id": 1}, {"id": 2}, {"id": 2}, {"id": 3}, {"id": 4}, None, {"id": 1}]
+    assert sorted(len(batch) for batch in batches) == [2, 3]
+    assert sorted(key for batch in batches for key in batch) == [1, 2, 3, 4, 404]
+
+
+def test_rejected_key_only_fails_its_callers():
+    async def fetcher(keys):
+        if 13 in keys:
+            raise _get_exception(BadRequest, 400)
+        return [{"id": key} for key in keys]
+
+    async def main():
+        batcher = RequestBatcher(fetcher=fetcher, key=lambda data: data["id"], batch_size=10, delay=0.01)
+        return await asyncio.gather(*(batcher.get(key) for key in range(10, 16)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert isinstance(results[3], BadRequest)
+    assert [result["id"] for index, result in enumerate(results) if index != 3] == [10, 11, 12, 14, 15]
+
+
+def test_server_errors_fail_the_whole_batch():
+    calls = []
+
+    async def fetcher(keys):
+        calls.append(keys)
+        raise _get_exception(InternalServerError, 500)
+
+    async def main():
+        batcher = RequestBatcher(fetcher=fetcher, key=lambda data: data["id"], batch_size=10, delay=0.01)
+        return await asyncio.gather(*(batcher.get(key) for key in range(4)), return_exceptions=True)
+
+    assert all(isinstance(result, InternalServerError) for result in asyncio.run(main()))
+    assert len(calls) == 1
+
+
+def test_get_users_is_chunked(mock_client):
+    chunks = []
+
+    def handler(request):
+        user_ids = json.loads(request.content)["userIds"]
+        chunks.append(len(user_ids))
+        return Response(200, json={"data": [
+            {"id": user_id, "name": f"user{user_id}", "displayName": "a", "hasVerifiedBadge": False}
+            for user_id in user_ids
+        ]})
+
+    client = mock_client(handler)
+    users = asyncio.run(client.get_users(list(range(1, 251))))
+    assert [user.id for user in users] == list(range(1, 251))
+    assert sorted(chunks) == [50, 100, 100]
+
+
+@pytest.mark.parametrize("user_id", [7, "7"])
+def test_get_user_normalizes_ids(mock_client, user_id):
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        return Response(200, json={
+            "id": 7, "name": "a", "displayName": "a", "description": "", "created": "2021-01-01T00:00:00Z",
+            "isBanned": False, "externalAppDisplayName": None, "hasVerifiedBadge": False
+        })
+
+    client = mock_client(handler)
+
+    async def main():
+        return await asyncio.gather(client.get_user(user_id), client.get_user(7))
+
+    first, second = asyncio.run(main())
+    assert first.id == second.id == 7
+    assert paths == ["/v1/users/7"]
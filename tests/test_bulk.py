@@ -0,0 +1,128 @@
+"""
+Tests for the bulk operation runner and the bulk group operations built on it.
+"""
+
+import asyncio
+import json
+import logging
+
+import pytest
+from httpx import ConnectError, ReadTimeout, Request, Response
+
+from roblox.utilities.bulk import is_transient_error, run_bulk
+from roblox.utilities.exceptions import BadRequest, InternalServerError, TooManyRequests
+
+_request = Request("POST", "https://groups.roblox.com/v1/test")
+
+
+def _get_exception(exception_type, status: int):
+    return exception_type(Response(status, request=_request, json={"errors": [{"code": 0, "message": "Error"}]}))
+
+
+@pytest.mark.parametrize("exception, idempotent, expected", [
+    (_get_exception(TooManyRequests, 429), False, True),
+    (_get_exception(InternalServerError, 500), False, False),
+    (_get_exception(InternalServerError, 500), True, True),
+    (_get_exception(BadRequest, 400), True, False),
+    (ConnectError("refused"), False, True),
+    (ReadTimeout("timed out"), False, False),
+    (ReadTimeout("timed out"), True, True),
+    (ValueError(), True, False),
+])
+def test_is_transient_error(exception, idempotent, expected):
+    assert is_transient_error(exception, idempotent=idempotent) is expected
+
+
+def test_results_keep_item_order_and_concurrency_is_bounded():
+    state = {"running": 0, "most": 0}
+
+    async def operation(item):
+        state["running"] += 1
+        state["most"] = max(state["most"], state["running"])
+        await asyncio.sleep(0.001 * (item % 3))
+        state["running"] -= 1
+        if item == 5:
+            raise ValueError(item)
+
+    report = asyncio.run(run_bulk(range(20), operation, concurrency=4))
+    assert [result.item for result in report] == list(range(20))
+    assert [result.item for result in report.failed] == [5]
+    assert len(report.succeeded) == 19
+    assert state["most"] <= 4
+
+
+def test_only_idempotent_operations_retry_server_errors():
+    attempts = []
+
+    async def operation(item):
+        attempts.append(item)
+        raise _get_exception(InternalServerError, 500)
+
+    report = asyncio.run(run_bulk([1], operation, retries=2, retry_delay=0))
+    assert report.results[0].attempts == 1
+    report = asyncio.run(run_bulk([2], operation, retries=2, retry_delay=0, idempotent=True))
+    assert report.results[0].attempts == 3
+    assert attempts == [1, 2, 2, 2]
+
+
+def test_rate_limits_are_retried():
+    attempts = []
+
+    async def operation(item):
+        attempts.append(item)
+        if len(attempts) < 3:
+            raise _get_exception(TooManyRequests, 429)
+
+    report = asyncio.run(run_bulk([1], operation, retries=3, retry_delay=0))
+    assert report.results[0].succeeded
+    assert report.results[0].attempts == 3
+
+
+def test_batches_share_their_result():
+    batches = []
+
+    async def operation(batch):
+        batches.append(batch)
+        if 4 in batch:
+            raise ValueError()
+
+    report = asyncio.run(run_bulk(range(7), operation, batch_size=3))
+    assert sorted(batches) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert [result.item for result in report.failed] == [3, 4, 5]
+
+
+def test_progress_exceptions_are_logged(caplog):
+    seen = []
+
+    def progress(result, report):
+        seen.append(result.item)
+        raise RuntimeError("broken callback")
+
+    async def operation(item):
+        pass
+
+    with caplog.at_level(logging.ERROR, logger="roblox.utilities.bulk"):
+        report = asyncio.run(run_bulk(range(5), operation, concurrency=2, progress=progress))
+    assert report.completed == 5
+    assert sorted(seen) == list(range(5))
+    assert len(caplog.records) == 5
+
+
+def test_bulk_set_role(mock_client):
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path, json.loads(request.content)))
+        if request.url.path.endswith("/users/3"):
+            return Response(400, json={"errors": [{"code": 0, "message": "Invalid user"}]})
+        return Response(200, json={})
+
+    client = mock_client(handler)
+    group = client.get_base_group(10)
+    report = asyncio.run(group.bulk_set_role([1, 2, 3], 55, concurrency=2))
+
+    assert sorted(requests) == [
+        ("PATCH", f"/v1/groups/10/users/{user_id}", {"roleId": 55}) for user_id in (1, 2, 3)
+    ]
+    assert [result.item for result in report.failed] == [3]
+    assert isinstance(report.failed[0].exception, BadRequest)
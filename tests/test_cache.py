@@ -0,0 +1,148 @@
+"""
+Tests for the response cache in the Requests layer.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from httpx import Response
+
+import roblox.utilities.cache
+from roblox.utilities.cache import CacheBackend, CacheEntry, MemoryCacheBackend, ResponseCache
+from roblox.utilities.exceptions import NotFound
+
+_url = "https://users.roblox.com/v1/users/1"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(roblox.utilities.cache, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+def _counting_handler(counts, status=200):
+    def handler(request):
+        counts.append(str(request.url))
+        return Response(status, json={"count": len(counts)})
+
+    return handler
+
+
+def test_fresh_responses_are_served_from_the_cache(mock_client, clock):
+    counts = []
+    cache = ResponseCache(ttls={r"users\.roblox\.com/v1/users/\d+$": 60})
+    client = mock_client(_counting_handler(counts), cache=cache)
+
+    async def main():
+        first = await client.requests.get(_url)
+        second = await client.requests.get(_url)
+        uncached = await client.requests.get("https://users.roblox.com/v1/users/1/status")
+        bypassed = await client.requests.get(_url, use_cache=False)
+        return first.json(), second.json(), uncached.json(), bypassed.json()
+
+    assert asyncio.run(main()) == ({"count": 1}, {"count": 1}, {"count": 2}, {"count": 3})
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_responses_are_fetched_again(mock_client, clock):
+    counts = []
+    client = mock_client(_counting_handler(counts), cache=ResponseCache(default_ttl=60))
+
+    async def main():
+        await client.requests.get(_url)
+        clock.now += 61
+        return (await client.requests.get(_url)).json()
+
+    assert asyncio.run(main()) == {"count": 2}
+
+
+def test_stale_responses_are_served_while_revalidating(mock_client, clock):
+    counts = []
+    cache = ResponseCache(default_ttl=60, stale_ttl=30)
+    client = mock_client(_counting_handler(counts), cache=cache)
+
+    async def main():
+        await client.requests.get(_url)
+        clock.now += 70
+        stale = (await client.requests.get(_url)).json()
+        # let the background revalidation finish
+        for _ in range(5):
+            await asyncio.sleep(0)
+        fresh = (await client.requests.get(_url)).json()
+        return stale, fresh
+
+    assert asyncio.run(main()) == ({"count": 1}, {"count": 2})
+    assert cache.stale_hits == 1
+
+
+def test_errors_are_not_cached(mock_client, clock):
+    counts = []
+    client = mock_client(_counting_handler(counts, status=404), cache=ResponseCache(default_ttl=60))
+
+    async def main():
+        for _ in range(2):
+            with pytest.raises(NotFound):
+                await client.requests.get(_url)
+
+    asyncio.run(main())
+    assert len(counts) == 2
+
+
+def test_accounts_have_separate_entries(mock_client, clock):
+    counts = []
+    client = mock_client(_counting_handler(counts), cache=ResponseCache(default_ttl=60))
+
+    async def main():
+        client.set_token("first")
+        first = (await client.requests.get(_url)).json()
+        client.set_token("second")
+        second = (await client.requests.get(_url)).json()
+        client.set_token("first")
+        again = (await client.requests.get(_url)).json()
+        return first, second, again
+
+    assert asyncio.run(main()) == ({"count": 1}, {"count": 2}, {"count": 1})
+
+
+def test_keys_never_contain_the_token(mock_client):
+    client = mock_client(lambda request: Response(200))
+    client.set_token("secret-token")
+    request = client.requests.session.build_request("GET", _url)
+    key = ResponseCache().get_key(request)
+    assert key.startswith(_url)
+    assert "secret-token" not in key
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_size=2)
+
+    def entry(url):
+        return CacheEntry(url=url, status_code=200, headers=[], content=b"", stored_at=0, ttl=60)
+
+    async def main():
+        await backend.set("a", entry("a"))
+        await backend.set("b", entry("b"))
+        await backend.get("a")
+        await backend.set("c", entry("c"))
+        return [await backend.get(key) is not None for key in ("a", "b", "c")]
+
+    assert asyncio.run(main()) == [True, False, True]
+
+
+def test_backends_must_implement_every_method():
+    class PartialBackend(CacheBackend):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialBackend()
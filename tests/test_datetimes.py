@@ -0,0 +1,38 @@
+"""
+Tests that parse_datetime returns the same datetimes as dateutil for the timestamps Roblox sends.
+"""
+
+import pytest
+from dateutil.parser import parse
+
+from roblox.utilities.datetimes import parse_datetime
+
+
+@pytest.mark.parametrize("timestamp", [
+    "2021-08-12T17:39:43Z",
+    "2021-08-12T17:39:43.1Z",
+    "2021-08-12T17:39:43.123Z",
+    "2021-08-12T17:39:43.123456Z",
+    "2021-08-12T17:39:43.1234567Z",
+    "2021-08-12T17:39:43.123456789Z",
+    "2021-08-12T17:39:43.9999999Z",
+    "2021-08-12T17:39:43+00:00",
+    "2021-08-12T17:39:43.12-05:00",
+    "2021-08-12T17:39:43.12+0530",
+    "2021-08-12T17:39:43.5-00:30",
+    "2021-08-12T17:39:43",
+    "2021-08-12T17:39:43.1234567",
+    # anything else goes through dateutil
+    "2021-08-12 17:39:43",
+    "8/12/2021 5:39:43 PM",
+])
+def test_matches_dateutil(timestamp):
+    parsed = parse_datetime(timestamp)
+    expected = parse(timestamp)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+    assert (parsed.tzinfo is None) == (expected.tzinfo is None)
+
+
+def test_timezones_are_shared():
+    assert parse_datetime("2021-08-12T17:39:43Z").tzinfo is parse_datetime("2020-01-01T00:00:00.1Z").tzinfo
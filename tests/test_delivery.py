@@ -0,0 +1,160 @@
+"""
+Tests for computing CDN URLs and downloading CDN hashes into a CDNStore.
+"""
+
+import asyncio
+import random
+
+import pytest
+from httpx import Response
+
+import roblox.delivery
+from roblox.delivery import CDNStore, get_cdn_number
+from roblox.utilities.exceptions import NotFound
+
+_hashes = ["0a1b2c3d4e5f60718293a4b5c6d7e8f9", "1a1b2c3d4e5f60718293a4b5c6d7e8f9", "2a1b2c3d4e5f60718293a4b5c6d7e8f9"]
+
+
+def _cdn_handler(requests, delay=0.0):
+    async def handler(request):
+        requests.append(request.url.path)
+        await asyncio.sleep(delay)
+        if "missing" in request.url.path:
+            return Response(404, json={"errors": [{"code": 0, "message": "NotFound"}]})
+        return Response(200, content=request.url.path.encode() * 1000)
+
+    return handler
+
+
+def test_download_is_stored_once(mock_client, tmp_path):
+    requests = []
+    client = mock_client(_cdn_handler(requests))
+    store = CDNStore(tmp_path)
+    cdn_hash = client.delivery.get_thumbnail_cdn_hash(_hashes[0])
+
+    async def main():
+        first = await client.delivery.download(cdn_hash, store)
+        second = await client.delivery.download(cdn_hash, store)
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first == second == store.get_path(_hashes[0])
+    assert first.read_bytes() == f"/{_hashes[0]}".encode() * 1000
+    assert len(requests) == 1
+    assert (store.downloads, store.hits) == (1, 1)
+    assert _hashes[0] in store
+
+
+def test_concurrent_downloads_share_one_request(mock_client, tmp_path):
+    requests = []
+    client = mock_client(_cdn_handler(requests, delay=0.05))
+    store = CDNStore(tmp_path)
+    cdn_hash = client.delivery.get_thumbnail_cdn_hash(_hashes[0])
+
+    async def main():
+        return await asyncio.gather(*(client.delivery.download(cdn_hash, store) for _ in range(5)))
+
+    assert len(set(asyncio.run(main()))) == 1
+    assert len(requests) == 1
+
+
+def test_cancelling_the_first_caller_leaves_the_others_waiting(mock_client, tmp_path):
+    requests = []
+    client = mock_client(_cdn_handler(requests, delay=0.05))
+    store = CDNStore(tmp_path)
+    cdn_hash = client.delivery.get_thumbnail_cdn_hash(_hashes[0])
+
+    async def main():
+        first = asyncio.ensure_future(client.delivery.download(cdn_hash, store))
+        await asyncio.sleep(0)
+        others = [asyncio.ensure_future(client.delivery.download(cdn_hash, store)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await asyncio.gather(*others)
+
+    paths = asyncio.run(main())
+    assert paths == [store.get_path(_hashes[0])] * 2
+    assert paths[0].is_file()
+    assert len(requests) == 1
+
+
+def test_failed_download_leaves_no_file(mock_client, tmp_path):
+    client = mock_client(_cdn_handler([]))
+    store = CDNStore(tmp_path)
+    cdn_hash = client.delivery.get_thumbnail_cdn_hash("missing0000")
+
+    with pytest.raises(NotFound):
+        asyncio.run(client.delivery.download(cdn_hash, store))
+    assert "missing0000" not in store
+    assert list(tmp_path.rglob("*.part")) == []
+
+
+def test_download_many(mock_client, tmp_path):
+    requests = []
+    client = mock_client(_cdn_handler(requests))
+    store = CDNStore(tmp_path)
+    cdn_hashes = [client.delivery.get_thumbnail_cdn_hash(cdn_hash) for cdn_hash in _hashes + ["missing0000"]]
+
+    report = asyncio.run(client.delivery.download_many(cdn_hashes, store, concurrency=2))
+    assert len(report.succeeded) == 3
+    assert [result.item for result in report.failed] == [cdn_hashes[-1]]
+    assert all(cdn_hash in store for cdn_hash in _hashes)
+
+
+def test_invalid_hash_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        CDNStore(tmp_path).get_path("../escape")
+
+
+def _get_reference_cdn_number(cdn_hash: str) -> int:
+    i = 31
+    for char in cdn_hash[:32]:
+        i ^= ord(char)
+    return i % 8
+
+
+def test_cdn_numbers_match_the_reference():
+    generator = random.Random(0)
+    cdn_hashes = ["", "a", "0" * 40, "\u00ff" * 32, "\u0100abc", "\U0001f600" * 3]
+    cdn_hashes += ["".join(generator.choice("0123456789abcdef") for _ in range(32)) for _ in range(500)]
+    cdn_hashes += ["".join(generator.choice("0123456789abcdef") for _ in range(length)) for length in range(40)]
+    for cdn_hash in cdn_hashes:
+        assert get_cdn_number(cdn_hash) == _get_reference_cdn_number(cdn_hash), cdn_hash
+
+
+def test_cdn_numbers_are_computed_once_per_hash(mock_client, monkeypatch):
+    calls = []
+
+    def counting_get_cdn_number(cdn_hash):
+        calls.append(cdn_hash)
+        return _get_reference_cdn_number(cdn_hash)
+
+    monkeypatch.setattr(roblox.delivery, "get_cdn_number", counting_get_cdn_number)
+    client = mock_client(lambda request: Response(200))
+    cdn_hash = client.delivery.get_thumbnail_cdn_hash(_hashes[0])
+    assert cdn_hash.get_url() == cdn_hash.get_url()
+    assert calls == [_hashes[0]]
+
+
+def test_bulk_urls_match_single_urls(mock_client):
+    client = mock_client(lambda request: Response(200))
+    thumbnail_hashes = [client.delivery.get_thumbnail_cdn_hash(cdn_hash) for cdn_hash in _hashes]
+    content_hashes = [client.delivery.get_content_cdn_hash(cdn_hash) for cdn_hash in _hashes]
+
+    assert client.delivery.get_thumbnail_cdn_urls(_hashes) == [cdn_hash.get_url() for cdn_hash in thumbnail_hashes]
+    assert client.delivery.get_thumbnail_cdn_urls(thumbnail_hashes) == client.delivery.get_thumbnail_cdn_urls(_hashes)
+    assert client.delivery.get_content_cdn_urls(content_hashes) == [cdn_hash.get_url() for cdn_hash in content_hashes]
+    assert all(url.startswith("https://c") for url in client.delivery.get_content_cdn_urls(_hashes))
+
+
+def test_downloads_are_sent_to_the_hash_url(mock_client, tmp_path):
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        return Response(200, content=b"data")
+
+    client = mock_client(handler)
+    cdn_hash = client.delivery.get_thumbnail_cdn_hash(_hashes[1])
+    asyncio.run(client.delivery.download(cdn_hash, CDNStore(tmp_path)))
+    assert urls == client.delivery.get_thumbnail_cdn_urls([_hashes[1]])
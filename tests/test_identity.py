@@ -0,0 +1,79 @@
+"""
+Tests for comparing and hashing bases and for reusing them through the identity map.
+"""
+
+import asyncio
+import gc
+
+from httpx import Response
+
+from roblox.bases.baseplace import BasePlace
+from roblox.bases.baseuniverse import BaseUniverse
+from roblox.bases.baseuser import BaseUser
+from roblox.utilities.identity import IdentityMap
+
+
+def _handler(request):
+    if request.url.path.endswith("/friends/find"):
+        return Response(200, json={
+            "PreviousCursor": None, "NextCursor": None,
+            "PageItems": [{"id": 1}, {"id": 2}]
+        })
+    return Response(200, json={"userPresences": [
+        {"userPresenceType": 2, "lastLocation": "", "placeId": 10, "rootPlaceId": 10, "gameId": "job",
+         "universeId": 20, "userId": user_id}
+        for user_id in (1, 2)
+    ]})
+
+
+def test_bases_compare_and_hash_by_type_and_id(mock_client):
+    client = mock_client(_handler)
+    assert BaseUser(client, 1) == BaseUser(client, 1)
+    assert BaseUser(client, 1) != BaseUser(client, 2)
+    assert BaseUser(client, 1) != BasePlace(client, 1)
+    assert len({BaseUser(client, 1), BaseUser(client, 1), BaseUser(client, 2)}) == 2
+
+
+def test_bases_are_new_objects_without_the_identity_map(mock_client):
+    client = mock_client(_handler)
+    assert client.identity_map is None
+    assert client.get_base_user(1) is not client.get_base_user(1)
+
+
+def test_identity_map_reuses_bases(mock_client):
+    client = mock_client(_handler, identity_map=True)
+    user = client.get_base_user(1)
+    assert client.get_base_user(1) is user
+    assert client.get_base_user(2) is not user
+    # the same ID under another type is another object
+    assert client.get_base_place(1) is not user
+
+
+def test_friends_and_presences_share_bases(mock_client):
+    client = mock_client(_handler, identity_map=True)
+
+    async def main():
+        friends = [friend async for friend in client.get_base_user(3).get_friends()]
+        presences = await client.presence.get_user_presences([1, 2])
+        return friends, presences
+
+    friends, presences = asyncio.run(main())
+    assert [presence.user for presence in presences] == friends
+    assert all(presence.user is friend for presence, friend in zip(presences, friends))
+    assert presences[0].place is presences[1].place is presences[0].root_place
+    assert presences[0].universe is presences[1].universe
+    assert isinstance(presences[0].universe, BaseUniverse)
+
+
+def test_identity_map_drops_collected_objects():
+    identity_map = IdentityMap()
+
+    class Item:
+        pass
+
+    item = identity_map.get(Item, 1, Item)
+    assert identity_map.get(Item, 1, Item) is item
+    assert len(identity_map) == 1
+    del item
+    gc.collect()
+    assert len(identity_map) == 0
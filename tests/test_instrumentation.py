@@ -0,0 +1,169 @@
+"""
+Tests for timing requests per endpoint and counting retries and cache hits.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from httpx import Response
+
+from roblox.utilities.cache import ResponseCache
+from roblox.utilities.exceptions import NotFound
+from roblox.utilities.instrumentation import Instrumentation, LatencyHistogram, OpenTelemetryAdapter, get_endpoint
+from roblox.utilities.ratelimit import RateLimiter
+
+
+def _sequence_handler(responses):
+    def handler(request):
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler
+
+
+def test_endpoints_are_templated():
+    endpoint = get_endpoint("https://groups.roblox.com/v1/groups/123/users?limit=10")
+    assert endpoint == "groups.roblox.com/v1/groups/{id}/users"
+    assert get_endpoint("https://t3.rbxcdn.com/" + "a" * 32) == "t3.rbxcdn.com/{hash}"
+    assert get_endpoint("https://users.roblox.com/v1/users/authenticated") == "users.roblox.com/v1/users/authenticated"
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.5, 1.0))
+    for duration in [0.05] * 50 + [0.15] * 45 + [0.7] * 5:
+        histogram.observe(duration)
+    assert histogram.count == 100
+    assert 0 < histogram.p50 <= 0.1
+    assert 0.1 < histogram.p95 <= 0.2
+    assert 0.5 < histogram.p99 <= 0.7
+    assert histogram.get_percentile(100) == histogram.max == 0.7
+    assert LatencyHistogram().p99 == 0
+
+
+def test_attempts_are_recorded_per_endpoint_and_status(mock_client):
+    instrumentation = Instrumentation()
+    client = mock_client(lambda request: Response(200, json={}), instrumentation=instrumentation)
+
+    async def main():
+        for user_id in (1, 2, 3):
+            await client.requests.get(f"https://users.roblox.com/v1/users/{user_id}")
+        await client.requests.post("https://users.roblox.com/v1/usernames/users")
+
+    asyncio.run(main())
+    assert instrumentation.histograms[("GET", "users.roblox.com/v1/users/{id}")].count == 3
+    assert instrumentation.histograms[("POST", "users.roblox.com/v1/usernames/users")].count == 1
+    assert instrumentation.statuses == {
+        ("GET", "users.roblox.com/v1/users/{id}", "200"): 3,
+        ("POST", "users.roblox.com/v1/usernames/users", "200"): 1
+    }
+
+
+def test_retries_and_failures_are_recorded(mock_client):
+    instrumentation = Instrumentation()
+    responses = [
+        Response(429, headers={"Retry-After": "0"}, json={"errors": [{"code": 0, "message": "Slow"}]}),
+        httpx.ConnectError("refused"),
+    ]
+    client = mock_client(
+        _sequence_handler(responses), rate_limiter=RateLimiter(max_retries=2), instrumentation=instrumentation
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(client.requests.get("https://users.roblox.com/v1/users/1"))
+    assert instrumentation.counters["retries"] == 1
+    assert instrumentation.statuses == {
+        ("GET", "users.roblox.com/v1/users/{id}", "429"): 1,
+        ("GET", "users.roblox.com/v1/users/{id}", "error"): 1
+    }
+
+
+def test_cache_hits_are_counted(mock_client):
+    instrumentation = Instrumentation()
+    client = mock_client(
+        lambda request: Response(200, json={}), cache=ResponseCache(default_ttl=60), instrumentation=instrumentation
+    )
+
+    async def main():
+        for _ in range(3):
+            await client.requests.get("https://users.roblox.com/v1/users/1")
+
+    asyncio.run(main())
+    assert (instrumentation.counters["cache_misses"], instrumentation.counters["cache_hits"]) == (1, 2)
+    assert instrumentation.histograms[("GET", "users.roblox.com/v1/users/{id}")].count == 1
+
+
+def test_hooks_see_every_attempt(mock_client):
+    instrumentation = Instrumentation()
+    started = []
+    finished = []
+
+    async def response_hook(record):
+        await asyncio.sleep(0)
+        finished.append((record.status, record.attempt, record.elapsed is not None))
+
+    instrumentation.add_request_hook(lambda record: started.append((record.method, record.endpoint)))
+    instrumentation.add_response_hook(response_hook)
+    responses = [Response(404, json={"errors": [{"code": 0, "message": "NotFound"}]})]
+    client = mock_client(_sequence_handler(responses), instrumentation=instrumentation)
+
+    with pytest.raises(NotFound):
+        asyncio.run(client.requests.get("https://games.roblox.com/v1/games/1"))
+    assert started == [("GET", "games.roblox.com/v1/games/{id}")]
+    assert finished == [("404", 0, True)]
+
+
+def test_streamed_requests_are_recorded(mock_client):
+    instrumentation = Instrumentation()
+    client = mock_client(lambda request: Response(200, json={"data": [1, 2]}), instrumentation=instrumentation)
+
+    items = []
+    asyncio.run(client.requests.stream("GET", "https://groups.roblox.com/v1/groups/1/roles", item_handler=items.append))
+    assert items == [1, 2]
+    assert instrumentation.statuses == {("GET", "groups.roblox.com/v1/groups/{id}/roles", "200"): 1}
+
+
+def test_prometheus_export():
+    instrumentation = Instrumentation(buckets=(0.1, 1.0))
+    instrumentation.histograms[("GET", "a.roblox.com/\"x\"")] = histogram = LatencyHistogram((0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    instrumentation.increment("retries", 2)
+
+    text = instrumentation.export_prometheus(prefix="test")
+    assert 'test_request_duration_seconds_bucket{method="GET",endpoint="a.roblox.com/\\"x\\"",le="0.1"} 1' in text
+    assert 'le="+Inf"} 2' in text
+    assert "test_retries_total 2" in text
+
+    instrumentation.reset()
+    assert instrumentation.histograms == {}
+    assert instrumentation.counters["retries"] == 0
+
+
+def test_opentelemetry_adapter_forwards_attempts(mock_client):
+    recorded = {"durations": [], "retries": []}
+
+    def create_histogram(**kwargs):
+        return SimpleNamespace(record=lambda value, attributes: recorded["durations"].append(attributes))
+
+    def create_counter(**kwargs):
+        return SimpleNamespace(add=lambda value, attributes: recorded["retries"].append(attributes))
+
+    instrumentation = Instrumentation()
+    OpenTelemetryAdapter(instrumentation, meter=SimpleNamespace(
+        create_histogram=create_histogram, create_counter=create_counter
+    ))
+    responses = [
+        Response(429, headers={"Retry-After": "0"}, json={"errors": [{"code": 0, "message": "Slow"}]}),
+        Response(200, json={})
+    ]
+    client = mock_client(
+        _sequence_handler(responses), rate_limiter=RateLimiter(max_retries=2), instrumentation=instrumentation
+    )
+
+    asyncio.run(client.requests.get("https://users.roblox.com/v1/users/1"))
+    assert [attributes["http.response.status_code"] for attributes in recorded["durations"]] == ["429", "200"]
+    assert len(recorded["retries"]) == 1
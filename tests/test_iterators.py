@@ -0,0 +1,162 @@
+"""
+Tests for paginated iterators.
+"""
+
+import asyncio
+import gc
+
+import pytest
+from httpx import Response
+
+from roblox.utilities.exceptions import InternalServerError
+from roblox.utilities.iterators import PageIterator, PageNumberIterator
+
+_url = "https://groups.roblox.com/v1/groups/1/users"
+
+
+def _cursor_handler(pages: int, page_size: int, log: list, fail_on: int = None):
+    async def handler(request):
+        cursor = request.url.params.get("cursor")
+        page = int(cursor) if cursor else 0
+        log.append(page)
+        await asyncio.sleep(0.001)
+        if page == fail_on:
+            return Response(500, json={"errors": [{"code": 0, "message": "Error"}]})
+        return Response(200, json={
+            "previousPageCursor": str(page - 1) if page else None,
+            "nextPageCursor": str(page + 1) if page + 1 < pages else None,
+            "data": [{"id": page * page_size + index} for index in range(page_size)]
+        })
+
+    return handler
+
+
+def _iterator(client, **kwargs) -> PageIterator:
+    return PageIterator(client=client, url=_url, page_size=10, **kwargs)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+@pytest.mark.parametrize("stream", [False, True])
+def test_pages_are_returned_in_order(mock_client, prefetch, stream):
+    client = mock_client(_cursor_handler(pages=5, page_size=10, log=[]))
+
+    async def main():
+        return [item["id"] async for item in _iterator(client, prefetch=prefetch, stream=stream)]
+
+    assert asyncio.run(main()) == list(range(50))
+
+
+def test_prefetching_stays_within_its_buffer(mock_client):
+    log = []
+    client = mock_client(_cursor_handler(pages=20, page_size=10, log=log))
+
+    async def main():
+        iterator = _iterator(client, prefetch=2)
+        await iterator.next()
+        await asyncio.sleep(0.05)
+        fetched = len(log)
+        await iterator.aclose()
+        return fetched
+
+    # the consumed page, two buffered pages and one page waiting for room in the buffer
+    assert asyncio.run(main()) <= 4
+
+
+def test_max_items_stops_prefetching(mock_client):
+    log = []
+    client = mock_client(_cursor_handler(pages=20, page_size=10, log=log))
+
+    async def main():
+        iterator = _iterator(client, prefetch=2, max_items=15)
+        items = await iterator.flatten()
+        await asyncio.sleep(0.02)
+        return items, iterator._prefetch_task
+
+    items, task = asyncio.run(main())
+    assert [item["id"] for item in items] == list(range(15))
+    assert task is None
+
+
+def test_prefetched_errors_are_raised_in_order(mock_client):
+    client = mock_client(_cursor_handler(pages=5, page_size=10, log=[], fail_on=2))
+
+    async def main():
+        items = []
+        with pytest.raises(InternalServerError):
+            async for item in _iterator(client, prefetch=3):
+                items.append(item["id"])
+        return items
+
+    assert asyncio.run(main()) == list(range(20))
+
+
+def test_context_manager_closes_the_worker(mock_client):
+    client = mock_client(_cursor_handler(pages=20, page_size=10, log=[]))
+
+    async def main():
+        async with _iterator(client, prefetch=2) as iterator:
+            await iterator.next()
+            task = iterator._prefetch_task
+        await asyncio.sleep(0)
+        return task
+
+    assert asyncio.run(main()).done()
+
+
+def test_abandoned_iterators_release_their_worker(mock_client):
+    client = mock_client(_cursor_handler(pages=20, page_size=10, log=[]))
+
+    async def main():
+        iterator = _iterator(client, prefetch=2)
+        await iterator.next()
+        task = iterator._prefetch_task
+        del iterator
+        gc.collect()
+        await asyncio.sleep(0.02)
+        return task
+
+    assert asyncio.run(main()).cancelled()
+
+
+def _page_number_handler(pages: int, page_size: int, log: list):
+    async def handler(request):
+        page_number = int(request.url.params["pageNumber"])
+        log.append(page_number)
+        await asyncio.sleep(0.005)
+        if page_number > pages:
+            return Response(200, json=[])
+        return Response(200, json=[{"id": (page_number - 1) * page_size + index} for index in range(page_size)])
+
+    return handler
+
+
+@pytest.mark.parametrize("page_window", [1, 3, 4])
+def test_page_number_windows_keep_order(mock_client, page_window):
+    log = []
+    client = mock_client(_page_number_handler(pages=7, page_size=5, log=log))
+
+    async def main():
+        iterator = PageNumberIterator(client=client, url=_url, page_size=5, page_window=page_window)
+        return [item["id"] async for item in iterator]
+
+    assert asyncio.run(main()) == list(range(35))
+    # windows stop at the first empty page instead of fetching another window
+    assert max(log) < 8 + page_window
+
+
+def test_page_number_windows_are_fetched_together(mock_client):
+    log = []
+    client = mock_client(_page_number_handler(pages=8, page_size=5, log=log))
+
+    async def main():
+        iterator = PageNumberIterator(client=client, url=_url, page_size=5, page_window=4)
+        first = await iterator.next()
+        fetched = sorted(log)
+        second = await iterator.next()
+        return first, second, fetched
+
+    first, second, fetched = asyncio.run(main())
+    assert fetched == [1, 2, 3, 4]
+    assert [item["id"] for item in first + second] == list(range(10))
+    # the second page came from the window, not another request
+    assert len(log) == 4
@@ -0,0 +1,68 @@
+"""
+Tests for the JSON codecs used to decode responses and encode request bodies.
+"""
+
+import asyncio
+import json
+import math
+
+import pytest
+from httpx import Response
+
+from roblox.utilities.jsoncodec import JSONCodec, get_json_codec
+
+
+class _RecordingCodec(JSONCodec):
+    name = "recording"
+
+    def __init__(self):
+        self.loaded = 0
+        self.dumped = 0
+
+    def loads(self, data):
+        self.loaded += 1
+        return super().loads(data)
+
+    def dumps(self, value):
+        self.dumped += 1
+        return super().dumps(value)
+
+
+def test_standard_library_is_the_default(mock_client):
+    client = mock_client(lambda request: Response(200))
+    assert type(client.requests.json_codec) is JSONCodec
+    assert type(get_json_codec()) is JSONCodec
+
+
+def test_auto_falls_back_to_an_installed_codec():
+    assert get_json_codec("auto").name in ("orjson", "ujson", "json")
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_json_codec("simplejson")
+
+
+def test_standard_library_rejects_nan():
+    with pytest.raises(ValueError):
+        JSONCodec().dumps({"value": math.nan})
+
+
+def test_codec_decodes_responses_and_encodes_bodies(mock_client):
+    bodies = []
+
+    def handler(request):
+        bodies.append((request.headers["Content-Type"], json.loads(request.content)))
+        return Response(200, json={"data": [{"id": 1}]})
+
+    codec = _RecordingCodec()
+    client = mock_client(handler, json_codec=codec)
+
+    async def main():
+        response = await client.requests.post("https://example.roblox.com/v1/test", json={"ids": [1]})
+        return client.requests.read_json(response)
+
+    assert asyncio.run(main()) == {"data": [{"id": 1}]}
+    assert bodies == [("application/json", {"ids": [1]})]
+    assert codec.loaded == 1
+    assert codec.dumped == 1
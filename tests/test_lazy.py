@@ -0,0 +1,74 @@
+"""
+Tests for building heavy model attributes lazily.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from httpx import Response
+
+import roblox.badges
+from roblox.badges import Badge, BadgeStatistics
+from roblox.utilities.lazy import LazyAttribute
+
+_badge_data = {
+    "id": 1, "name": "Badge", "description": "", "displayName": "Badge", "displayDescription": "",
+    "enabled": True, "iconImageId": 2, "displayIconImageId": 3,
+    "created": "2021-01-01T00:00:00Z", "updated": "2021-06-01T00:00:00.5Z",
+    "statistics": {"pastDayAwardedCount": 1, "awardedCount": 10, "winRatePercentage": 0.5},
+    "awardingUniverse": {"id": 4, "name": "Universe", "rootPlaceId": 5}
+}
+
+
+@pytest.fixture
+def parse_count(monkeypatch) -> list:
+    calls = []
+    parse_datetime = roblox.badges.parse_datetime
+
+    def counting_parse_datetime(value):
+        calls.append(value)
+        return parse_datetime(value)
+
+    monkeypatch.setattr(roblox.badges, "parse_datetime", counting_parse_datetime)
+    return calls
+
+
+def _get_badge(mock_client, **kwargs) -> Badge:
+    client = mock_client(lambda request: Response(200, json=_badge_data), **kwargs)
+    return asyncio.run(client.get_badge(1))
+
+
+@pytest.mark.parametrize("lazy_models", [False, True])
+def test_attributes_match_in_both_modes(mock_client, lazy_models):
+    badge = _get_badge(mock_client, lazy_models=lazy_models)
+    assert badge.icon.id == 2
+    assert badge.display_icon.id == 3
+    assert badge.created == datetime(2021, 1, 1, tzinfo=badge.created.tzinfo)
+    assert isinstance(badge.updated, datetime)
+    assert isinstance(badge.statistics, BadgeStatistics)
+    assert badge.statistics.awarded_count == 10
+    assert badge.awarding_universe.id == 4
+
+
+def test_eager_models_build_everything_up_front(mock_client, parse_count):
+    badge = _get_badge(mock_client)
+    assert parse_count == [_badge_data["created"], _badge_data["updated"]]
+    assert "statistics" in vars(badge)
+
+
+def test_lazy_models_build_attributes_once_on_first_read(mock_client, parse_count):
+    badge = _get_badge(mock_client, lazy_models=True)
+    assert parse_count == []
+    assert "created" not in vars(badge)
+
+    created = badge.created
+    assert badge.created is created
+    assert parse_count == [_badge_data["created"]]
+    assert "created" in vars(badge)
+    assert "updated" not in vars(badge)
+
+
+def test_class_access_returns_the_descriptor():
+    assert isinstance(Badge.statistics, LazyAttribute)
+    assert Badge.statistics.name == "statistics"
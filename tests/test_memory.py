@@ -0,0 +1,63 @@
+"""
+Memory regression tests for the __slots__ declared on bases, partials and members.
+"""
+
+import tracemalloc
+
+from roblox import Client
+from roblox.bases.baseuser import BaseUser
+from roblox.members import Member
+from roblox.partials.partialuser import PartialUser
+
+_count = 20000
+
+_client = Client()
+_group = _client.get_base_group(1)
+
+
+class _DictUser:
+    # the same attributes as a BaseUser, kept in an instance __dict__
+    def __init__(self, client, user_id):
+        self._client = client
+        self.id = user_id
+
+
+def _get_size_per_object(make) -> float:
+    tracemalloc.start()
+    objects = [make(index) for index in range(_count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    # the list holding the objects isn't part of their size
+    return (size - _count * 8) / _count
+
+
+def _get_member_data(index: int) -> dict:
+    return {
+        "user": {"userId": index, "username": "a", "displayName": "a", "hasVerifiedBadge": False},
+        "role": {"id": 1, "name": "r", "rank": 1}
+    }
+
+
+def test_slotted_objects_have_no_dict():
+    user_data = {"id": 1, "name": "a", "displayName": "a", "hasVerifiedBadge": False}
+    for item in (
+            BaseUser(client=_client, user_id=1),
+            PartialUser(client=_client, data=user_data),
+            Member(client=_client, data=_get_member_data(1), group=_group)
+    ):
+        assert not hasattr(item, "__dict__"), type(item).__name__
+
+
+def test_base_user_is_smaller_than_dict_equivalent():
+    slotted = _get_size_per_object(lambda index: BaseUser(client=_client, user_id=index + 1000))
+    unslotted = _get_size_per_object(lambda index: _DictUser(_client, index + 1000))
+    # measured at 80 vs 120 bytes on CPython 3.11
+    assert slotted <= unslotted * 0.75, (slotted, unslotted)
+
+
+def test_member_size():
+    member_data = [_get_member_data(index + 1000) for index in range(_count)]
+    size = _get_size_per_object(lambda index: Member(client=_client, data=member_data[index], group=_group))
+    # measured at 152 bytes on CPython 3.11, down from 240 before __slots__
+    assert size <= 176, size
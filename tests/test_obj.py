@@ -0,0 +1,107 @@
+"""
+Tests for parsing OBJ geometry and downloading 3D thumbnail bundles.
+"""
+
+import asyncio
+
+import pytest
+from httpx import Response
+
+from roblox.delivery import CDNStore
+from roblox.threedthumbnails import ThreeDThumbnail
+from roblox.utilities.obj import parse_obj
+
+_obj = b"""# a unit square made of one quad and a triangle
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 -2
+vt 0 0
+vt 1 1
+vn 0 0 1
+usemtl first
+f 1/1/1 2/2/1 3/2/1 4/1/1
+usemtl second
+f -3//1 -2//1 -1//1
+"""
+
+_files = {
+    "obj": _obj,
+    "mtl": b"newmtl first\n",
+    "texture1": b"\x89PNG1",
+    "texture2": b"\x89PNG2"
+}
+
+
+def test_polygons_are_split_into_triangles():
+    mesh = parse_obj(_obj)
+    assert (mesh.vertex_count, mesh.triangle_count) == (4, 3)
+    assert list(mesh.faces) == [0, 1, 2, 0, 2, 3, 1, 2, 3]
+    assert list(mesh.face_uvs) == [0, 1, 1, 0, 1, 0, -1, -1, -1]
+    assert list(mesh.face_normals) == [0] * 9
+    assert mesh.materials == [("first", 0), ("second", 2)]
+    assert mesh.get_bounds() == ((0, 0, -2), (1, 1, 0))
+
+
+@pytest.mark.parametrize("face", ["f 1 2 5", "f 0 1 2", "f 1/3 2 3", "f 1//2 2 3", "f -5 1 2", "f a 1 2"])
+def test_undefined_indices_are_rejected(face):
+    with pytest.raises(ValueError, match="Line 7"):
+        parse_obj("v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nvt 0 0\nvn 0 0 1\n" + face)
+
+
+def test_empty_files_have_no_bounds():
+    mesh = parse_obj("")
+    assert mesh.triangle_count == 0
+    assert mesh.get_bounds() is None
+
+
+def _get_thumbnail(client) -> ThreeDThumbnail:
+    # thumbnail CDN hashes are served from the path of the hash, so each file gets a hash of its own
+    return ThreeDThumbnail(client=client, data={
+        "obj": "obj", "mtl": "mtl", "textures": ["texture1", "texture2"],
+        "camera": {"fov": 70, "position": {"x": 0, "y": 0, "z": 0}, "direction": {"x": 0, "y": 0, "z": 1}},
+        "aabb": {"min": {"x": 0, "y": 0, "z": 0}, "max": {"x": 1, "y": 1, "z": 1}}
+    })
+
+
+def _files_handler(requests):
+    def handler(request):
+        name = request.url.path.rsplit("/", 1)[1]
+        requests.append(name)
+        return Response(200, content=_files[name])
+
+    return handler
+
+
+def test_get_bundle_downloads_and_parses_every_file(mock_client):
+    requests = []
+    client = mock_client(_files_handler(requests))
+
+    bundle = asyncio.run(_get_thumbnail(client).get_bundle())
+    assert sorted(requests) == ["mtl", "obj", "texture1", "texture2"]
+    assert bundle.mesh.triangle_count == 3
+    assert bundle.mtl == "newmtl first\n"
+    assert bundle.textures == [b"\x89PNG1", b"\x89PNG2"]
+    assert (bundle.aabb.min.z, bundle.aabb.max.x) == (-2, 1)
+
+
+def test_get_bundle_reuses_stored_files(mock_client, tmp_path):
+    requests = []
+    client = mock_client(_files_handler(requests))
+    store = CDNStore(tmp_path)
+
+    async def main():
+        await _get_thumbnail(client).get_bundle(store=store, load_textures=False)
+        return await _get_thumbnail(client).get_bundle(store=store)
+
+    bundle = asyncio.run(main())
+    assert sorted(requests) == ["mtl", "obj", "texture1", "texture2"]
+    assert bundle.mesh.vertex_count == 4
+    assert bundle.textures == [b"\x89PNG1", b"\x89PNG2"]
+
+
+def test_get_bundle_raises_for_malformed_meshes(mock_client):
+    client = mock_client(lambda request: Response(200, content=b"f 1 2 3"))
+
+    with pytest.raises(ValueError):
+        asyncio.run(_get_thumbnail(client).get_bundle(load_textures=False))
@@ -0,0 +1,119 @@
+"""
+Tests for spreading requests across the sessions of a ClientPool.
+"""
+
+import asyncio
+
+import pytest
+from httpx import MockTransport, Response
+
+from roblox.pool import ClientPool, PoolSession, PoolStrategy
+from roblox.utilities.exceptions import TooManyRequests
+from roblox.utilities.ratelimit import RateLimiter
+from roblox.utilities.transport import TransportSettings
+
+
+class _MockTransportSettings(TransportSettings):
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+
+    def get_session_options(self, proxy=None) -> dict:
+        return {"transport": MockTransport(self.handler)}
+
+
+def _make_pool(handler, tokens, **kwargs) -> ClientPool:
+    return ClientPool(
+        sessions=[
+            PoolSession(token=token, name=token, transport=_MockTransportSettings(handler)) for token in tokens
+        ],
+        **kwargs
+    )
+
+
+def _get_token(request) -> str:
+    return request.headers["Cookie"].split(".ROBLOSECURITY=")[1].split(";")[0]
+
+
+def test_round_robin():
+    tokens = []
+
+    def handler(request):
+        tokens.append(_get_token(request))
+        return Response(200, json={"id": 1})
+
+    pool = _make_pool(handler, ["a", "b", "c"])
+
+    async def main():
+        for _ in range(6):
+            await pool.requests.get("https://users.roblox.com/v1/users/1")
+
+    asyncio.run(main())
+    assert tokens == ["a", "b", "c", "a", "b", "c"]
+
+
+def test_rate_limited_session_is_cooled_down():
+    tokens = []
+
+    def handler(request):
+        token = _get_token(request)
+        tokens.append(token)
+        if token == "a":
+            return Response(429, headers={"Retry-After": "60"}, json={"errors": [{"code": 0, "message": "Slow"}]})
+        return Response(200, json={"id": 1})
+
+    pool = _make_pool(handler, ["a", "b"])
+
+    async def main():
+        for _ in range(3):
+            response = await pool.requests.get("https://users.roblox.com/v1/users/1")
+            assert pool.requests.read_json(response) == {"id": 1}
+
+    asyncio.run(main())
+    assert tokens == ["a", "b", "b", "b"]
+    assert pool.sessions[0].failures == 1
+
+
+def test_every_session_rate_limited_raises():
+    def handler(request):
+        return Response(429, headers={"Retry-After": "60"}, json={"errors": [{"code": 0, "message": "Slow"}]})
+
+    pool = _make_pool(handler, ["a", "b"], strategy=PoolStrategy.least_loaded)
+    with pytest.raises(TooManyRequests):
+        asyncio.run(pool.requests.get("https://users.roblox.com/v1/users/1"))
+
+
+def test_xcsrf_tokens_are_fetched_from_the_pool_base_url():
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        if request.url.path == "/v2/logout":
+            return Response(403, headers={"X-CSRF-Token": "token"})
+        assert request.headers["X-CSRF-Token"] == "token"
+        return Response(200, json={})
+
+    pool = _make_pool(handler, ["a"], base_url="example.com")
+    asyncio.run(pool.requests.post("https://groups.example.com/v1/groups/1/wall/posts"))
+    assert urls[0] == "https://auth.example.com/v2/logout"
+
+
+def test_set_token_resets_each_session():
+    pool = _make_pool(lambda request: Response(200), ["a", "b"])
+    for session in pool.sessions:
+        session.requests.xcsrf_tokens.update("old")
+
+    pool.set_token("c")
+    for session in pool.sessions:
+        assert session.requests.session.cookies[".ROBLOSECURITY"] == "c"
+        assert session.requests.xcsrf_tokens.token is None
+
+
+@pytest.mark.parametrize("argument", [
+    {"rate_limiter": RateLimiter()},
+    {"transport": TransportSettings()},
+    {"session": object()}
+])
+def test_per_session_arguments_are_rejected(argument):
+    with pytest.raises(TypeError):
+        ClientPool(sessions=[PoolSession()], **argument)
@@ -0,0 +1,127 @@
+"""
+Tests for batched presence lookups and the PresenceWatcher.
+"""
+
+import asyncio
+import json
+
+import pytest
+from httpx import Response
+
+from roblox.presence import PresenceChangeType
+from roblox.utilities.exceptions import Unauthorized
+
+
+def _get_presence_data(user_id: int, presence_type: int) -> dict:
+    return {
+        "userPresenceType": presence_type,
+        "lastLocation": "",
+        "placeId": None,
+        "rootPlaceId": None,
+        "gameId": None,
+        "universeId": None,
+        "userId": user_id,
+        "lastOnline": "2021-01-01T00:00:00.000Z"
+    }
+
+
+def _presence_handler(get_type):
+    def handler(request):
+        user_ids = json.loads(request.content)["userIds"]
+        return Response(200, json={
+            "userPresences": [_get_presence_data(user_id, get_type(user_id)) for user_id in user_ids]
+        })
+
+    return handler
+
+
+def test_get_user_presences_is_batched_and_bounded(mock_client):
+    state = {"running": 0, "most": 0, "batches": []}
+
+    async def handler(request):
+        state["running"] += 1
+        state["most"] = max(state["most"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        user_ids = json.loads(request.content)["userIds"]
+        state["batches"].append(len(user_ids))
+        return Response(200, json={"userPresences": [_get_presence_data(user_id, 1) for user_id in user_ids]})
+
+    client = mock_client(handler)
+    presences = asyncio.run(client.presence.get_user_presences(list(range(1, 501)), concurrency=3))
+
+    assert [presence.user.id for presence in presences] == list(range(1, 501))
+    assert sorted(state["batches"]) == [50] * 10
+    assert state["most"] <= 3
+
+
+def test_poll_reports_only_changes(mock_client):
+    types = {1: 0, 2: 0}
+    client = mock_client(_presence_handler(lambda user_id: types[user_id]))
+    watcher = client.presence.watch([1, 2])
+
+    async def main():
+        assert await watcher.poll() == []
+        types[2] = 2
+        changes = await watcher.poll()
+        assert [change.user.id for change in changes] == [2]
+        assert changes[0].change_type == PresenceChangeType.online
+        assert await watcher.poll() == []
+
+    asyncio.run(main())
+
+
+def test_stop_ends_iteration(mock_client):
+    polls = {"count": 0}
+
+    def get_type(user_id):
+        polls["count"] += 1
+        return polls["count"] % 3
+
+    client = mock_client(_presence_handler(get_type))
+    watcher = client.presence.watch([1], interval=0.01)
+
+    async def main():
+        changes = []
+        async for change in watcher:
+            changes.append(change)
+            if len(changes) == 2:
+                watcher.stop()
+        with pytest.raises(StopAsyncIteration):
+            await watcher.__anext__()
+        return changes
+
+    assert len(asyncio.run(main())) >= 2
+
+
+def test_failing_polls_are_raised(mock_client):
+    client = mock_client(lambda request: Response(401, json={"errors": [{"code": 0, "message": "Unauthorized"}]}))
+    watcher = client.presence.watch([1], interval=0, max_failed_polls=3)
+
+    async def main():
+        with pytest.raises(Unauthorized):
+            async for _ in watcher:
+                pass
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+    assert watcher.polls == watcher.failed_polls == 3
+    assert isinstance(watcher.last_exception, Unauthorized)
+
+
+def test_partly_failing_polls_keep_going(mock_client):
+    def handler(request):
+        user_ids = json.loads(request.content)["userIds"]
+        if 1 in user_ids:
+            return Response(500, json={"errors": [{"code": 0, "message": "Error"}]})
+        return Response(200, json={"userPresences": [_get_presence_data(user_id, 0) for user_id in user_ids]})
+
+    client = mock_client(handler)
+    watcher = client.presence.watch([1] + list(range(100, 150)), max_failed_polls=1)
+
+    async def main():
+        for _ in range(3):
+            await watcher.poll()
+
+    asyncio.run(main())
+    assert watcher.failures == 3
+    assert watcher.failed_polls == 0
@@ -0,0 +1,113 @@
+"""
+Tests for scheduling requests within rate limits and retrying rate-limited and failed requests.
+"""
+
+import asyncio
+import time
+
+import pytest
+from httpx import Request, Response
+
+from roblox.utilities.exceptions import InternalServerError, TooManyRequests
+from roblox.utilities.ratelimit import RateLimiter, TokenBucket, _parse_retry_after
+
+_url = "https://users.roblox.com/v1/users/1"
+
+
+def _sequence_handler(responses, log):
+    def handler(request):
+        log.append(request.method)
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return handler
+
+
+def test_retry_after_header():
+    assert _parse_retry_after("2.5") == 2.5
+    assert _parse_retry_after("-1") == 0
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+def test_token_bucket_limits_the_rate():
+    bucket = TokenBucket(rate=100, capacity=2)
+
+    async def main():
+        started = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    # two requests fit in the burst and the other four wait 10ms each
+    assert asyncio.run(main()) >= 0.035
+
+
+def test_subdomains_have_their_own_buckets():
+    limiter = RateLimiter(rate=5, burst=5, limits={"thumbnails": (20, 40)})
+    users = limiter.get_bucket("https://users.roblox.com/v1/users/1")
+    assert limiter.get_bucket("https://users.roblox.com/v1/users/2") is users
+    thumbnails = limiter.get_bucket("https://thumbnails.roblox.com/v1/users/avatar")
+    assert (thumbnails.rate, thumbnails.capacity) == (20, 40)
+    assert thumbnails is not users
+
+
+def test_429_is_retried_after_retry_after(mock_client):
+    log = []
+    responses = [
+        Response(429, headers={"Retry-After": "0.05"}, json={"errors": [{"code": 0, "message": "Slow"}]}),
+        Response(200, json={"id": 1})
+    ]
+    client = mock_client(_sequence_handler(responses, log), rate_limiter=RateLimiter(max_retries=3))
+
+    async def main():
+        started = time.monotonic()
+        response = await client.requests.get(_url)
+        return response, time.monotonic() - started
+
+    response, elapsed = asyncio.run(main())
+    assert response.json() == {"id": 1}
+    assert log == ["GET", "GET"]
+    assert elapsed >= 0.05
+
+
+def test_retries_give_up_after_max_retries(mock_client):
+    log = []
+    responses = [Response(429, headers={"Retry-After": "0"}, json={"errors": [{"code": 0, "message": "Slow"}]})]
+    client = mock_client(_sequence_handler(responses, log), rate_limiter=RateLimiter(max_retries=2))
+
+    with pytest.raises(TooManyRequests):
+        asyncio.run(client.requests.get(_url))
+    assert len(log) == 3
+
+
+def test_server_errors_are_only_retried_for_idempotent_methods(mock_client):
+    log = []
+    responses = [Response(500, json={"errors": [{"code": 0, "message": "Error"}]})]
+    limiter = RateLimiter(max_retries=2, backoff_base=0.001)
+    client = mock_client(_sequence_handler(responses, log), rate_limiter=limiter)
+
+    async def main():
+        with pytest.raises(InternalServerError):
+            await client.requests.get(_url)
+        with pytest.raises(InternalServerError):
+            await client.requests.post(_url)
+
+    asyncio.run(main())
+    assert log == ["GET", "GET", "GET", "POST"]
+
+
+def test_exhausted_budget_pauses_the_subdomain():
+    limiter = RateLimiter()
+    response = Response(
+        200,
+        headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": "0.05"},
+        request=Request("GET", _url)
+    )
+    limiter.update(_url, response)
+
+    async def main():
+        started = time.monotonic()
+        await limiter.acquire(_url)
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 0.04
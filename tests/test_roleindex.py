@@ -0,0 +1,138 @@
+"""
+Tests for the cached role table used by set_rank.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from httpx import Response
+
+import roblox.utilities.roleindex
+from roblox.utilities.exceptions import BadRequest, InvalidRole
+
+
+class _Group:
+    # serves a group's roles and accepts role changes to roles that still exist and aren't rejected
+    def __init__(self):
+        self.roles = [{"id": 10, "name": "Guest", "rank": 0}, {"id": 11, "name": "Member", "rank": 1}]
+        self.role_fetches = 0
+        self.role_changes = []
+        self.rejected = set()
+
+    async def handler(self, request):
+        if request.method == "GET":
+            self.role_fetches += 1
+            await asyncio.sleep(0.005)
+            return Response(200, json={"groupId": 1, "roles": self.roles})
+
+        role_id = json.loads(request.content)["roleId"]
+        self.role_changes.append(role_id)
+        if role_id in self.rejected or role_id not in [role["id"] for role in self.roles]:
+            return Response(400, json={"errors": [{"code": 2, "message": "The roleset is invalid or does not exist."}]})
+        return Response(200, json={})
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(roblox.utilities.roleindex, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_set_rank_reuses_the_role_table(mock_client):
+    group = _Group()
+    client = mock_client(group.handler)
+
+    async def main():
+        await asyncio.gather(*(client.get_base_group(1).set_rank(user_id, 1) for user_id in range(5)))
+        await client.get_base_group(1).set_rank(6, 0)
+
+    asyncio.run(main())
+    assert group.role_fetches == 1
+    assert group.role_changes == [11] * 5 + [10]
+
+
+def test_role_table_is_fetched_again_once_it_expires(mock_client, clock):
+    group = _Group()
+    client = mock_client(group.handler, role_ttl=60)
+
+    async def main():
+        index = client.get_base_group(1).get_role_index()
+        await index.get_by_rank(1)
+        clock.now += 30
+        await index.get_by_rank(1)
+        clock.now += 31
+        role = await index.get_by_name("Member")
+        return role, index.version
+
+    role, version = asyncio.run(main())
+    assert role.id == 11
+    assert group.role_fetches == version == 2
+
+
+def test_rejected_roles_are_looked_up_again(mock_client):
+    group = _Group()
+    client = mock_client(group.handler)
+
+    async def main():
+        await client.get_base_group(1).set_rank(1, 1)
+        # the role was deleted and replaced since the table was fetched
+        group.roles[1] = {"id": 12, "name": "Member", "rank": 1}
+        await client.get_base_group(1).set_rank(1, 1)
+
+    asyncio.run(main())
+    assert group.role_changes == [11, 11, 12]
+    assert group.role_fetches == 2
+
+
+def test_rejections_for_current_roles_are_raised(mock_client):
+    group = _Group()
+    group.rejected.add(11)
+    client = mock_client(group.handler)
+
+    with pytest.raises(BadRequest):
+        asyncio.run(client.get_base_group(1).set_rank(1, 1))
+    # the role table was fetched again, but the role didn't change, so it wasn't sent a second time
+    assert group.role_changes == [11]
+    assert group.role_fetches == 2
+
+
+def test_missing_ranks_raise_invalid_role(mock_client):
+    group = _Group()
+    client = mock_client(group.handler)
+
+    with pytest.raises(InvalidRole):
+        asyncio.run(client.get_base_group(1).set_rank(1, 200))
+    assert group.role_changes == []
+
+
+def test_role_indexes_are_shared_and_bounded(mock_client):
+    client = mock_client(_Group().handler, max_role_indexes=2)
+
+    first = client.get_base_group(1).get_role_index()
+    assert client.get_base_group(1).get_role_index() is first
+    second = client.get_base_group(2).get_role_index()
+    # using the first index again makes the second one the least recently used
+    client.get_base_group(1).get_role_index()
+    client.get_base_group(3).get_role_index()
+
+    assert client.get_base_group(1).get_role_index() is first
+    assert client.get_base_group(2).get_role_index() is not second
+    assert len(client._role_indexes) == 2
+
+
+def test_concurrent_refreshes_of_one_version_share_a_fetch(mock_client):
+    group = _Group()
+    client = mock_client(group.handler)
+
+    async def main():
+        index = client.get_base_group(1).get_role_index()
+        await index.get_roles()
+        version = index.version
+        await asyncio.gather(*(index.refresh(version) for _ in range(5)))
+        return index.version
+
+    assert asyncio.run(main()) == 2
+    assert group.role_fetches == 2
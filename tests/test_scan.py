@@ -0,0 +1,130 @@
+"""
+Tests for scanning a place's servers and selecting the best of them.
+"""
+
+import asyncio
+
+import pytest
+from httpx import Response
+
+from roblox.jobs import ServerType
+from roblox.utilities.scan import TopK
+
+_page_size = 10
+
+
+def _get_server_data(index: int) -> dict:
+    return {
+        "id": str(index), "maxPlayers": 10, "playing": index % 10, "playerTokens": [], "players": [],
+        # every third server doesn't report its ping
+        "fps": 60 - index % 7, "ping": None if index % 3 == 0 else 20 + (index * 37) % 200
+    }
+
+
+def _servers_handler(pages: int, log: list):
+    async def handler(request):
+        cursor = request.url.params.get("cursor")
+        page = int(cursor) if cursor else 0
+        log.append((page, request.url.params["excludeFullGames"]))
+        await asyncio.sleep(0.001)
+        return Response(200, json={
+            "previousPageCursor": None,
+            "nextPageCursor": str(page + 1) if page + 1 < pages else None,
+            "data": [_get_server_data(page * _page_size + index) for index in range(_page_size)]
+        })
+
+    return handler
+
+
+def _get_matches(pages: int, min_free_slots=None, max_ping=None, min_fps=None):
+    servers = [_get_server_data(index) for index in range(pages * _page_size)]
+    return [
+        server for server in servers
+        if (min_free_slots is None or server["maxPlayers"] - server["playing"] >= min_free_slots)
+        and (max_ping is None or (server["ping"] is not None and server["ping"] <= max_ping))
+        and (min_fps is None or server["fps"] >= min_fps)
+    ]
+
+
+def test_scan_applies_every_filter(mock_client):
+    log = []
+    client = mock_client(_servers_handler(pages=4, log=log))
+
+    async def main():
+        place = client.get_base_place(1)
+        return [server async for server in place.scan_servers(
+            ServerType.public, min_free_slots=3, max_ping=150, min_fps=56,
+            predicate=lambda server: server.id != "5", page_size=_page_size
+        )]
+
+    servers = asyncio.run(main())
+    expected = [server["id"] for server in _get_matches(4, min_free_slots=3, max_ping=150, min_fps=56)]
+    assert [server.id for server in servers] == [server_id for server_id in expected if server_id != "5"]
+    assert all(exclude_full == "true" for _, exclude_full in log)
+
+
+def test_scan_stops_after_max_items(mock_client):
+    log = []
+    client = mock_client(_servers_handler(pages=20, log=log))
+
+    async def main():
+        place = client.get_base_place(1)
+        servers = [server async for server in place.scan_servers(
+            ServerType.public, max_ping=100, max_items=3, page_size=_page_size, prefetch=1
+        )]
+        await asyncio.sleep(0.02)
+        return servers
+
+    servers = asyncio.run(main())
+    assert [server.id for server in servers] == [server["id"] for server in _get_matches(20, max_ping=100)[:3]]
+    # the scan ended on the first page, so at most the prefetched page was fetched besides it
+    assert len(log) <= 2
+
+
+def test_scan_stops_after_max_pages(mock_client):
+    log = []
+    client = mock_client(_servers_handler(pages=20, log=log))
+
+    async def main():
+        place = client.get_base_place(1)
+        return [server async for server in place.scan_servers(
+            ServerType.public, max_pages=2, page_size=_page_size, prefetch=0
+        )]
+
+    assert len(asyncio.run(main())) == 2 * _page_size
+    assert [page for page, _ in log] == [0, 1]
+
+
+def test_find_servers_returns_the_smallest_keys(mock_client):
+    client = mock_client(_servers_handler(pages=5, log=[]))
+
+    async def main():
+        place = client.get_base_place(1)
+        return await place.find_servers(
+            ServerType.public, limit=4, key=lambda server: server.ping, max_ping=1000, page_size=_page_size
+        )
+
+    servers = asyncio.run(main())
+    expected = sorted(_get_matches(5, max_ping=1000), key=lambda server: server["ping"])[:4]
+    assert [server.ping for server in servers] == [server["ping"] for server in expected]
+
+
+def test_find_servers_without_a_key_keeps_roblox_order(mock_client):
+    client = mock_client(_servers_handler(pages=5, log=[]))
+
+    async def main():
+        place = client.get_base_place(1)
+        return await place.find_servers(ServerType.public, limit=4, min_free_slots=5, page_size=_page_size)
+
+    servers = asyncio.run(main())
+    assert [server.id for server in servers] == [server["id"] for server in _get_matches(5, min_free_slots=5)[:4]]
+
+
+@pytest.mark.parametrize("limit", [0, 1, 3, 10])
+def test_top_k_is_stable(limit):
+    items = [(key, index) for index, key in enumerate([5, 1, 3, 1, 4, 5, 9, 2, 6, 3])]
+    top = TopK(limit=limit, key=lambda item: item[0])
+    for item in items:
+        top.add(item)
+    assert top.get_items() == sorted(items, key=lambda item: item[0])[:limit]
+    assert len(top) == min(limit, len(items))
@@ -0,0 +1,101 @@
+"""
+Tests for the incremental JSON decoder used to stream page and multiget bodies.
+"""
+
+import json
+import random
+from json import JSONDecodeError
+
+import pytest
+
+from roblox.utilities.streaming import JSONArrayStreamDecoder
+
+_body = {
+    "previousPageCursor": None,
+    "nextPageCursor": "abc",
+    "data": [
+        {"id": 1, "name": "a é中", "score": 1.5, "ratio": -2.25e-3, "big": 1E+20, "flags": [True, False]},
+        {"id": 2, "name": "", "score": 0.0, "ratio": 10, "big": -0.5e10, "flags": []},
+        3.0,
+        -17,
+        "text",
+        None
+    ],
+    "total": 12.75
+}
+
+
+def _decode(chunks, array_key="data"):
+    decoder = JSONArrayStreamDecoder(array_key=array_key)
+    items = []
+    for chunk in chunks:
+        items += decoder.feed(chunk)
+    items += decoder.close()
+    return items, decoder.fields
+
+
+def _split(data: bytes, sizes):
+    chunks = []
+    position = 0
+    for size in sizes:
+        chunks.append(data[position:position + size])
+        position += size
+    chunks.append(data[position:])
+    return chunks
+
+
+def test_whole_body():
+    items, fields = _decode([json.dumps(_body).encode()])
+    assert items == _body["data"]
+    assert fields == {"previousPageCursor": None, "nextPageCursor": "abc", "total": 12.75}
+
+
+@pytest.mark.parametrize("first, rest", [
+    (b'[1.', b'0, 2]'),
+    (b'[1e', b'2, 2]'),
+    (b'[1E+', b'2, 2]'),
+    (b'[1.5e-', b'3, 2]'),
+    (b'[-', b'1, 2]'),
+    (b'[1', b'2, 2]')
+])
+def test_number_split_across_chunks(first, rest):
+    items, _ = _decode([first, rest], array_key=None)
+    assert items == json.loads(first + rest)
+
+
+def test_every_split_point():
+    data = json.dumps(_body).encode()
+    for index in range(len(data) + 1):
+        items, fields = _decode([data[:index], data[index:]])
+        assert items == _body["data"], index
+        assert fields["total"] == 12.75
+
+
+def test_random_chunks():
+    generator = random.Random(0)
+    for _ in range(300):
+        body = {
+            "data": [
+                {"id": generator.randrange(10 ** 9), "value": generator.uniform(-1e6, 1e6)}
+                for _ in range(generator.randrange(5))
+            ],
+            "nextPageCursor": None
+        }
+        data = json.dumps(body).encode()
+        sizes = [generator.randint(1, 7) for _ in range(len(data))]
+        items, _ = _decode(_split(data, sizes))
+        assert items == body["data"]
+
+
+def test_incomplete_body_raises():
+    decoder = JSONArrayStreamDecoder()
+    decoder.feed(b'{"data": [1, 2')
+    with pytest.raises(JSONDecodeError):
+        decoder.close()
+
+
+def test_malformed_body_raises():
+    decoder = JSONArrayStreamDecoder()
+    decoder.feed(b'{"data": [1.x]}')
+    with pytest.raises(JSONDecodeError):
+        decoder.close()
@@ -0,0 +1,107 @@
+"""
+Tests for batched, deduplicated thumbnail requests and polling pending thumbnails.
+"""
+
+import asyncio
+
+import pytest
+from httpx import Response
+
+from roblox.thumbnails import ThumbnailState
+from roblox.utilities.cache import ResponseCache
+
+
+class _Thumbnails:
+    # serves asset thumbnails, which stay pending for the first few requests for the IDs in pending_polls
+    def __init__(self, pending_polls=None):
+        self.pending_polls = dict(pending_polls or {})
+        self.requests = []
+
+    def handler(self, request):
+        asset_ids = [int(asset_id) for asset_id in request.url.params.get_list("assetIds")]
+        self.requests.append((asset_ids, request.url.params["size"]))
+
+        data = []
+        for asset_id in asset_ids:
+            pending = self.pending_polls.get(asset_id, 0) > 0
+            if pending:
+                self.pending_polls[asset_id] -= 1
+            data.append({
+                "targetId": asset_id,
+                "state": "Pending" if pending else "Completed",
+                "imageUrl": None if pending else f"https://tr.rbxcdn.com/{asset_id}"
+            })
+        return Response(200, json={"data": data})
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list:
+    delays = []
+    sleep = asyncio.sleep
+
+    async def fast_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        return await sleep(0, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "sleep", fast_sleep)
+    return delays
+
+
+def test_ids_are_deduplicated_and_chunked(mock_client):
+    thumbnails = _Thumbnails()
+    client = mock_client(thumbnails.handler)
+    asset_ids = list(range(1, 251)) + [5, 5, 250]
+
+    results = asyncio.run(client.thumbnails.get_asset_thumbnails(asset_ids))
+    assert [thumbnail.target_id for thumbnail in results] == list(range(1, 251))
+    assert sorted(len(ids) for ids, _ in thumbnails.requests) == [50, 100, 100]
+    assert sorted(asset_id for ids, _ in thumbnails.requests for asset_id in ids) == list(range(1, 251))
+
+
+def test_concurrent_calls_with_the_same_options_share_requests(mock_client):
+    thumbnails = _Thumbnails()
+    client = mock_client(thumbnails.handler)
+
+    async def main():
+        return await asyncio.gather(
+            client.thumbnails.get_asset_thumbnails([1, 2]),
+            client.thumbnails.get_asset_thumbnails([2, 3]),
+            client.thumbnails.get_asset_thumbnails([1], size=(420, 420))
+        )
+
+    first, second, large = asyncio.run(main())
+    assert [thumbnail.target_id for thumbnail in first + second + large] == [1, 2, 2, 3, 1]
+    assert sorted((sorted(ids), size) for ids, size in thumbnails.requests) == [
+        ([1], "420x420"), ([1, 2, 3], "30x30")
+    ]
+
+
+def test_pending_thumbnails_are_polled_with_backoff(mock_client, sleeps):
+    thumbnails = _Thumbnails(pending_polls={2: 2})
+    # polls skip the cache, so a cached pending response isn't served again
+    client = mock_client(thumbnails.handler, cache=ResponseCache(default_ttl=60))
+
+    results = asyncio.run(client.thumbnails.get_asset_thumbnail_map([1, 2]))
+    assert all(thumbnail.state == ThumbnailState.completed for thumbnail in results.values())
+    assert results[2].image_url == "https://tr.rbxcdn.com/2"
+    assert [sorted(ids) for ids, _ in thumbnails.requests] == [[1, 2], [2], [2]]
+    assert [delay for delay in sleeps if delay >= 1] == [1, 2]
+
+
+def test_polling_gives_up_after_max_polls(mock_client, sleeps):
+    thumbnails = _Thumbnails(pending_polls={1: 100})
+    client = mock_client(thumbnails.handler)
+
+    results = asyncio.run(client.thumbnails.get_asset_thumbnail_map([1]))
+    assert results[1].state == ThumbnailState.pending
+    assert len(thumbnails.requests) == 7
+    assert [delay for delay in sleeps if delay >= 1] == [1, 2, 4, 8, 8, 8]
+
+
+def test_pending_thumbnails_are_returned_without_waiting(mock_client, sleeps):
+    thumbnails = _Thumbnails(pending_polls={1: 1})
+    client = mock_client(thumbnails.handler)
+
+    results = asyncio.run(client.thumbnails.get_asset_thumbnails([1]))
+    assert results[0].state == ThumbnailState.pending
+    assert len(thumbnails.requests) == 1
@@ -0,0 +1,74 @@
+"""
+Tests for the connection settings used to build the client's HTTP session.
+"""
+
+import asyncio
+
+import pytest
+from httpx import MockTransport, Response
+
+import roblox.utilities.transport
+from roblox import Client
+from roblox.utilities.transport import TransportSettings
+
+
+class _MockTransportSettings(TransportSettings):
+    def __init__(self, handler, **kwargs):
+        super().__init__(**kwargs)
+        self.handler = handler
+
+    def get_session_options(self, proxy=None) -> dict:
+        options = super().get_session_options(proxy=proxy)
+        options["transport"] = MockTransport(self.handler)
+        return options
+
+
+def test_session_options_apply_the_settings():
+    settings = TransportSettings(
+        max_connections=3, max_keepalive_connections=2, keepalive_expiry=7, read_timeout=15, retries=2
+    )
+    options = settings.get_session_options()
+    pool = options["transport"]._pool
+    assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (3, 2, 7)
+    assert pool._retries == 2
+    assert options["timeout"].read == 15
+    assert options["timeout"].connect == 5
+
+
+def test_session_options_accept_a_proxy_url():
+    options = TransportSettings(max_connections=3).get_session_options(proxy="http://localhost:8080")
+    pool = options["transport"]._pool
+    assert pool._proxy_url.host == b"localhost"
+    assert pool._max_connections == 3
+
+
+def test_high_throughput_only_uses_http2_with_h2(monkeypatch):
+    monkeypatch.setattr(roblox.utilities.transport, "_h2_installed", False)
+    settings = TransportSettings.high_throughput()
+    assert not settings.http2
+    assert settings.max_keepalive_connections == settings.max_connections
+    assert settings.pool_timeout is None
+
+    monkeypatch.setattr(roblox.utilities.transport, "_h2_installed", True)
+    assert TransportSettings.high_throughput().http2
+
+
+def test_http2_without_h2_fails_up_front(monkeypatch):
+    monkeypatch.setattr(roblox.utilities.transport, "_h2_installed", False)
+    with pytest.raises(ImportError):
+        TransportSettings(http2=True).get_session_options()
+    with pytest.raises(ImportError):
+        Client(transport=TransportSettings(http2=True))
+
+
+def test_client_sends_requests_with_the_settings():
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"])
+        return Response(200, json={})
+
+    client = Client(transport=_MockTransportSettings(handler, read_timeout=30, pool_timeout=None))
+    asyncio.run(client.requests.get("https://users.roblox.com/v1/users/1"))
+    assert timeouts[0]["read"] == 30
+    assert timeouts[0]["pool"] is None
@@ -0,0 +1,73 @@
+"""
+Tests for expanding partial users into full users.
+"""
+
+import asyncio
+import json
+
+import pytest
+from httpx import Response
+
+from roblox.utilities.exceptions import UserNotFound
+
+
+def _get_user_data(user_id: int) -> dict:
+    return {
+        "id": user_id, "name": f"user{user_id}", "displayName": "a", "description": "",
+        "created": "2021-01-01T00:00:00Z", "isBanned": False, "externalAppDisplayName": None,
+        "hasVerifiedBadge": False
+    }
+
+
+def _users_handler(state, missing=()):
+    async def handler(request):
+        if request.method == "POST":
+            body = json.loads(request.content)
+            if "usernames" in body:
+                return Response(200, json={"data": [
+                    {"requestedUsername": name, "id": index + 1, "name": name, "displayName": name,
+                     "hasVerifiedBadge": False}
+                    for index, name in enumerate(body["usernames"])
+                ]})
+            return Response(200, json={"data": [_get_user_data(user_id) for user_id in body["userIds"]]})
+
+        state["running"] += 1
+        state["most"] = max(state["most"], state["running"])
+        await asyncio.sleep(0.005)
+        state["running"] -= 1
+        user_id = int(request.url.path.rsplit("/", 1)[1])
+        if user_id in missing:
+            return Response(404, json={"errors": [{"code": 3, "message": "The user id is invalid."}]})
+        return Response(200, json=_get_user_data(user_id))
+
+    return handler
+
+
+def test_expand_is_bounded(mock_client):
+    state = {"running": 0, "most": 0}
+    client = mock_client(_users_handler(state))
+
+    users = asyncio.run(client.get_users(list(range(1, 31)), expand=True, max_concurrency=4))
+    assert [user.id for user in users] == list(range(1, 31))
+    assert 1 < state["most"] <= 4
+
+
+def test_expand_by_usernames(mock_client):
+    state = {"running": 0, "most": 0}
+    client = mock_client(_users_handler(state))
+
+    users = asyncio.run(client.get_users_by_usernames(["a", "b", "c"], expand=True, max_concurrency=2))
+    assert [user.id for user in users] == [1, 2, 3]
+    assert state["most"] <= 2
+
+
+def test_expand_failures(mock_client):
+    state = {"running": 0, "most": 0}
+    client = mock_client(_users_handler(state, missing={2}))
+
+    with pytest.raises(UserNotFound):
+        asyncio.run(client.get_users([1, 2, 3], expand=True))
+
+    users = asyncio.run(client.get_users([1, 2, 3], expand=True, return_exceptions=True))
+    assert users[0].id == 1 and users[2].id == 3
+    assert isinstance(users[1], UserNotFound)
@@ -0,0 +1,157 @@
+"""
+Tests for fetching, sharing and refreshing X-CSRF tokens.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient, MockTransport, Response
+
+import roblox.utilities.xcsrf
+from roblox.utilities.instrumentation import Instrumentation
+from roblox.utilities.ratelimit import RateLimiter
+from roblox.utilities.xcsrf import XCSRFTokenManager
+
+_url = "https://groups.roblox.com/v1/groups/1/wall/posts"
+_token_url = "https://auth.roblox.com/v2/logout"
+
+
+class _Server:
+    # hands out tokens from the logout endpoint and rejects requests that change data without the current one
+    def __init__(self, fetch_responses=()):
+        self.token = "first"
+        self.fetches = 0
+        self.sent_tokens = []
+        self.fetch_responses = list(fetch_responses)
+
+    async def handler(self, request):
+        if str(request.url) == _token_url:
+            assert "X-CSRF-Token" not in request.headers
+            self.fetches += 1
+            await asyncio.sleep(0.005)
+            if self.fetch_responses:
+                return self.fetch_responses.pop(0)
+            return Response(403, headers={"X-CSRF-Token": self.token})
+
+        self.sent_tokens.append(request.headers.get("X-CSRF-Token"))
+        if request.headers.get("X-CSRF-Token") != self.token:
+            return Response(403, headers={"X-CSRF-Token": self.token}, json={"errors": [{"code": 0, "message": ""}]})
+        return Response(200, json={})
+
+
+def test_concurrent_requests_share_one_fetch(mock_client):
+    server = _Server()
+    client = mock_client(server.handler)
+    client.set_token("cookie")
+
+    async def main():
+        await asyncio.gather(*(client.requests.post(_url) for _ in range(10)))
+
+    asyncio.run(main())
+    assert server.fetches == 1
+    assert server.sent_tokens == ["first"] * 10
+
+
+def test_no_token_is_fetched_without_a_cookie(mock_client):
+    server = _Server()
+    client = mock_client(server.handler)
+    server.token = None
+
+    asyncio.run(client.requests.post(_url))
+    assert server.fetches == 0
+    assert server.sent_tokens == [None]
+
+
+def test_rotated_tokens_are_retried_once(mock_client):
+    server = _Server()
+    instrumentation = Instrumentation()
+    client = mock_client(server.handler, instrumentation=instrumentation)
+    client.set_token("cookie")
+
+    async def main():
+        await client.requests.post(_url)
+        server.token = "second"
+        await client.requests.post(_url)
+
+    asyncio.run(main())
+    assert server.sent_tokens == ["first", "first", "second"]
+    assert client.requests.xcsrf_tokens.token == "second"
+    assert instrumentation.counters["xcsrf_refreshes"] == 1
+    assert server.fetches == 1
+
+
+def test_switching_accounts_fetches_a_new_token(mock_client):
+    server = _Server()
+    client = mock_client(server.handler)
+
+    async def main():
+        client.set_token("first account")
+        await client.requests.post(_url)
+        client.set_token("second account")
+        assert client.requests.xcsrf_tokens.token is None
+        server.token = "second"
+        await client.requests.post(_url)
+
+    asyncio.run(main())
+    assert server.fetches == 2
+    assert server.sent_tokens == ["first", "second"]
+
+
+def test_fetches_are_rate_limited_and_counted(mock_client):
+    server = _Server(fetch_responses=[Response(429, headers={"Retry-After": "0"})])
+    instrumentation = Instrumentation()
+    client = mock_client(
+        server.handler, rate_limiter=RateLimiter(max_retries=2), instrumentation=instrumentation
+    )
+    client.set_token("cookie")
+
+    asyncio.run(client.requests.post(_url))
+    # the rate limited fetch was retried like any other request
+    assert server.fetches == 2
+    assert server.sent_tokens == ["first"]
+    assert instrumentation.counters["xcsrf_fetches"] == 1
+    assert instrumentation.histograms[("POST", "auth.roblox.com/v2/logout")].count == 2
+
+
+def test_invalidating_discards_a_running_fetch():
+    manager = XCSRFTokenManager(url=_token_url)
+
+    async def send(request):
+        manager.invalidate()
+        return Response(403, headers={"X-CSRF-Token": "old account"})
+
+    async def main():
+        async with AsyncClient(transport=MockTransport(lambda request: Response(200))) as session:
+            return await manager.get_token(session, send=send)
+
+    assert asyncio.run(main()) is None
+    assert manager.fetches == 1
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(roblox.utilities.xcsrf, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_old_tokens_are_refreshed_in_the_background(clock):
+    manager = XCSRFTokenManager(url=_token_url, max_age=300, refresh_margin=60)
+    tokens = iter(["first", "second"])
+
+    async def send(request):
+        return Response(403, headers={"X-CSRF-Token": next(tokens)})
+
+    async def main():
+        async with AsyncClient(transport=MockTransport(lambda request: Response(200))) as session:
+            first = await manager.get_token(session, send=send)
+            clock.now += 250
+            # still valid, so it's returned while the refresh runs
+            before_refresh = await manager.get_token(session, send=send)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return first, before_refresh, await manager.get_token(session, send=send)
+
+    assert asyncio.run(main()) == ("first", "first", "second")
+    assert manager.fetches == 2